@@ -1,7 +1,11 @@
 """
 .. versionadded:: v2.15.0
 	Module ``mcdreforged`` now contains everything in ``mcdreforged.api.all``. All MCDR API components can be imported from here
+
+.. versionchanged:: v2.16.0
+	The API components are imported lazily on first access, so importing a submodule, e.g. the CLI, stays cheap
 """
+from typing import TYPE_CHECKING
 
 
 def __python_version_check():
@@ -14,7 +18,44 @@ def __python_version_check():
 
 __python_version_check()
 
-from mcdreforged.api.all import *
-
 # noinspection PyPep8Naming
 from mcdreforged.constants.core_constant import VERSION_PYPI as __version__
+
+if TYPE_CHECKING:
+	from mcdreforged.api.all import *
+
+
+def __load_api_names() -> list:
+	from mcdreforged.api import all as api_all
+	# same as what "from mcdreforged.api.all import *" imports
+	names = [name for name in vars(api_all) if not name.startswith('_')]
+	g = globals()
+	for name in names:
+		g.setdefault(name, getattr(api_all, name))
+	g['__all__'] = names
+	return names
+
+
+def __getattr__(name: str):
+	import importlib.util
+
+	if name.startswith('__') and name != '__all__':
+		raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+	# "from mcdreforged import xxx" probes the attribute first before importing submodule "xxx"
+	# Don't import the whole API just for that
+	submodule_name = '{}.{}'.format(__name__, name)
+	if importlib.util.find_spec(submodule_name) is not None:
+		return importlib.import_module(submodule_name)
+
+	names = __load_api_names()
+	if name == '__all__':
+		return names
+	try:
+		return globals()[name]
+	except KeyError:
+		raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name)) from None
+
+
+def __dir__():
+	return sorted(set(globals().keys()) | set(__load_api_names()))
@@ -12,6 +12,7 @@ from mcdreforged.logging.stream_handler import SyncStdoutStreamHandler
 from mcdreforged.permission.permission_level import PermissionLevel
 from mcdreforged.plugin.meta.metadata import Metadata
 from mcdreforged.plugin.meta.version import Version, VersionRequirement
+from mcdreforged.plugin.si.plugin_data_store import PluginDataStore, DataStoreTransaction
 from mcdreforged.plugin.si.plugin_server_interface import PluginServerInterface
 from mcdreforged.plugin.si.server_interface import ServerInterface
 from mcdreforged.plugin.type.common import PluginType
@@ -36,6 +37,7 @@ __all__ = [
 
 	# Plugin things
 	'Metadata', 'Version', 'VersionRequirement', 'PluginType',
+	'PluginDataStore', 'DataStoreTransaction',
 
 	# Permission
 	'PermissionLevel',
@@ -3,18 +3,14 @@ from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
 from typing import cast
 
 from mcdreforged.cli import cmd_pim
-from mcdreforged.cli.cmd_gendefault import generate_default_stuffs
-from mcdreforged.cli.cmd_init import initialize_environment
-from mcdreforged.cli.cmd_pack import make_packed_plugin, PackArgs
-from mcdreforged.cli.cmd_reformat_config import reformat_config
-from mcdreforged.cli.cmd_run import run_mcdr
-from mcdreforged.cli.cmd_version import show_version
 from mcdreforged.constants import core_constant
 from mcdreforged.mcdr_server_args import MCDReforgedServerArgs
 
 
 def cli_main():
+	# the command implementations are imported on demand, so every command only imports what it needs
 	if len(sys.argv) == 1:
+		from mcdreforged.cli.cmd_run import run_mcdr
 		run_mcdr(MCDReforgedServerArgs())
 		return
 
@@ -59,28 +55,34 @@ def cli_main():
 	args = parser.parse_args()
 
 	if args.version:
+		from mcdreforged.cli.cmd_version import show_version
 		show_version(quiet=args.quiet)
 		return
 
 	elif args.command == 'gendefault':
+		from mcdreforged.cli.cmd_gendefault import generate_default_stuffs
 		generate_default_stuffs(
 			config_file_path=args.config,
 			permission_file_path=args.permission,
 			quiet=args.quiet,
 		)
 	elif args.command == 'init':
+		from mcdreforged.cli.cmd_init import initialize_environment
 		initialize_environment(
 			config_file_path=args.config,
 			permission_file_path=args.permission,
 			quiet=args.quiet,
 		)
 	elif args.command == 'pack':
+		from mcdreforged.cli.cmd_pack import make_packed_plugin, PackArgs
 		make_packed_plugin(cast(PackArgs, args), quiet=args.quiet)
 	elif args.command == 'pim':
 		cmd_pim.entry(parser_pim, args)
 	elif args.command == 'reformat-config':
+		from mcdreforged.cli.cmd_reformat_config import reformat_config
 		reformat_config(args.input, args.output)
 	elif args.command == 'start':
+		from mcdreforged.cli.cmd_run import run_mcdr
 		run_mcdr(MCDReforgedServerArgs(
 			auto_init=args.auto_init,
 			no_server_start=args.no_server_start,
@@ -4,17 +4,17 @@ import subprocess
 import sys
 import tempfile
 from argparse import ArgumentParser, Namespace, ArgumentDefaultsHelpFormatter
-from typing import Callable
+from typing import Callable, TYPE_CHECKING
 from typing import Optional, List
 from zipfile import ZipFile
 
 from mcdreforged.constants import plugin_constant
-from mcdreforged.plugin.installer.catalogue_access import PluginCatalogueAccess
-from mcdreforged.plugin.installer.meta_holder import CatalogueMetaRegistryHolder
-from mcdreforged.plugin.installer.types import MetaRegistry
 from mcdreforged.utils import function_utils
 from mcdreforged.utils.replier import NoopReplier, StdoutReplier, Replier
 
+if TYPE_CHECKING:
+	from mcdreforged.plugin.installer.types import MetaRegistry
+
 
 def create(parser_factory: Callable[..., ArgumentParser]) -> ArgumentParser:
 	parser = parser_factory(name='pim', help='A simple version of Plugin Installer for MCDReforged', formatter_class=ArgumentDefaultsHelpFormatter)
@@ -54,18 +54,22 @@ def entry(parser: ArgumentParser, args: Namespace):
 		sys.exit(1)
 
 
-def __fetch_meta(replier: Replier) -> MetaRegistry:
+def __fetch_meta(replier: Replier) -> 'MetaRegistry':
+	# the installer modules are heavy, import them only when needed
+	from mcdreforged.plugin.installer.meta_holder import CatalogueMetaRegistryHolder
 	meta_holder = CatalogueMetaRegistryHolder()
 	replier.reply('Fetching catalogue meta')
 	return meta_holder.fetch_and_get_registry()
 
 
 def cmd_browse(replier: Replier, keyword: str):
+	from mcdreforged.plugin.installer.catalogue_access import PluginCatalogueAccess
 	meta = __fetch_meta(replier)
 	PluginCatalogueAccess.list_plugin(meta=meta, replier=replier, keyword=keyword)
 
 
 def cmd_download(replier: Replier, plugin_reqs: List[str], output_dir: str):
+	from mcdreforged.plugin.installer.catalogue_access import PluginCatalogueAccess
 	meta = __fetch_meta(replier)
 	PluginCatalogueAccess.download_plugin(meta=meta, replier=replier, plugin_ids=plugin_reqs, target_dir=output_dir)
 
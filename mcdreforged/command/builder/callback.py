@@ -4,12 +4,11 @@ import inspect
 import sys
 from abc import ABC, abstractmethod
 from types import MethodType
-from typing import Callable, TypeVar, Generic, Coroutine, Iterable, TYPE_CHECKING
+from typing import Callable, TypeVar, Generic, Coroutine, Iterable, NamedTuple, Optional, Union, cast
 
 from typing_extensions import override
 
-if TYPE_CHECKING:
-	from mcdreforged.command.builder.common import CommandContext
+from mcdreforged.command.builder.common import CommandContext
 
 
 class CallbackError(Exception):
@@ -49,11 +48,59 @@ class DirectCallbackInvoker(CallbackInvoker):
 		raise RuntimeError(f'Async callback is not supported, func: {func}')
 
 
+class CallbackSpec(NamedTuple):
+	args_len: int  # amount of the positional args accepted by the callback
+	is_coroutine: bool
+
+
+class CallbackWrapper(Generic[_T]):
+	"""
+	A callback, with its spec inspected on the first use and then stored for reuse
+
+	The spec lives as long as the wrapper, so the holder of the callback, e.g. a command node, should keep the wrapper
+	"""
+	def __init__(self, callback: Callable[..., _T]):
+		self.callback = callback
+		self.__spec: Optional[CallbackSpec] = None
+
+	@classmethod
+	def of(cls, callback: Union[Callable[..., _T], 'CallbackWrapper[_T]']) -> 'CallbackWrapper[_T]':
+		if isinstance(callback, CallbackWrapper):
+			return callback
+		return CallbackWrapper(callback)
+
+	@property
+	def spec(self) -> CallbackSpec:
+		if self.__spec is None:
+			self.__spec = self.__inspect_spec(self.callback)
+		return self.__spec
+
+	@staticmethod
+	def __inspect_spec(callback: Callable) -> CallbackSpec:
+		spec_args_len = len(inspect.getfullargspec(callback).args)
+
+		real_func = callback
+		for i in range(100):  # found the real function for the MethodType check
+			if isinstance(real_func, functools.partial):
+				real_func = real_func.func
+			else:
+				break
+		if isinstance(real_func, MethodType):  # class method, remove the 1st param
+			spec_args_len -= 1
+		return CallbackSpec(spec_args_len, inspect.iscoroutinefunction(callback))
+
+
 class ScheduledCallback(Generic[_T]):
-	def __init__(self, callback: Callable[..., _T], args: tuple, error_factory: CallbackError.Builder):
-		self.__callback = callback
+	def __init__(self, callback: Union[Callable[..., _T], CallbackWrapper[_T]], args: tuple, error_factory: CallbackError.Builder, *, copy_context_args: bool = False):
+		"""
+		:param callback: The callback. Pass a :class:`CallbackWrapper` to reuse its inspected spec
+		:param copy_context_args: If set to True, the :class:`~mcdreforged.command.builder.common.CommandContext` args
+			will be copied right before being passed to the callback. Args not accepted by the callback will not be copied
+		"""
+		self.__callback = CallbackWrapper.of(callback)
 		self.__args = args
 		self.__error_factory = error_factory
+		self.__copy_context_args = copy_context_args
 
 	@contextlib.contextmanager
 	def wrap_callback_error(self):
@@ -63,21 +110,14 @@ class ScheduledCallback(Generic[_T]):
 			raise self.__error_factory(e)
 
 	def invoke(self, invoker: CallbackInvoker):
-		spec_args = inspect.getfullargspec(self.__callback).args
-		spec_args_len = len(spec_args)
-
-		real_func = self.__callback
-		for i in range(100):  # found the real function for the MethodType check
-			if isinstance(real_func, functools.partial):
-				real_func = real_func.func
-			else:
-				break
-		if isinstance(real_func, MethodType):  # class method, remove the 1st param
-			spec_args_len -= 1
-		call_args = self.__args[:spec_args_len]
+		spec = self.__callback.spec
+		call_args = self.__args[:spec.args_len]
+		if self.__copy_context_args:
+			call_args = tuple(arg.copy() if isinstance(arg, CommandContext) else arg for arg in call_args)
 
+		callback = self.__callback.callback
 		with self.wrap_callback_error():
-			if inspect.iscoroutinefunction(self.__callback):
-				return invoker.invoke_async(self.__callback, call_args)
+			if spec.is_coroutine:
+				return invoker.invoke_async(cast(Callable[..., Coroutine], callback), call_args)
 			else:
-				return invoker.invoke_sync(self.__callback, call_args)
+				return invoker.invoke_sync(callback, call_args)
@@ -1,13 +1,15 @@
+import collections
 import dataclasses
+import threading
+import time
 import typing
 from contextlib import contextmanager
-from typing import List, Iterable, Dict, Any, Optional, NamedTuple
+from typing import List, Iterable, Dict, Any, Optional, NamedTuple, Callable, Hashable, Tuple
 
 from typing_extensions import override
 
-from mcdreforged.command.builder.callback import ScheduledCallback
-
 if typing.TYPE_CHECKING:
+	from mcdreforged.command.builder.callback import ScheduledCallback
 	from mcdreforged.command.command_source import CommandSource
 	from mcdreforged.command.builder.nodes.basic import AbstractNode
 
@@ -20,7 +22,7 @@ class ParseResult(NamedTuple):
 @dataclasses.dataclass(frozen=True)
 class CommandExecution:
 	context: 'CommandContext'
-	scheduled_callback: ScheduledCallback
+	scheduled_callback: 'ScheduledCallback'
 
 
 class CommandExecutions(List[CommandExecution]):
@@ -71,6 +73,41 @@ class CommandSuggestions(List[CommandSuggestion]):
 			self.complete_hint = self.complete_hint or __iterable.complete_hint
 
 
+class CommandSuggestionCache:
+	"""
+	**Not public API**
+
+	A memo of the per-node suggestion results, which can be shared between suggestion generations of different inputs,
+	e.g. between keystrokes in the console. Cached entries expire after *ttl* seconds
+
+	:meta private:
+	"""
+	def __init__(self, ttl: float, max_size: int = 1024):
+		self.__ttl = ttl
+		self.__max_size = max_size
+		self.__lock = threading.Lock()
+		self.__entries: 'collections.OrderedDict[Hashable, Tuple[float, Tuple[str, ...]]]' = collections.OrderedDict()
+
+	def get_or_compute(self, key: Hashable, func: Callable[[], Iterable[str]]) -> Tuple[str, ...]:
+		now = time.monotonic()
+		with self.__lock:
+			entry = self.__entries.get(key)
+			if entry is not None and now - entry[0] <= self.__ttl:
+				return entry[1]
+
+		value = tuple(func())
+		with self.__lock:
+			self.__entries[key] = (now, value)
+			self.__entries.move_to_end(key)
+			while len(self.__entries) > self.__max_size:
+				self.__entries.popitem(last=False)
+		return value
+
+	def clear(self):
+		with self.__lock:
+			self.__entries.clear()
+
+
 class CommandContext(Dict[str, Any]):
 	"""
 	A :class:`CommandContext` stores the information of the command parsing process. It's a class inherited from dict
@@ -88,6 +125,8 @@ class CommandContext(Dict[str, Any]):
 		self.__command = command
 		self.__cursor = 0
 		self.__node_path: List[AbstractNode] = []
+		self.__suggestion_cache: Optional[CommandSuggestionCache] = None
+		self.__requirement_memo: Dict[Hashable, bool] = {}
 
 	@override
 	def copy(self) -> 'CommandContext':
@@ -95,6 +134,8 @@ class CommandContext(Dict[str, Any]):
 		copied.update(self)
 		copied.__cursor = self.__cursor
 		copied.__node_path = self.__node_path.copy()
+		copied.__suggestion_cache = self.__suggestion_cache
+		copied.__requirement_memo = self.__requirement_memo  # shared within the whole command parsing
 		return copied
 
 	@property
@@ -143,16 +184,44 @@ class CommandContext(Dict[str, Any]):
 	#      Not public APIs
 	# -------------------------
 
+	@property
+	def suggestion_cache(self) -> Optional[CommandSuggestionCache]:
+		"""
+		**Not public API, only used in command suggestion**
+
+		:meta private:
+		"""
+		return self.__suggestion_cache
+
+	@suggestion_cache.setter
+	def suggestion_cache(self, cache: Optional[CommandSuggestionCache]):
+		self.__suggestion_cache = cache
+
+	def memoize_requirement(self, key: Hashable, func: Callable[[], bool]) -> bool:
+		"""
+		**Not public API, only used in command parsing**
+
+		Return the memoized result of the given requirement key, or evaluate it via *func* if it's not memoized yet
+
+		:meta private:
+		"""
+		if key in self.__requirement_memo:
+			return self.__requirement_memo[key]
+		result = self.__requirement_memo[key] = func()
+		return result
+
 	@contextmanager
-	def visit_node(self, current_node: 'AbstractNode', result: 'ParseResult', new_cursor: int):
+	def visit_node(self, current_node: 'AbstractNode', result: 'ParseResult', new_cursor: int, *, modifies_data: bool = True):
 		"""
 		**Not public API, only used in command parsing**
 		Change the current cursor position, and store the parsing value
 
+		:param modifies_data: If the node might modify the context data on visited.
+			If not, the data snapshot for the restoration will be skipped
 		:meta private:
 		"""
 		prev_cursor = self.__cursor
-		prev_data = dict(self)
+		prev_data = dict(self) if modifies_data else None
 
 		self.__cursor = new_cursor
 		try:
@@ -161,8 +230,9 @@ class CommandContext(Dict[str, Any]):
 			yield
 		finally:
 			self.__cursor = prev_cursor
-			self.clear()
-			self.update(prev_data)
+			if prev_data is not None:
+				self.clear()
+				self.update(prev_data)
 
 	@contextmanager
 	def enter_child(self, node: 'AbstractNode'):
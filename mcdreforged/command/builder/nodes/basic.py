@@ -1,13 +1,15 @@
 import collections
 import dataclasses
+import types
 from abc import ABC, abstractmethod
-from typing import List, Callable, Iterable, Set, Dict, Type, Any, Union, Optional, TypedDict, TypeVar, NoReturn
+from typing import List, Callable, Iterable, Set, Dict, Type, Any, Union, Optional, TypedDict, TypeVar, NoReturn, Mapping, Tuple, Hashable
 
 from typing_extensions import Self, override, NotRequired
 
 from mcdreforged.command.builder import command_builder_utils as utils
-from mcdreforged.command.builder.callback import CallbackError, ScheduledCallback, DirectCallbackInvoker
-from mcdreforged.command.builder.common import ParseResult, CommandContext, CommandSuggestions, CommandSuggestion, CommandExecutions, CommandExecution
+from mcdreforged.command.builder.callback import CallbackError, ScheduledCallback, DirectCallbackInvoker, CallbackWrapper
+from mcdreforged.command.builder.common import ParseResult, CommandContext, CommandSuggestions, CommandSuggestion, CommandExecutions, CommandExecution, \
+	CommandSuggestionCache
 from mcdreforged.command.builder.exception import LiteralNotMatch, UnknownCommand, UnknownArgument, CommandSyntaxError, \
 	UnknownRootArgument, RequirementNotMet, IllegalNodeOperation, \
 	CommandError
@@ -53,19 +55,31 @@ PRECONDITION_CALLBACK = __SOURCE_CONTEXT_CALLBACK_BOOL
 
 @dataclasses.dataclass(frozen=True)
 class _ErrorHandler:
-	callback: ERROR_HANDLER_CALLBACK
+	callback: CallbackWrapper[Any]
 	handled: bool
 
 
 @dataclasses.dataclass(frozen=True)
 class _Requirement:
-	requirement: REQUIRES_CALLBACK
-	failure_message_getter: Optional[FAIL_MSG_CALLBACK]
+	requirement: CallbackWrapper[bool]
+	failure_message_getter: Optional[CallbackWrapper[MessageText]]
+	pure: bool
 
 
 _ERROR_HANDLER_TYPE = Dict[Type[CommandError], _ErrorHandler]
 
 
+@dataclasses.dataclass(frozen=True)
+class _DispatchTable:
+	"""
+	An immutable snapshot of the children of a node, used for dispatching the remaining command to the children
+	"""
+	literal_children: Mapping[str, Tuple['Literal', ...]]  # literal text -> related Literal nodes
+	literal_children_flatten: Tuple['Literal', ...]  # all values of literal_children, chained
+	argument_children: Tuple['AbstractNode', ...]
+	has_children: bool
+
+
 class AbstractNode(ABC):
 	"""
 	:class:`AbstractNode` is base class of all command nodes. It's also an abstract class.
@@ -75,13 +89,15 @@ class AbstractNode(ABC):
 	def __init__(self):
 		self._children_literal: Dict[str, List[Literal]] = collections.defaultdict(list)  # mapping from literal text to related Literal nodes
 		self._children: List[AbstractNode] = []
-		self._callback: Optional[RUNS_CALLBACK] = None
+		# callbacks are stored in CallbackWrapper, so their specs are only inspected once
+		self._callback: Optional[CallbackWrapper[Any]] = None
 		self._error_handlers: _ERROR_HANDLER_TYPE = {}
 		self._child_error_handlers: _ERROR_HANDLER_TYPE = {}
-		self._preconditions: List[PRECONDITION_CALLBACK] = []
+		self._preconditions: List[CallbackWrapper[bool]] = []
 		self._requirements: List[_Requirement] = []
 		self._redirect_node: Optional[AbstractNode] = None
-		self._suggestion_getter: SUGGESTS_CALLBACK = lambda: []
+		self._suggestion_getter: CallbackWrapper[Iterable[str]] = CallbackWrapper(lambda: [])
+		self.__dispatch_table: Optional[_DispatchTable] = None
 
 	# --------------
 	#   Interfaces
@@ -116,6 +132,7 @@ class AbstractNode(ABC):
 				self._children_literal[literal].append(node)
 		else:
 			self._children.append(node)
+		self.__dispatch_table = None
 		return self
 
 	def runs(self, func: RUNS_CALLBACK) -> Self:
@@ -150,10 +167,10 @@ class AbstractNode(ABC):
 			Argument list: :class:`~mcdreforged.command.command_source.CommandSource`, :class:`dict` (:class:`~mcdreforged.command.builder.common.CommandContext`)
 		"""
 		class_utils.check_type(func, Callable)  # type: ignore  # see also: python/mypy#14928
-		self._callback = func
+		self._callback = CallbackWrapper(func)
 		return self
 
-	def requires(self, requirement: REQUIRES_CALLBACK, failure_message_getter: Optional[FAIL_MSG_CALLBACK] = None) -> Self:
+	def requires(self, requirement: REQUIRES_CALLBACK, failure_message_getter: Optional[FAIL_MSG_CALLBACK] = None, *, pure: bool = False) -> Self:
 		"""
 		Set the requirement tester callback of the node. When entering this node, MCDR will invoke the requirement tester
 		to see if the current command source and context meet the specified condition
@@ -172,16 +189,26 @@ class AbstractNode(ABC):
 			Argument list: :class:`~mcdreforged.command.command_source.CommandSource`, :class:`dict` (:class:`~mcdreforged.command.builder.common.CommandContext`)
 		:param failure_message_getter: An optional callable that accepts up to 2 arguments and returns a str or a :class:`~mcdreforged.minecraft.rtext.text.RTextBase`.
 			Argument list: :class:`~mcdreforged.command.command_source.CommandSource`, :class:`dict` (:class:`~mcdreforged.command.builder.common.CommandContext`)
+		:keyword pure: If the requirement is a pure function, i.e. its result only depends on its arguments and it has no side effects.
+			The result of a pure requirement is memoized during one command parsing, so requirements like a permission check
+			that appears on multiple levels of the command tree will only be evaluated once
+
+			.. versionadded:: v2.16.0
 
 		Example usages::
 
 			node1.requires(lambda src: src.has_permission(3))  # Permission check, error if the permission is not enough
 			node2.requires(lambda src, ctx: ctx['page_count'] <= get_max_page())  # Dynamic range check
 			node3.requires(lambda src, ctx: is_legal(ctx['target']), lambda src, ctx: 'target {} is illegal'.format(ctx['target']))  # Customized failure message
+			node4.requires(Requirements.has_permission(3), pure=True)  # Memoized permission check
 		"""
 		class_utils.check_type(requirement, Callable)  # type: ignore  # see also: python/mypy#14928
 		class_utils.check_type(failure_message_getter, (Callable, None))  # type: ignore  # see also: python/mypy#14928
-		self._requirements.append(_Requirement(requirement, failure_message_getter))
+		self._requirements.append(_Requirement(
+			CallbackWrapper(requirement),
+			CallbackWrapper(failure_message_getter) if failure_message_getter is not None else None,
+			pure,
+		))
 		return self
 
 	def precondition(self, precondition: PRECONDITION_CALLBACK) -> Self:
@@ -204,7 +231,7 @@ class AbstractNode(ABC):
 			node2.precondition(lambda src, ctx: 'foo' in ctx)  # Avoid re-assigning the "foo" argument
 		"""
 		class_utils.check_type(precondition, Callable)  # type: ignore  # see also: python/mypy#14928
-		self._preconditions.append(precondition)
+		self._preconditions.append(CallbackWrapper(precondition))
 		return self
 
 	def redirects(self, redirect_node: 'AbstractNode') -> Self:
@@ -260,7 +287,7 @@ class AbstractNode(ABC):
 			Argument list: :class:`~mcdreforged.command.command_source.CommandSource`, :class:`dict` (:class:`~mcdreforged.command.builder.common.CommandContext`)
 		"""
 		class_utils.check_type(suggestion, Callable)  # type: ignore  # see also: python/mypy#14928
-		self._suggestion_getter = suggestion
+		self._suggestion_getter = CallbackWrapper(suggestion)
 		return self
 
 	def on_error(self, error_type: Type[CommandError], handler: ERROR_HANDLER_CALLBACK, *, handled: bool = False) -> Self:
@@ -278,7 +305,7 @@ class AbstractNode(ABC):
 			raise TypeError('error_type parameter should be a class inherited from CommandError, but class {} found'.format(error_type))
 		class_utils.check_type(error_type, type)
 		class_utils.check_type(handler, Callable)  # type: ignore  # see also: python/mypy#14928
-		self._error_handlers[error_type] = _ErrorHandler(handler, handled)
+		self._error_handlers[error_type] = _ErrorHandler(CallbackWrapper(handler), handled)
 		return self
 
 	def on_child_error(self, error_type: Type[CommandError], handler: ERROR_HANDLER_CALLBACK, *, handled: bool = False) -> Self:
@@ -289,7 +316,7 @@ class AbstractNode(ABC):
 			raise TypeError('error_type parameter should be a class inherited from CommandError, but class {} found'.format(error_type))
 		class_utils.check_type(error_type, type)
 		class_utils.check_type(handler, Callable)  # type: ignore  # see also: python/mypy#14928
-		self._child_error_handlers[error_type] = _ErrorHandler(handler, handled)
+		self._child_error_handlers[error_type] = _ErrorHandler(CallbackWrapper(handler), handled)
 		return self
 
 	def print_tree(self, line_writer: tree_printer.LineWriter = print):
@@ -322,6 +349,40 @@ class AbstractNode(ABC):
 		children.extend(self._children)
 		return collection_utils.unique_list(children)
 
+	def _get_dispatch_table(self) -> _DispatchTable:
+		"""
+		Get the dispatch table of the children of this node. The table is built on demand,
+		and gets rebuilt after the children of this node change
+		"""
+		if (table := self.__dispatch_table) is None:
+			literal_children = {literal: tuple(nodes) for literal, nodes in self._children_literal.items()}
+			table = self.__dispatch_table = _DispatchTable(
+				literal_children=types.MappingProxyType(literal_children),
+				literal_children_flatten=tuple(node for nodes in literal_children.values() for node in nodes),
+				argument_children=tuple(self._children),
+				has_children=self.has_children(),
+			)
+		return table
+
+	def _compile(self):
+		"""
+		Build the dispatch tables of all nodes in the command tree starting from this node, including the redirected nodes
+
+		:meta private:
+		"""
+		visited: Set[int] = set()
+		queue: collections.deque[AbstractNode] = collections.deque([self])
+		while len(queue) > 0:
+			node = queue.popleft()
+			if id(node) in visited:
+				continue
+			visited.add(id(node))
+			table = node._get_dispatch_table()
+			queue.extend(table.literal_children_flatten)
+			queue.extend(table.argument_children)
+			if node._redirect_node is not None:
+				queue.append(node._redirect_node)
+
 	def _on_visited(self, context: CommandContext, parsed_result: ParseResult):
 		"""
 		Invoked when this node is visited, right after the node successfully parses a command segment
@@ -343,14 +404,22 @@ class AbstractNode(ABC):
 		"""
 		raise NotImplementedError()
 
+	def _parse_or_error(self, text: str) -> Union[ParseResult, CommandSyntaxError]:
+		"""
+		Same as :meth:`parse`, but the :class:`CommandSyntaxError` is returned instead of being raised
+
+		Nodes can override this to avoid the exception overhead when the text doesn't match
+		"""
+		try:
+			return self.parse(text)
+		except CommandSyntaxError as error:
+			return error
+
 	@staticmethod
-	def __smart_callback(callback: Callable, args: tuple, callback_error_factory: CallbackError.Builder):
+	def __smart_callback(callback: Union[Callable, CallbackWrapper], args: tuple, callback_error_factory: CallbackError.Builder):
 		# make sure all passed CommandContext are copies
-		adjusted_args = tuple(
-			arg.copy() if isinstance(arg, CommandContext) else arg
-			for arg in args
-		)
-		return ScheduledCallback(callback, adjusted_args, callback_error_factory).invoke(DirectCallbackInvoker())
+		# the copying only happens when the callback does accept the context, e.g. not for `lambda src: src.has_permission(3)`
+		return ScheduledCallback(callback, args, callback_error_factory, copy_context_args=True).invoke(DirectCallbackInvoker())
 
 	def __handle_error(self, error: CommandError, context: CommandContext, error_handlers: _ERROR_HANDLER_TYPE):
 		for error_type, handler in error_handlers.items():
@@ -368,11 +437,31 @@ class AbstractNode(ABC):
 		:return: None: requirement check passed; otherwise, the unsatisfied requirement
 		"""
 		for req in self._requirements:
-			ok = self.__smart_callback(req.requirement, (context.source, context), CallbackError.builder(context, 'requirements check'))
+			def check(requirement: CallbackWrapper[bool] = req.requirement) -> bool:
+				return self.__smart_callback(requirement, (context.source, context), CallbackError.builder(context, 'requirements check'))
+
+			if req.pure and (memo_key := self.__get_requirement_memo_key(req.requirement, context)) is not None:
+				ok = context.memoize_requirement(memo_key, check)
+			else:
+				ok = check()
 			if not ok:
 				return req
 		return None
 
+	@staticmethod
+	def __get_requirement_memo_key(requirement: CallbackWrapper[bool], context: CommandContext) -> Optional[Hashable]:
+		"""
+		:return: The memo key, or None if the requirement cannot be memoized
+		"""
+		try:
+			# the key is the callback itself instead of the wrapper, so nodes with the same requirement callback share the result
+			accepts_context = requirement.spec.args_len >= 2
+			key = (requirement.callback, tuple(context.items()) if accepts_context else None)
+			hash(key)
+		except TypeError:  # unhashable callable or parsed values
+			return None
+		return key
+
 	def __check_preconditions(self, context: CommandContext) -> bool:
 		for precondition in self._preconditions:
 			ok = self.__smart_callback(precondition, (context.source, context), CallbackError.builder(context, 'preconditions check'))
@@ -380,15 +469,30 @@ class AbstractNode(ABC):
 				return False
 		return True
 
+	def __modifies_context_on_visited(self) -> bool:
+		# the default _on_visited is a no-op, and other callbacks always get context copies,
+		# so the context stays untouched while visiting the node
+		return type(self)._on_visited is not AbstractNode._on_visited
+
+	def __get_suggestions_cached(self, context: CommandContext) -> Iterable[str]:
+		if (cache := context.suggestion_cache) is None:
+			return self._get_suggestions(context)
+		key = (self, context.command_read, tuple(context.items()))
+		try:
+			hash(key)
+		except TypeError:  # unhashable parsed values
+			return self._get_suggestions(context)
+		return cache.get_or_compute(key, lambda: self._get_suggestions(context))
+
 	def _get_suggestions(self, context: CommandContext) -> Iterable[str]:
 		return self.__smart_callback(self._suggestion_getter, (context.source, context), CallbackError.builder(context, 'suggestions getting'))
 
 	def _execute_command(self, context: CommandContext) -> CommandExecutions:
 		command = context.command
 		executions = CommandExecutions()
-		try:
-			parse_result = self.parse(context.command_remaining)
-		except CommandSyntaxError as error:
+		parse_result = self._parse_or_error(context.command_remaining)
+		if isinstance(parse_result, CommandSyntaxError):
+			error = parse_result
 			error.set_parsed_command(context.command_read)
 			error.set_failed_command(context.command_read + context.command_remaining[:error.char_read])
 			self.__raise_error(error, context)
@@ -396,7 +500,7 @@ class AbstractNode(ABC):
 			next_remaining = utils.remove_divider_prefix(context.command_remaining[parse_result.char_read:])
 			total_read = len(command) - len(next_remaining)
 
-			with context.visit_node(self, parse_result, total_read):
+			with context.visit_node(self, parse_result, total_read, modifies_data=self.__modifies_context_on_visited()):
 				req = self.__check_requirements(context)
 				if req is not None:  # requirement check failed
 					if req.failure_message_getter is not None:
@@ -422,10 +526,11 @@ class AbstractNode(ABC):
 				else:
 					# Redirecting
 					node = self if self._redirect_node is None else self._redirect_node
+					table = node._get_dispatch_table()
 
 					argument_unknown = False
 					# No child at all
-					if not node.has_children():
+					if not table.has_children:
 						argument_unknown = True
 					else:
 						# Pass the remaining command string to the children
@@ -434,7 +539,7 @@ class AbstractNode(ABC):
 							# Check literal children first
 							literal_error = None
 							child_literal: AbstractNode  # satisfy pycharm's static checker on the __check_preconditions() call
-							for child_literal in node._children_literal.get(next_literal, []):
+							for child_literal in table.literal_children.get(next_literal, ()):
 								if not child_literal.__check_preconditions(context):
 									continue
 								try:
@@ -448,7 +553,7 @@ class AbstractNode(ABC):
 							else:  # All literal children fails
 								if literal_error is not None:
 									raise literal_error
-								for child in node._children:
+								for child in table.argument_children:
 									if not child.__check_preconditions(context):
 										continue
 									try:
@@ -474,7 +579,7 @@ class AbstractNode(ABC):
 		Return a list of tuple (suggested command, suggested argument)
 		"""
 		def self_suggestions():
-			return CommandSuggestions([CommandSuggestion(command_read_at_the_beginning, s) for s in self._get_suggestions(context)])
+			return CommandSuggestions([CommandSuggestion(command_read_at_the_beginning, s) for s in self.__get_suggestions_cached(context)])
 
 		suggestions = CommandSuggestions()
 		# [!!aa bb cc] dd
@@ -482,16 +587,15 @@ class AbstractNode(ABC):
 		command_read_at_the_beginning = context.command_read
 		if len(context.command_remaining) == 0:
 			return self_suggestions()
-		try:
-			result = self.parse(context.command_remaining)
-		except CommandSyntaxError:
+		result = self._parse_or_error(context.command_remaining)
+		if isinstance(result, CommandSyntaxError):
 			return self_suggestions()
 		else:
 			success_read = len(context.command) - len(context.command_remaining) + result.char_read
 			next_remaining = utils.remove_divider_prefix(context.command_remaining[result.char_read:])
 			total_read = len(context.command) - len(next_remaining)
 
-			with context.visit_node(self, result, total_read):
+			with context.visit_node(self, result, total_read, modifies_data=self.__modifies_context_on_visited()):
 				if self.__check_requirements(context) is not None:
 					return CommandSuggestions()
 
@@ -503,8 +607,9 @@ class AbstractNode(ABC):
 						return self_suggestions()
 
 				node = self if self._redirect_node is None else self._redirect_node
+				table = node._get_dispatch_table()
 				# Check literal children first
-				children_literal = node._children_literal.get(utils.get_element(next_remaining), [])
+				children_literal = table.literal_children.get(utils.get_element(next_remaining), ())
 				child_literal: AbstractNode  # satisfy pycharm's static checker on the __check_preconditions() call
 				for child_literal in children_literal:
 					if not child_literal.__check_preconditions(context):
@@ -512,14 +617,13 @@ class AbstractNode(ABC):
 					with context.enter_child(child_literal):
 						suggestions.extend(child_literal._generate_suggestions(context))
 				if len(children_literal) == 0:
-					for literal_list in node._children_literal.values():
-						for child_literal in literal_list:
-							if not child_literal.__check_preconditions(context):
-								continue
-							with context.enter_child(child_literal):
-								suggestions.extend(child_literal._generate_suggestions(context))
+					for child_literal in table.literal_children_flatten:
+						if not child_literal.__check_preconditions(context):
+							continue
+						with context.enter_child(child_literal):
+							suggestions.extend(child_literal._generate_suggestions(context))
 					usages = []
-					for child in node._children:
+					for child in table.argument_children:
 						if not child.__check_preconditions(context):
 							continue
 						with context.enter_child(child):
@@ -549,7 +653,7 @@ class EntryNode(AbstractNode, ABC):
 			# the root literal node fails to parse the first element
 			raise UnknownRootArgument(error.get_parsed_command(), error.get_failed_command()) from error
 
-	def _entry_generate_suggestions(self, source: CommandSource, command: str) -> CommandSuggestions:
+	def _entry_generate_suggestions(self, source: CommandSource, command: str, *, suggestion_cache: Optional[CommandSuggestionCache] = None) -> CommandSuggestions:
 		"""
 		Get a list of command suggestion of given command
 
@@ -557,9 +661,11 @@ class EntryNode(AbstractNode, ABC):
 
 		:param source: the source that executes this command
 		:param command: the command string to execute
+		:param suggestion_cache: An optional cache to memoize the suggestions of each node
 		:meta private:
 		"""
 		context = CommandContext(source, command)
+		context.suggestion_cache = suggestion_cache
 		with context.enter_child(self):
 			return self._generate_suggestions(context)
 
@@ -586,7 +692,7 @@ class Literal(EntryNode):
 			if utils.DIVIDER in literal:
 				raise TypeError('DIVIDER character {!r} cannot be inside a literal'.format(utils.DIVIDER))
 		self.literals: Set[str] = literals
-		self._suggestion_getter = lambda: self.literals
+		self._suggestion_getter = CallbackWrapper(lambda: self.literals)
 
 	@override
 	def _get_usage(self) -> str:
@@ -604,6 +710,16 @@ class Literal(EntryNode):
 		else:
 			raise LiteralNotMatch('Invalid Argument', len(arg))
 
+	@override
+	def _parse_or_error(self, text: str) -> Union[ParseResult, CommandSyntaxError]:
+		if type(self).parse is not Literal.parse:
+			return super()._parse_or_error(text)  # customized parsing logic
+		arg = utils.get_element(text)
+		if arg in self.literals:
+			return ParseResult(None, len(arg))
+		else:
+			return LiteralNotMatch('Invalid Argument', len(arg))
+
 	def __str__(self):
 		return 'Literal {}'.format(repr(tuple(self.literals)[0]) if len(self.literals) == 1 else set(self.literals))
 
@@ -28,16 +28,24 @@ class Requirements:
 	.. versionadded:: v2.6.0
 	"""
 
+	__has_permission_callbacks: Dict[int, Callable[[CommandSource], bool]] = {}
+
 	@classmethod
 	def has_permission(cls, level: int) -> Callable[[CommandSource], bool]:
 		"""
 		Check if the command source has the given permission level
 
+		The same callback object is returned for the same *level*,
+		so the results of :meth:`pure <mcdreforged.command.builder.nodes.basic.AbstractNode.requires>` requirements can be shared
+
 		:param level: The minimum accepted permission level
 		"""
+		if (cached := cls.__has_permission_callbacks.get(level)) is not None:
+			return cached
+
 		def callback(source: CommandSource) -> bool:
 			return source.has_permission(level)
-		return callback
+		return cls.__has_permission_callbacks.setdefault(level, callback)
 
 	@classmethod
 	def is_player(cls) -> Callable[[CommandSource], bool]:
@@ -89,9 +97,12 @@ class NodeDefinition(Generic[NodeType], ABC):
 		"""
 		raise NotImplementedError()
 
-	def requires(self, requirement: REQUIRES_CALLBACK, failure_message_getter: Optional[FAIL_MSG_CALLBACK] = None) -> Self:
+	def requires(self, requirement: REQUIRES_CALLBACK, failure_message_getter: Optional[FAIL_MSG_CALLBACK] = None, *, pure: bool = False) -> Self:
 		"""
 		See :meth:`AbstractNode.requires() <mcdreforged.command.builder.nodes.basic.AbstractNode.requires>`
+
+		.. versionadded:: v2.16.0
+			The *pure* keyword argument
 		"""
 		raise NotImplementedError()
 
@@ -139,9 +150,9 @@ class _NodeDefinitionImpl(NodeDefinition[NodeType]):
 		return self
 
 	@override
-	def requires(self, requirement: REQUIRES_CALLBACK, failure_message_getter: Optional[FAIL_MSG_CALLBACK] = None) -> Self:
+	def requires(self, requirement: REQUIRES_CALLBACK, failure_message_getter: Optional[FAIL_MSG_CALLBACK] = None, *, pure: bool = False) -> Self:
 		def post_processor_requires(node: NodeType):
-			node.requires(requirement, failure_message_getter)
+			node.requires(requirement, failure_message_getter, pure=pure)
 		return self.post_process(post_processor_requires)
 
 	@override
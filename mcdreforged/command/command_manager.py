@@ -1,15 +1,16 @@
 """
 Handling MCDR commands
 """
+import bisect
 import collections
 import contextlib
-from typing import TYPE_CHECKING, Dict, List, Tuple, Callable, Coroutine, Iterable, ContextManager, TypeVar, Any
+from typing import TYPE_CHECKING, Dict, List, Tuple, Callable, Coroutine, Iterable, ContextManager, TypeVar, Any, Optional
 
 from typing_extensions import override
 
 import mcdreforged.command.builder.command_builder_utils as utils
 from mcdreforged.command.builder.callback import CallbackError, CallbackInvoker
-from mcdreforged.command.builder.common import CommandExecution
+from mcdreforged.command.builder.common import CommandExecution, CommandSuggestionCache
 from mcdreforged.command.builder.exception import CommandError, RequirementNotMet
 from mcdreforged.command.builder.nodes.basic import CommandSuggestion, CommandSuggestions, EntryNode
 from mcdreforged.command.command_source import InfoCommandSource, CommandSource
@@ -55,6 +56,7 @@ class CommandManager:
 		self.mcdr_server = mcdr_server
 		self.logger = self.mcdr_server.logger
 		self.root_nodes: Dict[str, List[PluginCommandHolder]] = {}
+		self.__sorted_root_literals: Tuple[str, ...] = ()  # a prefix index of the root literals
 
 		self.__preserve_command_error_display_flag = False
 
@@ -63,6 +65,8 @@ class CommandManager:
 		def register_one_command(pch: PluginCommandHolder):
 			for literal_ in pch.node.literals:
 				new_root_nodes[literal_].append(pch)
+			# noinspection PyProtectedMember
+			pch.node._compile()
 
 		new_root_nodes: Dict[str, List[PluginCommandHolder]] = collections.defaultdict(list)
 		yield register_one_command
@@ -70,6 +74,15 @@ class CommandManager:
 			if sum([not pch.allow_duplicates for pch in pch_list]) >= 2:
 				self.logger.warning('Found duplicated command root literal {!r}: {}'.format(literal, pch_list))
 		self.root_nodes = dict(new_root_nodes)  # no more defaultdict
+		self.__sorted_root_literals = tuple(sorted(self.root_nodes.keys()))
+
+	def __get_root_literals_with_prefix(self, prefix: str) -> List[str]:
+		sorted_literals = self.__sorted_root_literals
+		start = bisect.bisect_left(sorted_literals, prefix)
+		end = start
+		while end < len(sorted_literals) and sorted_literals[end].startswith(prefix):
+			end += 1
+		return list(sorted_literals[start:end])
 
 	def __translate_command_error_header(self, source: CommandSource, translation_key_: str, error_: CommandError) -> MessageText:
 		if isinstance(error_, RequirementNotMet):
@@ -131,25 +144,35 @@ class CommandManager:
 				source.get_info().cancel_send_to_server()
 
 		executions: List[Tuple[CommandExecution, PluginCommandHolder]] = []
-		for pch in plugin_root_nodes:
-			with self.__handle_command_context_and_error(source, command, pch.plugin, pch.node):
-				# noinspection PyProtectedMember
-				for execution in pch.node._entry_execute(source, command):
-					executions.append((execution, pch))
+		# noinspection PyProtectedMember
+		with source._permission_level_cache():
+			for pch in plugin_root_nodes:
+				with self.__handle_command_context_and_error(source, command, pch.plugin, pch.node):
+					# noinspection PyProtectedMember
+					for execution in pch.node._entry_execute(source, command):
+						executions.append((execution, pch))
 
 		for execution, pch in executions:
 			invoker = CommandExecutionInvoker(self.mcdr_server, pch, self.__create_command_context_func(source, command, execution, pch))
 			execution.scheduled_callback.invoke(invoker)
 
-	def suggest_command(self, command: str, source: CommandSource) -> CommandSuggestions:
+	def suggest_command(self, command: str, source: CommandSource, *, suggestion_cache: Optional[CommandSuggestionCache] = None) -> CommandSuggestions:
+		"""
+		:param command: The command to suggest
+		:param source: The command source
+		:param suggestion_cache: An optional cache to memoize the suggestion results of the command nodes across calls
+		"""
 		plugin_root_nodes = self.root_nodes.get(utils.get_element(command), [])
 		if len(plugin_root_nodes) == 0:
-			return CommandSuggestions([CommandSuggestion('', literal) for literal in self.root_nodes.keys()])
+			# only root literals that can complete the input are useful
+			return CommandSuggestions([CommandSuggestion('', literal) for literal in self.__get_root_literals_with_prefix(command)])
 
 		suggestions = CommandSuggestions()
-		for pch in plugin_root_nodes:
-			with self.__handle_command_context_and_error(source, command, pch.plugin, pch.node):
-				# noinspection PyProtectedMember
-				suggestions.extend(pch.node._entry_generate_suggestions(source, command))
+		# noinspection PyProtectedMember
+		with source._permission_level_cache():
+			for pch in plugin_root_nodes:
+				with self.__handle_command_context_and_error(source, command, pch.plugin, pch.node):
+					# noinspection PyProtectedMember
+					suggestions.extend(pch.node._entry_generate_suggestions(source, command, suggestion_cache=suggestion_cache))
 
 		return suggestions
@@ -1,6 +1,8 @@
+import dataclasses
+import threading
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Dict
 
 from typing_extensions import override
 
@@ -18,6 +20,21 @@ if TYPE_CHECKING:
 	from mcdreforged.preference.preference_manager import PreferenceItem
 
 
+@dataclasses.dataclass
+class _PermissionLevelCacheEntry:
+	depth: int = 0
+	level: Optional[int] = None
+
+
+class _PermissionLevelCacheStorage(threading.local):
+	def __init__(self):
+		# id of the command source -> the cache entry. Thread local, since a command source might be used in multiple threads at the same time
+		self.entries: Dict[int, _PermissionLevelCacheEntry] = {}
+
+
+_permission_level_cache_storage = _PermissionLevelCacheStorage()
+
+
 class CommandSource(ABC):
 	"""
 	:class:`CommandSource`: is an abstracted command executor model. It provides several methods for command execution
@@ -118,7 +135,7 @@ class CommandSource(ABC):
 		:param level: The permission level to be tested
 		:return: If the command source has not less permission level than the given permission level
 		"""
-		return self.get_permission_level() >= level
+		return self.__get_permission_level_cached() >= level
 
 	def has_permission_higher_than(self, level: int) -> bool:
 		"""
@@ -127,7 +144,38 @@ class CommandSource(ABC):
 		:param level: The permission level to be tested
 		:return: If the command source has greater permission level than the given permission level
 		"""
-		return self.get_permission_level() > level
+		return self.__get_permission_level_cached() > level
+
+	def __get_permission_level_cached(self) -> int:
+		# the permission level cache is only enabled during a command dispatch in the current thread
+		if (entry := _permission_level_cache_storage.entries.get(id(self))) is None:
+			return self.get_permission_level()
+		if entry.level is None:
+			entry.level = self.get_permission_level()
+		return entry.level
+
+	@contextmanager
+	def _permission_level_cache(self):
+		"""
+		**Not public API**
+
+		Within the context, :meth:`has_permission` and :meth:`has_permission_higher_than` reuse the permission level
+		queried at the first time, instead of querying it on every call. It's used in the parsing stage of a command dispatch
+
+		The cache only affects the current thread
+
+		:meta private:
+		"""
+		entries = _permission_level_cache_storage.entries
+		if (entry := entries.get(id(self))) is None:
+			entry = entries[id(self)] = _PermissionLevelCacheEntry()
+		entry.depth += 1
+		try:
+			yield
+		finally:
+			entry.depth -= 1
+			if entry.depth == 0:
+				entries.pop(id(self), None)
 
 	@abstractmethod
 	def reply(self, message: MessageText, **kwargs) -> None:
@@ -29,9 +29,15 @@ DEFAULT_LANGUAGE = 'en_us'
 
 CONFIG_FILE_PATH = 'config.yml'
 PERMISSION_FILE_PATH = 'permission.yml'
+PERMISSION_FILE_SAVE_DELAY_SEC = 2
+PERMISSION_FILE_SAVE_MAX_DELAY_SEC = 10
+PREFERENCE_SAVE_DELAY_SEC = 2
+PREFERENCE_SAVE_MAX_DELAY_SEC = 10
+PREFERENCE_JOURNAL_MIN_COMPACTION_SIZE = 256
 
 PLUGIN_THREAD_POOL_SIZE = 4
 MAX_TASK_QUEUE_SIZE_REGULAR = 1048576
+MAX_TASK_QUEUE_SIZE_COMMAND = 2048
 MAX_TASK_QUEUE_SIZE_INFO = 2048
 WAIT_TIME_AFTER_SERVER_STDOUT_END_SEC = 60
 REACTOR_QUEUE_FULL_WARN_INTERVAL_SEC = 5
@@ -9,6 +9,20 @@ MCDR_PLUGIN_VERSION = core_constant.VERSION
 # the directory inside MCDR working directory that stores plugins' configuration files
 PLUGIN_CONFIG_DIRECTORY = 'config'
 
+# The maximum amount of worker threads for discovering plugin files and loading plugin metadata concurrently
+PLUGIN_LOADING_MAX_WORKERS = 8
+
+# Plugin hot reload: the max time of a single file change wait, the time to wait for a burst of file changes to end,
+# and the check interval of the polling file watcher, which is used when inotify is unavailable
+PLUGIN_HOT_RELOAD_POLL_TIMEOUT_SEC = 0.5
+PLUGIN_HOT_RELOAD_DEBOUNCE_SEC = 1
+PLUGIN_HOT_RELOAD_POLLING_INTERVAL_SEC = 2
+
+# The file suffix of the databases of plugin data stores, and the write-behind delays of them
+DATA_STORE_FILE_SUFFIX = '.db'
+DATA_STORE_FLUSH_DELAY_SEC = 1
+DATA_STORE_FLUSH_MAX_DELAY_SEC = 5
+
 # The file prefix for a solo plugin (a single .py file)
 SOLO_PLUGIN_FILE_SUFFIX = '.py'
 
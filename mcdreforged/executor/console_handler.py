@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import contextlib
 import logging
 import queue
@@ -6,7 +7,7 @@ import sys
 import threading
 import time
 from threading import RLock, Lock
-from typing import TYPE_CHECKING, Optional, Iterable, List, Sized, TextIO, cast, IO
+from typing import TYPE_CHECKING, Optional, Iterable, List, Sized, TextIO, cast, IO, Tuple, Callable, Any
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.application import get_app
@@ -22,6 +23,7 @@ from prompt_toolkit.patch_stdout import StdoutProxy
 from prompt_toolkit.shortcuts import CompleteStyle
 from typing_extensions import override
 
+from mcdreforged.command.builder.common import CommandSuggestionCache
 from mcdreforged.command.builder.nodes.basic import CommandSuggestions
 from mcdreforged.command.command_source import ConsoleCommandSource
 from mcdreforged.executor.background_thread_executor import BackgroundThreadExecutor
@@ -94,38 +96,104 @@ class ConsoleSuggestionCommandSource(ConsoleCommandSource):
 
 
 class CachedSuggestionProvider:
+	CACHE_TTL = 2.0  # in seconds. Suggestions might be dynamic (e.g. online players), so don't keep them too long
+	INPUT_CACHE_SIZE = 64
+
 	def __init__(self, command_manager: 'CommandManager'):
 		self.__command_manager = command_manager
 		self.__lock = Lock()
 		self.__calc_lock = Lock()
-		self.__cache_input: Optional[str] = None
-		self.__cache_suggestion: Optional[CommandSuggestions] = None
+		self.__cache: 'collections.OrderedDict[str, Tuple[float, CommandSuggestions]]' = collections.OrderedDict()
+		self.__node_cache = CommandSuggestionCache(ttl=self.CACHE_TTL)
+		self.__calculator = _BackgroundSuggestionCalculator(self)
 
 	@property
 	def mcdr_server(self) -> 'MCDReforgedServer':
 		return self.__command_manager.mcdr_server
 
-	def suggest(self, input_: str) -> CommandSuggestions:
+	def __get_cached(self, input_: str) -> Optional[CommandSuggestions]:
 		with self.__lock:
-			if input_ == self.__cache_input:
-				assert self.__cache_suggestion is not None
-				return self.__cache_suggestion
-		acq = self.__calc_lock.acquire(blocking=False)
-		if not acq:
-			return CommandSuggestions()  # empty suggestion
-		try:
+			entry = self.__cache.get(input_)
+			if entry is not None and time.monotonic() - entry[0] <= self.CACHE_TTL:
+				return entry[1]
+		return None
+
+	def suggest(self, input_: str) -> CommandSuggestions:
+		"""
+		Get the suggestions of the given input. Might block if another calculation is in progress
+		"""
+		if (suggestion := self.__get_cached(input_)) is not None:
+			return suggestion
+		with self.__calc_lock:
+			if (suggestion := self.__get_cached(input_)) is not None:
+				return suggestion
+
 			info = self.mcdr_server.server_handler_manager.get_current_handler().parse_console_command(input_)
 			command_source = ConsoleSuggestionCommandSource(self.__command_manager.mcdr_server, info)
 			# noinspection PyProtectedMember
 			info._attach_and_finalize(self.mcdr_server, command_source=command_source)
 
-			suggestion = self.__command_manager.suggest_command(input_, command_source)
+			suggestion = self.__command_manager.suggest_command(input_, command_source, suggestion_cache=self.__node_cache)
 			with self.__lock:
-				self.__cache_input = input_
-				self.__cache_suggestion = suggestion
-			return self.__cache_suggestion
-		finally:
-			self.__calc_lock.release()
+				self.__cache[input_] = (time.monotonic(), suggestion)
+				self.__cache.move_to_end(input_)
+				while len(self.__cache) > self.INPUT_CACHE_SIZE:
+					self.__cache.popitem(last=False)
+			return suggestion
+
+	def suggest_nowait(self, input_: str, on_ready: Callable[[], Any]) -> Optional[CommandSuggestions]:
+		"""
+		Get the suggestions of the given input without blocking
+
+		If the suggestions are not calculated yet, the calculation will be done in a background thread,
+		and None will be returned. *on_ready* will be invoked after the calculation is done
+
+		Only the latest requested input will be calculated
+		"""
+		if (suggestion := self.__get_cached(input_)) is not None:
+			return suggestion
+		self.__calculator.request(input_, on_ready)
+		return None
+
+	def stop(self):
+		self.__calculator.stop()
+
+
+class _BackgroundSuggestionCalculator(BackgroundThreadExecutor):
+	def __init__(self, suggester: CachedSuggestionProvider):
+		super().__init__(suggester.mcdr_server.logger)
+		self.__suggester = suggester
+		self.__lock = Lock()
+		self.__request: Optional[Tuple[str, Callable[[], Any]]] = None
+		self.__request_event = threading.Event()
+
+	def request(self, input_: str, on_ready: Callable[[], Any]):
+		with self.__lock:
+			self.__request = (input_, on_ready)
+			if self._executor_thread is None and self.should_keep_looping():
+				self.start()
+		self.__request_event.set()
+
+	@override
+	def stop(self):
+		super().stop()
+		self.__request_event.set()
+
+	@override
+	def tick(self):
+		self.__request_event.wait()
+		with self.__lock:
+			self.__request_event.clear()
+			request, self.__request = self.__request, None
+		if request is None or not self.should_keep_looping():
+			return
+
+		input_, on_ready = request
+		try:
+			self.__suggester.suggest(input_)
+			on_ready()
+		except Exception:
+			self.logger.exception('Failed to calculate suggestions for input {!r}'.format(input_))
 
 
 class CommandCompleter(WordCompleter):
@@ -154,8 +222,9 @@ class CommandArgumentSuggester(Processor):
 			buffer = ti.buffer_control.buffer
 			if not buffer.suggestion:
 				input_ = ti.document.text
-				suggestions = self.suggester.suggest(input_)
-				if suggestions.complete_hint is not None:
+				# the transformation is applied in the UI thread, so don't let the suggestion calculation block it
+				suggestions = self.suggester.suggest_nowait(input_, get_app().invalidate)
+				if suggestions is not None and suggestions.complete_hint is not None:
 					return Transformation(fragments=ti.fragments + [('class:auto-suggestion', suggestions.complete_hint)])
 		return Transformation(fragments=ti.fragments)
 
@@ -171,6 +240,7 @@ class MCDRPromptSession(PromptSession):
 			reserve_space_for_menu=3
 		)
 		suggester = CachedSuggestionProvider(self.__console_handler.mcdr_server.command_manager)
+		self.suggester = suggester
 		self.completer = CommandCompleter(suggester)
 		self.input_processors = [
 			CommandArgumentSuggester(suggester),
@@ -351,6 +421,8 @@ class PromptToolkitWrapper:
 			assert self.__real_stderr is not None
 
 			self.stdout_proxy.close()
+			if self.prompt_session is not None:
+				self.prompt_session.suggester.stop()
 			sys.stdout = self.__real_stdout
 			sys.stderr = self.__real_stderr
 			SyncStdoutStreamHandler.update_stdout(sys.stdout)
@@ -18,8 +18,9 @@ _T = TypeVar('_T')
 class TaskPriority(enum.Enum):
 	HIGH = 0      # for probe tasks
 	REGULAR = 1   # for regular tasks
-	INFO = 2      # for info tasks
-	SENTINEL = 3  # for shutdown sentinel
+	COMMAND = 2   # for command execution tasks from user infos
+	INFO = 3      # for info tasks
+	SENTINEL = 4  # for shutdown sentinel
 
 
 @dataclasses.dataclass(frozen=True)
@@ -35,6 +36,7 @@ class TaskQueue:
 		self.__queues: Dict[TaskPriority, 'queue.Queue[TaskQueueItem]'] = {
 			TaskPriority.HIGH: queue.Queue(),
 			TaskPriority.REGULAR: queue.Queue(maxsize=core_constant.MAX_TASK_QUEUE_SIZE_REGULAR),
+			TaskPriority.COMMAND: queue.Queue(maxsize=core_constant.MAX_TASK_QUEUE_SIZE_COMMAND),
 			TaskPriority.INFO: queue.Queue(maxsize=core_constant.MAX_TASK_QUEUE_SIZE_INFO),
 			TaskPriority.SENTINEL: queue.Queue(),
 		}
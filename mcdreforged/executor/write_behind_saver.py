@@ -0,0 +1,111 @@
+import threading
+import time
+from typing import Callable, Any, Optional, TYPE_CHECKING
+
+from typing_extensions import override
+
+from mcdreforged.executor.background_thread_executor import BackgroundThreadExecutor
+
+if TYPE_CHECKING:
+	from mcdreforged.logging.logger import MCDReforgedLogger
+
+
+class WriteBehindSaver(BackgroundThreadExecutor):
+	"""
+	Save data in a background thread after it's marked as dirty, so a burst of modifications results in only one save
+
+	The save is debounced: it happens *delay* seconds after the last modification,
+	but no later than *max_delay* seconds after the first unsaved modification
+	"""
+	def __init__(self, logger: 'MCDReforgedLogger', name: str, save_func: Callable[[], Any], *, delay: float, max_delay: float):
+		super().__init__(logger)
+		self.set_name(name)
+		self.__save_func = save_func
+		self.__delay = delay
+		self.__max_delay = max(delay, max_delay)
+		self.__cond = threading.Condition(threading.Lock())
+		self.__save_lock = threading.Lock()
+		self.__first_dirty_time: Optional[float] = None
+		self.__last_dirty_time: float = 0
+		self.__stopped = False
+
+	def is_dirty(self) -> bool:
+		with self.__cond:
+			return self.__first_dirty_time is not None
+
+	def mark_dirty(self):
+		"""
+		Schedule a save. If the saver is already stopped, save right now
+		"""
+		with self.__cond:
+			now = time.monotonic()
+			if self.__first_dirty_time is None:
+				self.__first_dirty_time = now
+			self.__last_dirty_time = now
+			stopped = self.__stopped
+			if not stopped:
+				if self._executor_thread is None:
+					self.start()
+				self.__cond.notify_all()
+		if stopped:
+			self.flush()
+
+	def flush(self) -> bool:
+		"""
+		Save right now if there are unsaved modifications
+
+		:return: If a save is performed
+		"""
+		with self.__save_lock:
+			with self.__cond:
+				if self.__first_dirty_time is None:
+					return False
+				self.__first_dirty_time = None
+			try:
+				self.__save_func()
+			except Exception:
+				self.logger.exception('Write-behind save in {} failed'.format(self.get_name()))
+				# keep it dirty, so the save will be retried after the delay, or on the next flush
+				with self.__cond:
+					if self.__first_dirty_time is None:
+						self.__first_dirty_time = self.__last_dirty_time = time.monotonic()
+					self.__cond.notify_all()
+			return True
+
+	def discard(self) -> bool:
+		"""
+		Forget the unsaved modifications, e.g. when the data is going to be reloaded from the storage.
+		A save that is already in progress is not affected
+
+		:return: If there were unsaved modifications
+		"""
+		with self.__cond:
+			dirty = self.__first_dirty_time is not None
+			self.__first_dirty_time = None
+			return dirty
+
+	@override
+	def stop(self):
+		"""
+		Stop the background thread, and save the unsaved modifications
+		"""
+		with self.__cond:
+			self.__stopped = True
+			super().stop()
+			self.__cond.notify_all()
+		self.flush()
+
+	@override
+	def tick(self):
+		with self.__cond:
+			while True:
+				if not self.should_keep_looping():
+					return
+				if self.__first_dirty_time is None:
+					self.__cond.wait()
+					continue
+				deadline = min(self.__last_dirty_time + self.__delay, self.__first_dirty_time + self.__max_delay)
+				if (remaining := deadline - time.monotonic()) <= 0:
+					break
+				self.__cond.wait(remaining)
+		self.flush()
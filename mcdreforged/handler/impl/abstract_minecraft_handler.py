@@ -118,19 +118,36 @@ class AbstractMinecraftHandler(AbstractServerHandler, ABC):
 			# quote it
 			return json.dumps(str(message), ensure_ascii=False, separators=(',', ':'))
 
-	@override
-	def get_send_message_command(self, target: str, message: MessageText, server_information: ServerInformation) -> Optional[str]:
+	@classmethod
+	def __get_tellraw_command_prefix(cls, server_information: ServerInformation) -> str:
 		try:
 			can_do_execute = _does_mc_version_has_execute_command(server_information.version)
 		except (ValueError, IndexError):
 			# TODO: logging?
 			can_do_execute = False
 
-		command = 'tellraw {} {}'.format(target, self.format_message(message, server_information=server_information))
 		if can_do_execute:
 			# Mute the "No player was found" output when no player is online by using the "execute at" command
-			command = 'execute at @p run ' + command
-		return command
+			return 'execute at @p run tellraw '
+		return 'tellraw '
+
+	@override
+	def get_send_message_command(self, target: str, message: MessageText, server_information: ServerInformation) -> Optional[str]:
+		return '{}{} {}'.format(self.__get_tellraw_command_prefix(server_information), target, self.format_message(message, server_information=server_information))
+
+	@override
+	def get_send_message_commands(self, targets: List[str], message: MessageText, server_information: ServerInformation) -> List[str]:
+		if type(self).get_send_message_command is not AbstractMinecraftHandler.get_send_message_command:
+			# customized single-target command, respect it
+			return super().get_send_message_commands(targets, message, server_information)
+		if len(targets) == 0:
+			return []
+
+		# vanilla tellraw accepts one target only, and selectors cannot match a list of names,
+		# so just render the message once and reuse it for all targets
+		prefix = self.__get_tellraw_command_prefix(server_information)
+		formatted_message = self.format_message(message, server_information=server_information)
+		return ['{}{} {}'.format(prefix, target, formatted_message) for target in targets]
 
 	@override
 	def get_broadcast_message_command(self, message: MessageText, server_information: ServerInformation) -> Optional[str]:
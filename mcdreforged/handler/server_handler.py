@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Optional, Tuple, List
 
 from mcdreforged.info_reactor.info import Info
 from mcdreforged.info_reactor.server_information import ServerInformation
@@ -59,6 +59,21 @@ class ServerHandler(ABC):
 		"""
 		...
 
+	def get_send_message_commands(self, targets: List[str], message: MessageText, server_information: ServerInformation) -> List[str]:
+		"""
+		The commands to send the same message to multiple targets
+
+		By default, it collects the results of :meth:`get_send_message_command` for each target.
+		Handlers can override this method to render the message only once, or to merge targets into fewer commands
+
+		.. versionadded:: v2.16.0
+		"""
+		commands: List[str] = []
+		for target in targets:
+			if (command := self.get_send_message_command(target, message, server_information)) is not None:
+				commands.append(command)
+		return commands
+
 	@abstractmethod
 	def get_broadcast_message_command(self, message: MessageText, server_information: ServerInformation) -> Optional[str]:
 		"""
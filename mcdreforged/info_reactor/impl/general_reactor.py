@@ -12,8 +12,10 @@ from mcdreforged.plugin.plugin_event import MCDRPluginEvents
 class GeneralReactor(AbstractInfoReactor):
 	@override
 	def react(self, info: Info):
-		if info.content is not None and (command_source := info.get_command_source()) is not None:
-			self.mcdr_server.command_manager.execute_command(info.content, command_source)
+		# the command of user infos is already executed in the command lane, see InfoReactorManager.put_info
+		# noinspection PyProtectedMember
+		if not info._is_command_executed():
+			self.execute_command(info)
 
 		# The subsequent code flow needs to check the `cancel_send_to_server` status of the `info`,
 		# so the `dispatch_event` calls here needs cannot be delay with `DispatchEventPolicy.always_new_task`
@@ -22,3 +24,9 @@ class GeneralReactor(AbstractInfoReactor):
 
 		if info.is_user:
 			self.mcdr_server.plugin_manager.dispatch_event(MCDRPluginEvents.USER_INFO, (info,), dispatch_policy=dp_ensure_on_thread)
+
+	def execute_command(self, info: Info):
+		# noinspection PyProtectedMember
+		info._mark_command_executed()
+		if info.content is not None and (command_source := info.get_command_source()) is not None:
+			self.mcdr_server.command_manager.execute_command(info.content, command_source)
@@ -87,6 +87,7 @@ _default_info_action_flag = InfoActionFlag.default()
 class _InfoControlData:
 	mcdr_server: 'MCDReforgedServer'
 	command_source: Optional[InfoCommandSource]
+	command_executed: bool = False
 
 
 @dataclasses.dataclass
@@ -248,4 +249,16 @@ class Info:
 		self.__control_data = _InfoControlData(
 			mcdr_server=mcdr_server,
 			command_source=create_command_source(),
-		)
\ No newline at end of file
+		)
+
+	def _is_command_executed(self) -> bool:
+		"""
+		**Not public API**
+		"""
+		return self.__icd.command_executed
+
+	def _mark_command_executed(self):
+		"""
+		**Not public API**
+		"""
+		self.__icd.command_executed = True
@@ -26,6 +26,7 @@ class InfoReactorManager:
 		self.last_queue_full_warn_time: Optional[float] = None
 		self.server_output_logger = ServerOutputLogger('Server', mcdr_server.logger)
 		self.reactors: List[AbstractInfoReactor] = []
+		self.general_reactor = GeneralReactor(mcdr_server)
 		self.__tr = mcdr_server.create_internal_translator('info_reactor_manager').tr
 		self.__info_filter_holders: List[InfoFilterHolder] = []
 
@@ -40,7 +41,7 @@ class InfoReactorManager:
 	def register_reactors(self, custom_reactor_class_paths: Optional[List[str]]):
 		self.reactors.clear()
 		self.reactors.extend([
-			GeneralReactor(self.mcdr_server),
+			self.general_reactor,
 			ServerReactor(self.mcdr_server),
 			PlayerReactor(self.mcdr_server)
 		])
@@ -87,6 +88,23 @@ class InfoReactorManager:
 			if info.content is not None and info.is_from_console and InfoActionFlag.send_to_server in info.action_flag:
 				self.mcdr_server.send(info.content)
 
+		def do_command_execution():
+			def execute_command_wrapper():
+				try:
+					self.general_reactor.execute_command(info)
+				except Exception:
+					self.mcdr_server.logger.exception(self.__tr('react.error', type(self.general_reactor).__name__))
+
+			# Commands are executed in a separated lane with higher priority, so they will not be blocked by the info flood.
+			# The lane is still on the task executor thread, where the command callbacks are expected to be run.
+			# It's ensured that the command is executed before the info process task of the same info,
+			# so the info process and the send_to_server logic will see the result of the command execution
+			self.mcdr_server.task_executor.submit(
+				execute_command_wrapper,
+				priority=TaskPriority.COMMAND,
+				need_future=False
+			)
+
 		def do_info_process_then_send_to_server():
 			def process_info_wrapper():
 				try:
@@ -113,6 +131,8 @@ class InfoReactorManager:
 
 		echo_to_console()
 		if InfoActionFlag.process in info.action_flag:
+			if info.is_user:
+				do_command_execution()
 			do_info_process_then_send_to_server()
 		else:
 			# send to server now
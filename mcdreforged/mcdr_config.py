@@ -3,7 +3,7 @@ MCDR config file stuffs
 """
 import threading
 from logging import Logger
-from typing import Any, Tuple, Dict, Union, Optional, List, TypeVar
+from typing import Any, Tuple, Dict, Union, Optional, List, TypeVar, Literal
 
 from mcdreforged.constants import core_constant
 from mcdreforged.constants.environment_variables import ENV_DISABLE_TELEMETRY
@@ -34,6 +34,7 @@ class MCDReforgedConfig(Serializable):
 
 	# --------- Plugin Configuration ---------
 	plugin_directories: List[str] = ['plugins']
+	plugin_hot_reload: bool = False
 	catalogue_meta_cache_ttl: int = 20 * 60  # 20min
 	catalogue_meta_fetch_timeout: float = 15
 	catalogue_meta_url: Optional[str] = None
@@ -55,6 +56,7 @@ class MCDReforgedConfig(Serializable):
 	custom_info_reactors: Optional[List[str]] = None
 	watchdog_threshold: int = 10
 	handler_detection: bool = True
+	player_data_storage: Literal['file', 'sqlite'] = 'file'
 
 	# --------- Debug Configuration ---------
 	debug: Dict[str, bool] = {str(o.name).lower(): False for o in DebugOption}
@@ -33,6 +33,7 @@ from mcdreforged.mcdr_state import ServerState, MCDReforgedState, MCDReforgedFla
 from mcdreforged.minecraft.rcon.rcon_manager import RconManager
 from mcdreforged.permission.permission_manager import PermissionManager
 from mcdreforged.plugin.plugin_event import MCDRPluginEvents
+from mcdreforged.plugin.plugin_hot_reloader import PluginHotReloader
 from mcdreforged.plugin.plugin_manager import PluginManager
 from mcdreforged.plugin.si.server_interface import ServerInterface
 from mcdreforged.preference.preference_manager import PreferenceManager
@@ -101,6 +102,7 @@ class MCDReforgedServer:
 		self.reactor_manager: InfoReactorManager = InfoReactorManager(self)
 		self.command_manager: CommandManager = CommandManager(self)
 		self.plugin_manager: PluginManager = PluginManager(self)
+		self.plugin_hot_reloader: PluginHotReloader = PluginHotReloader(self)
 		self.preference_manager: PreferenceManager = PreferenceManager(self)
 		self.__tr = self.create_internal_translator('mcdr_server')
 
@@ -325,6 +327,8 @@ class MCDReforgedServer:
 		reg.export_info_filters(info_filter_holders.append)
 		self.reactor_manager.set_info_filters(info_filter_holders)
 
+		self.plugin_hot_reloader.on_plugins_changed()
+
 	# ---------------------------
 	#      General Setters
 	# ---------------------------
@@ -612,6 +616,7 @@ class MCDReforgedServer:
 		self.preference_manager.load_preferences()
 		self.plugin_manager.register_builtin_plugins()
 		self.task_executor.submit(self.load_plugins).result()
+		self.plugin_hot_reloader.start()
 		self.plugin_manager.dispatch_event(MCDRPluginEvents.MCDR_START, ())
 		if not self.config.disable_console_thread:
 			self.console_handler.start()
@@ -654,6 +659,7 @@ class MCDReforgedServer:
 		try:
 			self.set_mcdr_state(MCDReforgedState.PRE_STOPPED)
 			self.logger.info(self.__tr('on_mcdr_stop.info'))
+			self.plugin_hot_reloader.stop()
 
 			with self.watch_dog.pausing():  # it's ok for plugins to take some time
 				self.plugin_manager.dispatch_event(MCDRPluginEvents.MCDR_STOP, ())
@@ -685,6 +691,11 @@ class MCDReforgedServer:
 				self.watch_dog.stop()
 				join_executor(self.watch_dog)
 
+			self.permission_manager.stop()
+			self.preference_manager.close()
+			for plugin in self.plugin_manager.get_all_plugins():
+				# noinspection PyProtectedMember
+				plugin.server_interface._close_data_stores()
 			self.console_handler.stop()
 			self.update_helper.stop()
 			self.telemetry_reporter_scheduler.stop()
@@ -1,5 +1,6 @@
 import contextlib
 import json
+from json.encoder import encode_basestring
 from abc import ABC, abstractmethod
 from typing import Iterable, List, Union, Optional, Any, Tuple, Set, Dict, TypeVar, overload, Callable, NoReturn
 
@@ -7,10 +8,11 @@ from colorama import Style
 from typing_extensions import Self, override, TypedDict, NotRequired, Unpack, final
 
 from mcdreforged.minecraft.rtext.click_event import RClickAction, RClickEvent, RClickEventSingleValue
-from mcdreforged.minecraft.rtext.hover_event import RHoverEvent, RHoverText
+from mcdreforged.minecraft.rtext.hover_event import RHoverEvent, RHoverText, RHoverEntity
 from mcdreforged.minecraft.rtext.schema import RTextJsonFormat
 from mcdreforged.minecraft.rtext.style import RStyle, RColor, RColorClassic, RColorRGB, RItemClassic
 from mcdreforged.utils import class_utils
+from mcdreforged.utils.exception import IllegalStateError
 
 
 class __Unset:
@@ -22,6 +24,10 @@ _UNSET: Any = __Unset()
 _T = TypeVar('_T')
 
 
+def _dump_json(obj: Any) -> str:
+	return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
 class RTextBase(ABC):
 	"""
 	An abstract base class of Minecraft text component
@@ -33,6 +39,16 @@ class RTextBase(ABC):
 	class FromJsonKwargs(TypedDict):
 		json_format: NotRequired[Optional[RTextJsonFormat]]  # None means auto-detect
 
+	__frozen: bool = False
+	__json_str_cache: Optional[Dict[RTextJsonFormat, str]] = None  # None means not cacheable
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		# A subclass that customizes to_json_object() without a matching _write_json() uses the generic json dumping,
+		# so to_json_str() always agrees with to_json_object()
+		if 'to_json_object' in cls.__dict__ and '_write_json' not in cls.__dict__:
+			cls._write_json = RTextBase._write_json  # type: ignore
+
 	@abstractmethod
 	def to_json_object(self, **kwargs: Unpack[ToJsonKwargs]) -> Union[dict, list]:
 		"""
@@ -45,8 +61,78 @@ class RTextBase(ABC):
 		Return a json formatted str representing its data
 
 		It can be used as the second parameter in Minecraft command ``/tellraw <target> <message>`` and more
+
+		If the component is :meth:`frozen <freeze>`, the result will be cached for each :class:`~mcdreforged.minecraft.rtext.schema.RTextJsonFormat`
+		"""
+		if (cache := self.__json_str_cache) is not None:
+			json_format = kwargs.get('json_format', RTextJsonFormat.default())
+			if (json_str := cache.get(json_format)) is None:
+				json_str = cache[json_format] = self.__dump_json_str(**kwargs)
+			return json_str
+		return self.__dump_json_str(**kwargs)
+
+	def __dump_json_str(self, **kwargs: Unpack[ToJsonKwargs]) -> str:
+		buf: List[str] = []
+		self._write_json(buf, kwargs.get('json_format', RTextJsonFormat.default()))
+		return ''.join(buf)
+
+	def _write_json(self, buf: List[str], json_format: RTextJsonFormat):
+		"""
+		Write the compact json string of itself into *buf*, walking the component tree in a single pass
+
+		The written content must be identical to the dumped result of :meth:`to_json_object`
+		"""
+		buf.append(_dump_json(self.to_json_object(json_format=json_format)))
+
+	@final
+	def freeze(self) -> Self:
+		"""
+		Make the text component immutable, and return the text component itself
+
+		All components inside this text component, e.g. children components and hover texts, will be frozen too.
+		Trying to modify a frozen component will raise an :class:`~mcdreforged.utils.exception.IllegalStateError`.
+		Use :meth:`copy` to get a mutable copy of a frozen component
+
+		The result of :meth:`to_json_str` of a frozen component will be cached, so it's recommended to freeze
+		prebuilt texts that will be sent many times, e.g. help messages or broadcast templates
+
+		.. note:: Components whose content depends on the context, e.g. :class:`~mcdreforged.translation.translation_text.RTextMCDRTranslation`,
+			and all components that contain them, will not have their json strings cached
+
+		.. versionadded:: v2.16.0
+		"""
+		if not self.__frozen:
+			cacheable = self._is_json_str_cacheable()
+			for component in self._get_sub_components():
+				component.freeze()
+				cacheable = cacheable and component.__json_str_cache is not None
+			self.__json_str_cache = {} if cacheable else None
+			self.__frozen = True
+		return self
+
+	def is_frozen(self) -> bool:
 		"""
-		return json.dumps(self.to_json_object(**kwargs), ensure_ascii=False, separators=(',', ':'))
+		Return if the text component is frozen by :meth:`freeze`
+
+		.. versionadded:: v2.16.0
+		"""
+		return self.__frozen
+
+	def _ensure_not_frozen(self):
+		if self.__frozen:
+			raise IllegalStateError('Cannot modify a frozen {} component'.format(type(self).__name__))
+
+	def _get_sub_components(self) -> Iterable['RTextBase']:
+		"""
+		Return the components contained in this component, which are frozen alongside this component
+		"""
+		return ()
+
+	def _is_json_str_cacheable(self) -> bool:
+		"""
+		If the json string of this component itself, ignoring its sub-components, only depends on the json format
+		"""
+		return True
 
 	@abstractmethod
 	def to_plain_text(self) -> str:
@@ -410,11 +496,13 @@ class RText(RTextBase):
 
 	@override
 	def set_color(self, color: RColor) -> Self:
+		self._ensure_not_frozen()
 		self.__color = color
 		return self
 
 	@override
 	def set_styles(self, styles: Union[RStyle, Iterable[RStyle]]) -> Self:
+		self._ensure_not_frozen()
 		if isinstance(styles, RStyle):
 			styles = {styles}
 		elif isinstance(styles, Iterable):
@@ -426,14 +514,52 @@ class RText(RTextBase):
 
 	@override
 	def _set_click_event_direct(self, click_event: RClickEvent) -> Self:
+		self._ensure_not_frozen()
 		self.__click_event = click_event
 		return self
 
 	@override
 	def set_hover_event(self, hover_event: RHoverEvent) -> Self:
+		self._ensure_not_frozen()
 		self.__hover_event = hover_event
 		return self
 
+	@override
+	def _get_sub_components(self) -> Iterable[RTextBase]:
+		if isinstance(self.__hover_event, RHoverText):
+			yield self.__hover_event.text
+		elif isinstance(self.__hover_event, RHoverEntity) and isinstance(self.__hover_event.name, RTextBase):
+			yield self.__hover_event.name
+
+	def _write_json_fields(self, buf: List[str], json_format: RTextJsonFormat):
+		"""
+		Write the json fields after the "text" field, in the same order as :meth:`to_json_object`.
+		The first string appended by each field starts with a ``,``
+		"""
+		if self.__color is not None:
+			buf.append(',"color":')
+			buf.append(encode_basestring(self.__color.name))
+		for style in self.__styles:
+			buf.append(',' + encode_basestring(style.name) + ':true')
+		if self.__click_event is not None:
+			buf.append(',' + encode_basestring(json_format.value.click_event_key) + ':')
+			buf.append(_dump_json(self.__click_event.to_json_object(json_format)))
+		if self.__hover_event is not None:
+			buf.append(',' + encode_basestring(json_format.value.hover_event_key) + ':')
+			if type(self.__hover_event) is RHoverText:
+				buf.append('{"action":' + encode_basestring(self.__hover_event.action.name) + ',"value":')
+				self.__hover_event.text._write_json(buf, json_format)
+				buf.append('}')
+			else:
+				buf.append(_dump_json(self.__hover_event.to_json_object(json_format)))
+
+	@override
+	def _write_json(self, buf: List[str], json_format: RTextJsonFormat):
+		buf.append('{"text":')
+		buf.append(encode_basestring(self.__text))
+		self._write_json_fields(buf, json_format)
+		buf.append('}')
+
 	@override
 	def to_json_object(self, **kwargs: Unpack[RTextBase.ToJsonKwargs]) -> Dict[str, Any]:
 		json_format = kwargs.get('json_format', RTextJsonFormat.default())
@@ -545,18 +671,21 @@ class RTextList(RTextBase):
 
 	@override
 	def set_color(self, color: RColor) -> Self:
+		self._ensure_not_frozen()
 		self.header.set_color(color)
 		self.header_empty = False
 		return self
 
 	@override
 	def set_styles(self, styles: Union[RStyle, Iterable[RStyle]]) -> Self:
+		self._ensure_not_frozen()
 		self.header.set_styles(styles)
 		self.header_empty = False
 		return self
 
 	@override
 	def _set_click_event_direct(self, click_event: RClickEvent) -> Self:
+		self._ensure_not_frozen()
 		# noinspection PyProtectedMember
 		self.header._set_click_event_direct(click_event)
 		self.header_empty = False
@@ -564,6 +693,7 @@ class RTextList(RTextBase):
 
 	@override
 	def set_hover_event(self, hover_event: RHoverEvent) -> Self:
+		self._ensure_not_frozen()
 		self.header.set_hover_event(hover_event)
 		self.header_empty = False
 		return self
@@ -574,6 +704,7 @@ class RTextList(RTextBase):
 
 		:meta private:
 		"""
+		self._ensure_not_frozen()
 		self.header = header_text
 		self.header_empty = False
 		return self
@@ -590,6 +721,7 @@ class RTextList(RTextBase):
 		return get(self.header)
 
 	def append(self, *args) -> Self:
+		self._ensure_not_frozen()
 		for obj in args:
 			self.children.append(RTextBase.from_any(obj))
 		return self
@@ -597,6 +729,23 @@ class RTextList(RTextBase):
 	def is_empty(self) -> bool:
 		return len(self.children) == 0
 
+	@override
+	def _get_sub_components(self) -> Iterable[RTextBase]:
+		yield self.header
+		yield from self.children
+
+	@override
+	def _write_json(self, buf: List[str], json_format: RTextJsonFormat):
+		if self.header_empty:
+			buf.append('[""')
+		else:
+			buf.append('[')
+			self.header._write_json(buf, json_format)
+		for rtext in self.children:
+			buf.append(',')
+			rtext._write_json(buf, json_format)
+		buf.append(']')
+
 	@override
 	def to_json_object(self, **kwargs: Unpack[RTextBase.ToJsonKwargs]) -> Union[dict, list]:
 		ret: list = ['' if self.header_empty else self.header.to_json_object(**kwargs)]
@@ -688,6 +837,7 @@ class RTextTranslation(RText):
 
 		:param args: The translation arguments
 		"""
+		self._ensure_not_frozen()
 		self.__args = args
 		return self
 
@@ -701,13 +851,44 @@ class RTextTranslation(RText):
 
 		:param fallback: The fallback text if the translation is unknown
 		"""
+		self._ensure_not_frozen()
 		self.__fallback = fallback
 		return self
 
+	@override
+	def _get_sub_components(self) -> Iterable[RTextBase]:
+		yield from super()._get_sub_components()
+		for arg in self.__args:
+			if isinstance(arg, RTextBase):
+				yield arg
+
 	@override
 	def to_plain_text(self) -> str:
 		return self.__translation_key
 
+	@override
+	def _write_json(self, buf: List[str], json_format: RTextJsonFormat):
+		buf.append('{')
+		first_field_index = len(buf)
+		self._write_json_fields(buf, json_format)
+		buf.append(',"translate":')
+		buf.append(encode_basestring(self.__translation_key))
+		if len(self.__args) > 0:
+			buf.append(',"with":[')
+			for i, arg in enumerate(self.__args):
+				if i > 0:
+					buf.append(',')
+				if isinstance(arg, RTextBase):
+					arg._write_json(buf, RTextJsonFormat.default())  # same as to_json_object(), which does not pass the kwargs to args
+				else:
+					buf.append(_dump_json(arg))
+			buf.append(']')
+		if self.__fallback is not None:
+			buf.append(',"fallback":')
+			buf.append(encode_basestring(self.__fallback))
+		buf.append('}')
+		buf[first_field_index] = buf[first_field_index][1:]  # remove the leading ',' of the first field
+
 	@override
 	def to_json_object(self, **kwargs: Unpack[RTextBase.ToJsonKwargs]) -> Dict[str, Any]:
 		obj = super().to_json_object(**kwargs)
@@ -1,16 +1,22 @@
 """
 Permission control things
 """
+from pathlib import Path
+from threading import RLock
 from typing import Literal as TLiteral
 from typing import Set, Any, List, overload
 
 from typing_extensions import override
 
 from mcdreforged.command.command_source import CommandSource
+from mcdreforged.constants import core_constant
+from mcdreforged.executor.write_behind_saver import WriteBehindSaver
 from mcdreforged.info_reactor.info import *
 from mcdreforged.logging.debug_option import DebugOption
 from mcdreforged.permission.permission_level import PermissionLevel, PermissionLevelItem, PermissionParam
+from mcdreforged.permission.player_permission_storage import PlayerPermissionStorage, YamlPlayerPermissionStorage, SqlitePlayerPermissionStorage
 from mcdreforged.utils import collection_utils
+from mcdreforged.utils.file_hash_cache import FileFingerprint
 from mcdreforged.utils.yaml_data_storage import YamlDataStorage
 
 if TYPE_CHECKING:
@@ -25,6 +31,13 @@ class PermissionStorage(YamlDataStorage):
 	def __setitem__(self, key: str, value: Any):
 		self._data[key] = value
 
+	@property
+	def lock(self) -> RLock:
+		"""
+		The lock for modifying the data. Saving the data also acquires it
+		"""
+		return self._data_operation_lock
+
 	@override
 	def _pre_save(self, data: dict):
 		# Deduplicate the permission data
@@ -42,6 +55,17 @@ class PermissionManager:
 		self.mcdr_server = mcdr_server
 		self.storage = PermissionStorage(mcdr_server.logger, permission_file_path, DEFAULT_PERMISSION_RESOURCE_PATH)
 		self.__tr = mcdr_server.create_internal_translator('permission_manager').tr
+		self.__file_path = Path(permission_file_path)
+		self.__db_path = self.__file_path.with_suffix('.db')
+		# fingerprint of the permission file after the last load or save, to detect modifications from others
+		self.__file_fingerprint: Optional[FileFingerprint] = None
+		# modifications are saved in a background thread, so mass player joins will not cause mass file rewrites
+		self.__saver = WriteBehindSaver(
+			mcdr_server.logger, 'PermissionSaver', self.__save_storage,
+			delay=core_constant.PERMISSION_FILE_SAVE_DELAY_SEC,
+			max_delay=core_constant.PERMISSION_FILE_SAVE_MAX_DELAY_SEC,
+		)
+		self.__player_storage: PlayerPermissionStorage = YamlPlayerPermissionStorage(self.storage, self.__saver.mark_dirty)
 
 	# --------------
 	# File Operating
@@ -51,7 +75,66 @@ class PermissionManager:
 		"""
 		Load the permission file from disk
 		"""
-		self.storage.read_config(allowed_missing_file)
+		# The pending in-memory modifications are written first, so the deferred save is not observable by the user.
+		# Unless the file has been modified by others, e.g. edited by the user, then the file on disk is the source of truth.
+		# Flush outside the storage lock, since the saver thread acquires the storage lock during its save
+		if self.__get_file_fingerprint() == self.__file_fingerprint:
+			self.__saver.flush()
+		with self.storage.lock:
+			if self.__saver.discard():
+				self.mcdr_server.logger.warning(self.__tr('load.discard_pending'))
+			self.storage.read_config(allowed_missing_file)
+			self.__file_fingerprint = self.__get_file_fingerprint()
+			self.__update_player_storage()
+			self.__player_storage.reload()
+
+	def __get_file_fingerprint(self) -> Optional[FileFingerprint]:
+		try:
+			return FileFingerprint.of(self.__file_path)
+		except OSError:
+			return None
+
+	def __save_storage(self):
+		with self.storage.lock:
+			self.storage.save()
+			self.__file_fingerprint = self.__get_file_fingerprint()
+
+	def __update_player_storage(self):
+		use_sqlite = self.mcdr_server.config.player_data_storage == 'sqlite'
+		if use_sqlite != isinstance(self.__player_storage, SqlitePlayerPermissionStorage):
+			self.__player_storage.close()
+			if use_sqlite:
+				self.__player_storage = SqlitePlayerPermissionStorage(self.__db_path, self.storage)
+			else:
+				self.__player_storage = YamlPlayerPermissionStorage(self.storage, self.__saver.mark_dirty)
+			self.mcdr_server.logger.mdebug('Using player permission storage {}'.format(type(self.__player_storage).__name__), option=DebugOption.PERMISSION)
+		if not use_sqlite and self.__db_path.is_file():
+			self.__migrate_from_sqlite()
+
+	def __migrate_from_sqlite(self):
+		"""
+		Switched back to the file storage, move the players in the database into the permission file
+
+		The database is renamed afterward, so a later switch to sqlite migrates from the permission file again
+		"""
+		sqlite_storage = SqlitePlayerPermissionStorage(self.__db_path, self.storage)
+		try:
+			group_lists = {level_value: sqlite_storage.get_group_list(level_value) for level_value in PermissionLevel.LEVELS}
+		finally:
+			sqlite_storage.close()
+
+		# the database was the source of truth, it replaces the outdated group lists in the permission file
+		self.__player_storage.reload()
+		for player in self.__player_storage.get_players():
+			self.__player_storage.remove_player(player)
+		for level_value, players in group_lists.items():
+			for player in players:
+				self.__player_storage.add_player(player, level_value)
+		backup_path = self.__db_path.with_name(self.__db_path.name + '.bak')
+		self.__db_path.replace(backup_path)
+		self.__saver.mark_dirty()
+		player_count = sum(map(len, group_lists.values()))
+		self.mcdr_server.logger.info(self.__tr('load.migrate_from_sqlite', player_count, self.__db_path, backup_path))
 
 	def file_presents(self) -> bool:
 		return self.storage.file_presents()
@@ -59,6 +142,19 @@ class PermissionManager:
 	def save_default(self):
 		self.storage.save_default()
 
+	def flush(self):
+		"""
+		Write the pending modifications into the permission file now
+		"""
+		self.__saver.flush()
+
+	def stop(self):
+		"""
+		Stop the background saving. Pending modifications will be written into the permission file
+		"""
+		self.__saver.stop()
+		self.__player_storage.close()
+
 	# ---------------------
 	# Permission processing
 	# ---------------------
@@ -74,8 +170,9 @@ class PermissionManager:
 		Set default permission level
 		A message will be informed using server logger
 		"""
-		self.storage['default_level'] = level.name
-		self.storage.save()
+		with self.storage.lock:
+			self.storage['default_level'] = level.name
+		self.__saver.mark_dirty()
 		self.mcdr_server.logger.info(self.__tr('set_default_permission_level.done', level.name))
 
 	def get_permission_group_list(self, value: PermissionParam) -> List[str]:
@@ -85,16 +182,13 @@ class PermissionManager:
 
 		:param value: a permission related object
 		"""
-		level_name = PermissionLevel.from_value(value).name
-		if self.storage[level_name] is None:
-			self.storage[level_name] = []
-		return self.storage[level_name]
+		return self.__player_storage.get_group_list(PermissionLevel.from_value(value).level)
 
 	def add_player(self, player: str, level_name: Optional[str] = None) -> int:
 		"""
 		Add a new player with permission level level_name
 		If level_name is not set use default level
-		Then save the permission data to file
+		The permission data is saved to file later in the background
 
 		:param player: the name of the player
 		:param level_name: the permission level name
@@ -102,33 +196,27 @@ class PermissionManager:
 		"""
 		if level_name is None:
 			level_name = self.get_default_permission_level()
-		PermissionLevel.from_value(level_name)  # validity check
-		self.get_permission_group_list(level_name).append(player)
+		level = PermissionLevel.from_value(level_name).level  # validity check
+		self.__player_storage.add_player(player, level)
 		self.mcdr_server.logger.mdebug('Added player {} with permission level {}'.format(player, level_name), option=DebugOption.PERMISSION)
-		self.storage.save()
-		return PermissionLevel.from_value(level_name).level
+		return level
 
 	def remove_player(self, player: str):
 		"""
-		Remove a player from data, then save the permission data to file
+		Remove a player from data
 		If the player has multiple permission level, remove them all
-		And then save the permission data to file
+		The permission data is saved to file later in the background
 
 		:param player: the name of the player
 		"""
-		while True:
-			level = self.get_player_permission_level(player, auto_add=False)
-			if level is None:
-				break
-			self.get_permission_group_list(level).remove(player)
+		self.__player_storage.remove_player(player)
 		self.mcdr_server.logger.mdebug('Removed player {}'.format(player), option=DebugOption.PERMISSION)
-		self.storage.save()
 
 	def set_permission_level(self, player: str, new_level: PermissionLevelItem):
 		"""
 		Set new permission level of the player
 		Basically it will remove the player first, then add the player with given permission level
-		Then save the permission data to file
+		The permission data is saved to file later in the background
 
 		:param player: the name of the player
 		:param new_level: the permission level name
@@ -163,14 +251,13 @@ class PermissionManager:
 		:param auto_add: if it's True when player is invalid he will receive the default permission level
 		:return the permission level from a player's name. If auto_add is False and player invalid return None
 		"""
-		for level_value in PermissionLevel.LEVELS[::-1]:  # high -> low
-			if player in self.get_permission_group_list(level_value):
-				return level_value
+		level = self.__player_storage.get_level(player)
+		if level is not None:
+			return level
+		if auto_add:
+			return self.add_player(player)
 		else:
-			if auto_add:
-				return self.add_player(player)
-			else:
-				return None
+			return None
 
 	def get_permission(self, source: CommandSource) -> int:
 		"""
@@ -184,7 +271,4 @@ class PermissionManager:
 			raise TypeError('Unknown type {} in get_permission'.format(type(source)))
 
 	def get_players(self) -> Set[str]:
-		players = set()
-		for level_value in PermissionLevel.LEVELS:
-			players.update(self.get_permission_group_list(level_value))
-		return players
+		return self.__player_storage.get_players()
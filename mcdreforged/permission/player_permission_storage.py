@@ -0,0 +1,178 @@
+"""
+Storages of the permission levels of players
+"""
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, List, Set, Callable, Any, TYPE_CHECKING
+
+from typing_extensions import override
+
+from mcdreforged.permission.permission_level import PermissionLevel
+from mcdreforged.utils import sqlite_utils
+
+if TYPE_CHECKING:
+	from mcdreforged.permission.permission_manager import PermissionStorage
+
+
+class PlayerPermissionStorage(ABC):
+	"""
+	The storage of the permission levels of players. If a player appears in multiple permission groups, the highest level wins
+	"""
+
+	@abstractmethod
+	def reload(self):
+		"""
+		Called after the permission file is (re)loaded
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def get_level(self, player: str) -> Optional[int]:
+		raise NotImplementedError()
+
+	@abstractmethod
+	def get_group_list(self, level: int) -> List[str]:
+		"""
+		:return: A new list of the players in the permission group. Modifying it does not affect the storage
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def get_players(self) -> Set[str]:
+		raise NotImplementedError()
+
+	@abstractmethod
+	def add_player(self, player: str, level: int):
+		raise NotImplementedError()
+
+	@abstractmethod
+	def remove_player(self, player: str):
+		raise NotImplementedError()
+
+	def close(self):
+		pass
+
+
+class YamlPlayerPermissionStorage(PlayerPermissionStorage):
+	"""
+	Store the players in the group lists of permission.yml. It's the default storage
+	"""
+	def __init__(self, storage: 'PermissionStorage', mark_dirty: Callable[[], Any]):
+		self.__storage = storage
+		self.__mark_dirty = mark_dirty
+		# player -> the highest permission level of the player. It's an index of the permission group lists in the storage
+		self.__player_levels: Dict[str, int] = {}
+
+	@override
+	def reload(self):
+		player_levels: Dict[str, int] = {}
+		with self.__storage.lock:
+			for level_value in PermissionLevel.LEVELS:  # low -> high, so the highest level wins
+				for player in self.get_group_list(level_value):
+					player_levels[player] = level_value
+		self.__player_levels = player_levels
+
+	@override
+	def get_level(self, player: str) -> Optional[int]:
+		return self.__player_levels.get(player)
+
+	@override
+	def get_group_list(self, level: int) -> List[str]:
+		with self.__storage.lock:
+			return list(self.__get_group_list_live(level))
+
+	def __get_group_list_live(self, level: int) -> List[str]:
+		"""
+		The list object in the storage. Lock of the storage is required
+		"""
+		level_name = PermissionLevel.from_value(level).name
+		if self.__storage[level_name] is None:
+			self.__storage[level_name] = []
+		return self.__storage[level_name]
+
+	@override
+	def get_players(self) -> Set[str]:
+		return set(self.__player_levels.keys())
+
+	@override
+	def add_player(self, player: str, level: int):
+		with self.__storage.lock:
+			self.__get_group_list_live(level).append(player)
+			self.__player_levels[player] = max(level, self.__player_levels.get(player, level))
+		self.__mark_dirty()
+
+	@override
+	def remove_player(self, player: str):
+		with self.__storage.lock:
+			if self.__player_levels.pop(player, None) is not None:
+				for level_value in PermissionLevel.LEVELS:
+					group_list = self.__get_group_list_live(level_value)
+					while player in group_list:
+						group_list.remove(player)
+		self.__mark_dirty()
+
+
+class SqlitePlayerPermissionStorage(PlayerPermissionStorage):
+	"""
+	Store the players in a sqlite database, indexed by the player name. Every modification is an incremental upsert
+
+	On creation of the database, players in the group lists of permission.yml are migrated into the database
+	"""
+	def __init__(self, db_path: Path, storage: 'PermissionStorage'):
+		self.__storage = storage
+		self.__lock = threading.Lock()
+		need_migration = not db_path.is_file()
+		self.__conn = sqlite_utils.open_database(db_path)
+		with self.__lock, self.__conn:
+			self.__conn.execute('CREATE TABLE IF NOT EXISTS player_permission (player TEXT PRIMARY KEY, level INTEGER NOT NULL)')
+			self.__conn.execute('CREATE INDEX IF NOT EXISTS idx_player_permission_level ON player_permission (level)')
+		if need_migration:
+			self.__migrate_from_yaml()
+
+	def __migrate_from_yaml(self):
+		yaml_storage = YamlPlayerPermissionStorage(self.__storage, lambda: None)
+		yaml_storage.reload()
+		rows = [(player, yaml_storage.get_level(player)) for player in yaml_storage.get_players()]
+		with self.__lock, self.__conn:
+			self.__conn.executemany('INSERT OR REPLACE INTO player_permission (player, level) VALUES (?, ?)', rows)
+
+	@override
+	def reload(self):
+		pass  # the database is the source of truth
+
+	@override
+	def get_level(self, player: str) -> Optional[int]:
+		with self.__lock:
+			row = self.__conn.execute('SELECT level FROM player_permission WHERE player = ?', (player,)).fetchone()
+		return row[0] if row is not None else None
+
+	@override
+	def get_group_list(self, level: int) -> List[str]:
+		with self.__lock:
+			rows = self.__conn.execute('SELECT player FROM player_permission WHERE level = ? ORDER BY rowid', (level,)).fetchall()
+		return [row[0] for row in rows]
+
+	@override
+	def get_players(self) -> Set[str]:
+		with self.__lock:
+			rows = self.__conn.execute('SELECT player FROM player_permission').fetchall()
+		return {row[0] for row in rows}
+
+	@override
+	def add_player(self, player: str, level: int):
+		with self.__lock, self.__conn:
+			self.__conn.execute(
+				'INSERT INTO player_permission (player, level) VALUES (?, ?) ON CONFLICT (player) DO UPDATE SET level = max(level, excluded.level)',
+				(player, level),
+			)
+
+	@override
+	def remove_player(self, player: str):
+		with self.__lock, self.__conn:
+			self.__conn.execute('DELETE FROM player_permission WHERE player = ?', (player,))
+
+	@override
+	def close(self):
+		with self.__lock:
+			self.__conn.close()
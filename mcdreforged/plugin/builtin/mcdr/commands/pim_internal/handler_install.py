@@ -6,7 +6,6 @@ import shlex
 import shutil
 import subprocess
 import threading
-import time
 from pathlib import Path
 from typing import Optional, List, TYPE_CHECKING, Dict
 
@@ -411,9 +410,9 @@ class PimInstallCommandHandler(PimCommandHandlerBase):
 
 		# download
 		base_dir = Path(self.server_interface.get_data_folder())
-		self.delete_remaining_download_temp(base_dir)
+		pim_utils.delete_remaining_download_temp(base_dir, self.logger)
 
-		download_temp_dir = base_dir / 'pim_{}'.format(os.getpid())
+		download_temp_dir = base_dir / '{}{}'.format(pim_utils.DOWNLOAD_TEMP_DIR_PREFIX, os.getpid())
 		self.log_debug('download_temp_dir: {}'.format(download_temp_dir))
 		if not ctx.dry_run and download_temp_dir.is_dir():
 			shutil.rmtree(download_temp_dir)
@@ -561,19 +560,6 @@ class PimInstallCommandHandler(PimCommandHandlerBase):
 	#               Interfaces for PIM
 	# ------------------------------------------------
 
-	def delete_remaining_download_temp(self, data_dir: Optional[Path] = None):
-		if data_dir is None:
-			data_dir = Path(self.server_interface.get_data_folder())
-		for name in os.listdir(data_dir):
-			dl_path = data_dir / name
-			try:
-				if dl_path.name.startswith('pim_') and dl_path.is_dir():
-					if time.time() - dl_path.stat().st_mtime > 24 * 60 * 60:  # > 1day
-						shutil.rmtree(dl_path)
-						self.logger.info('Deleting old download temp dir {}'.format(dl_path))
-			except OSError as e:
-				self.logger.error('Error deleting renaming download temp dir {}: {}'.format(dl_path, e))
-
 	def try_prepare_for_duplicated_input(self, source: CommandSource, op_thread: Optional[threading.Thread]) -> bool:
 		sis = self.__install_source
 		if sis is not None and sis == source:
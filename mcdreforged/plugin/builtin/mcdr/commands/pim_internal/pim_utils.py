@@ -1,23 +1,46 @@
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
 from typing import Optional, TYPE_CHECKING, Callable
 
-import resolvelib
-
 from mcdreforged.command.command_source import CommandSource
 from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.plugin_requirement_source import PluginRequirementSource
-from mcdreforged.plugin.installer.dependency_resolver import PluginRequirement
 from mcdreforged.plugin.meta.version import VersionRequirement
 from mcdreforged.translation.translator import Translator
 
 if TYPE_CHECKING:
+	from mcdreforged.plugin.installer.dependency_resolver import PluginRequirement
 	from mcdreforged.plugin.plugin_manager import PluginManager
 	from mcdreforged.plugin.type.plugin import AbstractPlugin
 
+# Notes: the dependency resolver and resolvelib are imported on demand,
+# since this module is also used on MCDR startup, where the installer is not needed yet
 
 INDENT = ' ' * 4
 CONFIRM_WAIT_TIMEOUT = 60  # seconds
+DOWNLOAD_TEMP_DIR_PREFIX = 'pim_'
+DOWNLOAD_TEMP_DIR_MAX_AGE = 24 * 60 * 60  # seconds
+
 
+def delete_remaining_download_temp(data_dir: Path, logger: logging.Logger):
+	"""
+	Delete the download temp directories that are left by previous installations for a long time
+	"""
+	for name in os.listdir(data_dir):
+		dl_path = data_dir / name
+		try:
+			if dl_path.name.startswith(DOWNLOAD_TEMP_DIR_PREFIX) and dl_path.is_dir():
+				if time.time() - dl_path.stat().st_mtime > DOWNLOAD_TEMP_DIR_MAX_AGE:
+					shutil.rmtree(dl_path)
+					logger.info('Deleting old download temp dir {}'.format(dl_path))
+		except OSError as e:
+			logger.error('Error deleting renaming download temp dir {}: {}'.format(dl_path, e))
 
-def as_requirement(plugin: 'AbstractPlugin', op: Optional[str], **kwargs) -> PluginRequirement:
+
+def as_requirement(plugin: 'AbstractPlugin', op: Optional[str], **kwargs) -> 'PluginRequirement':
+	from mcdreforged.plugin.installer.dependency_resolver import PluginRequirement
 	if op is not None:
 		req = op + str(plugin.get_version())
 	else:
@@ -33,10 +56,12 @@ def show_resolve_error(
 		source: 'CommandSource', err: Exception,
 		pim_tr: Translator, plugin_manager: 'PluginManager',
 		*,
-		req_src_getter: Optional[Callable[[PluginRequirement], Optional['PluginRequirementSource']]] = None
+		req_src_getter: Optional[Callable[['PluginRequirement'], Optional['PluginRequirementSource']]] = None
 ):
+	import resolvelib
+
 	if req_src_getter is None:
-		def req_src_getter(_: PluginRequirement) -> Optional['PluginRequirementSource']:
+		def req_src_getter(_: 'PluginRequirement') -> Optional['PluginRequirementSource']:
 			return None
 	if isinstance(err, resolvelib.ResolutionImpossible):
 		source.reply(pim_tr('install.resolution.impossible'))
@@ -46,7 +71,7 @@ def show_resolve_error(
 			if cause in showed_causes:
 				continue
 			showed_causes.add(cause)
-			cause_req: PluginRequirement = cause.requirement
+			cause_req: 'PluginRequirement' = cause.requirement
 			req_src = req_src_getter(cause_req)
 			if cause.parent is not None or req_src is None:
 				source.reply(INDENT + pim_tr('install.resolution.impossible_requirements', cause.parent, cause_req))
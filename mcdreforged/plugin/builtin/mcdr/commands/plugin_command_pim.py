@@ -5,7 +5,7 @@ import os
 import re
 import threading
 from pathlib import Path
-from typing import Optional, List, TYPE_CHECKING, Iterable, Callable, Set, Any
+from typing import Optional, List, TYPE_CHECKING, Iterable, Callable, Set, Any, Dict, Type, TypeVar, cast
 
 from typing_extensions import override, deprecated
 
@@ -17,20 +17,20 @@ from mcdreforged.command.command_source import CommandSource
 from mcdreforged.mcdr_config import MCDReforgedConfig
 from mcdreforged.plugin.builtin.mcdr.commands.pim_internal import pim_utils
 from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.exceptions import OuterReturn
-from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_browse import PimBrowseCommandHandler
-from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_check_update import PimCheckUpdateCommandHandler
-from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_freeze import PimFreezeCommandHandler
-from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_install import PimInstallCommandHandler
 from mcdreforged.plugin.builtin.mcdr.commands.sub_command import SubCommand, SubCommandEvent
 from mcdreforged.plugin.installer.meta_holder import PersistCatalogueMetaRegistryHolder
-from mcdreforged.plugin.installer.types import MetaRegistry
 from mcdreforged.translation.translator import Translator
 from mcdreforged.utils import misc_utils
 
 if TYPE_CHECKING:
+	from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_base import PimCommandHandlerBase
+	from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_install import PimInstallCommandHandler
 	from mcdreforged.plugin.builtin.mcdr.mcdreforged_plugin import MCDReforgedPlugin
+	from mcdreforged.plugin.installer.types import MetaRegistry
 	from mcdreforged.plugin.plugin_manager import PluginManager
 
+_H = TypeVar('_H', bound='PimCommandHandlerBase')
+
 
 @dataclasses.dataclass
 class _OperationHolder:
@@ -88,10 +88,10 @@ class PluginCommandPimExtension(SubCommand):
 			meta_cache_ttl=self.mcdr_server.config.catalogue_meta_cache_ttl,
 		)
 		self.__tr = mcdr_plugin.get_translator().create_child('mcdr_command.pim')
-		self.__browse_handler = PimBrowseCommandHandler(self)
-		self.__check_update_handler = PimCheckUpdateCommandHandler(self)
-		self.__install_handler = PimInstallCommandHandler(self)
-		self.__freeze_handler = PimFreezeCommandHandler(self)
+		# the command handlers are created on first use, since the installer modules they use are slow to import
+		self.__handlers: Dict[type, 'PimCommandHandlerBase'] = {}
+		self.__handlers_lock = threading.RLock()
+		self.__install_handler: Optional['PimInstallCommandHandler'] = None
 
 		self.mcdr_server.add_config_changed_callback(self.__on_mcdr_config_loaded)
 
@@ -111,6 +111,19 @@ class PluginCommandPimExtension(SubCommand):
 	def pim_tr(self) -> Translator:
 		return self.__tr
 
+	def __get_handler(self, handler_class: Type[_H]) -> _H:
+		with self.__handlers_lock:
+			handler = self.__handlers.get(handler_class)
+			if handler is None:
+				handler = self.__handlers[handler_class] = handler_class(self)
+			return cast(_H, handler)
+
+	def __get_install_handler(self) -> 'PimInstallCommandHandler':
+		from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_install import PimInstallCommandHandler
+		with self.__handlers_lock:
+			self.__install_handler = self.__get_handler(PimInstallCommandHandler)
+			return self.__install_handler
+
 	@override
 	@deprecated('use get_command_child_nodes instead')
 	def get_command_node(self) -> Literal:
@@ -236,19 +249,23 @@ class PluginCommandPimExtension(SubCommand):
 	@override
 	def on_load(self):
 		self.__meta_holder.init()
-		self.__install_handler.delete_remaining_download_temp()
+		pim_utils.delete_remaining_download_temp(Path(self.server_interface.get_data_folder()), self.logger)
 
 	@override
 	def on_mcdr_stop(self):
 		self.__meta_holder.terminate()
-		self.__install_handler.on_mcdr_stop()
+		# if the install handler hasn't been created, there's no installation to abort
+		if (install_handler := self.__install_handler) is not None:
+			install_handler.on_mcdr_stop()
 		thread = self.current_operation.thread
 		if thread is not None:
 			thread.join(timeout=pim_utils.CONFIRM_WAIT_TIMEOUT + 1)
 
 	@override
 	def on_event(self, source: Optional[CommandSource], event: SubCommandEvent) -> bool:
-		is_handled = self.__install_handler.on_event(source, event)
+		if (install_handler := self.__install_handler) is None:
+			return False
+		is_handled = install_handler.on_event(source, event)
 		return is_handled
 
 	@property
@@ -259,7 +276,7 @@ class PluginCommandPimExtension(SubCommand):
 	def plugin_manager(self) -> 'PluginManager':
 		return self.mcdr_plugin.plugin_manager
 
-	def get_cata_meta(self, source: CommandSource, ignore_ttl: bool) -> MetaRegistry:
+	def get_cata_meta(self, source: CommandSource, ignore_ttl: bool) -> 'MetaRegistry':
 		has_start_fetch = False
 
 		def start_fetch_callback(no_skip: bool):
@@ -289,7 +306,7 @@ class PluginCommandPimExtension(SubCommand):
 			op_func: Callable, op_key: str, op_thread: Optional[threading.Thread], new_op_key: str,
 	):
 		if op_func == type(self).cmd_install_plugins:
-			if self.__install_handler.try_prepare_for_duplicated_input(source, op_thread):
+			if self.__get_install_handler().try_prepare_for_duplicated_input(source, op_thread):
 				self.cmd_install_plugins(source, context)
 				return
 
@@ -303,11 +320,13 @@ class PluginCommandPimExtension(SubCommand):
 
 	@plugin_installer_guard('browse')
 	def cmd_browse_catalogue(self, source: CommandSource, context: CommandContext):
-		self.__browse_handler.process(source, context)
+		from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_browse import PimBrowseCommandHandler
+		self.__get_handler(PimBrowseCommandHandler).process(source, context)
 
 	@plugin_installer_guard('check_update')
 	def cmd_check_update(self, source: CommandSource, context: CommandContext):
-		self.__check_update_handler.process(source, context)
+		from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_check_update import PimCheckUpdateCommandHandler
+		self.__get_handler(PimCheckUpdateCommandHandler).process(source, context)
 
 	@plugin_installer_guard('refreshmeta')
 	def cmd_refresh_meta(self, source: CommandSource, _: CommandContext):
@@ -315,7 +334,8 @@ class PluginCommandPimExtension(SubCommand):
 
 	@plugin_installer_guard('install')
 	def cmd_install_plugins(self, source: CommandSource, context: CommandContext):
-		self.__install_handler.process(source, context)
+		self.__get_install_handler().process(source, context)
 
 	def cmd_freeze_installed_plugins(self, source: CommandSource, context: CommandContext):
-		self.__freeze_handler.process(source, context)
+		from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_freeze import PimFreezeCommandHandler
+		self.__get_handler(PimFreezeCommandHandler).process(source, context)
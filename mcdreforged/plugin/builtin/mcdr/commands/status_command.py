@@ -76,5 +76,6 @@ class StatusCommand(SubCommand):
 
 		qsizes = self.mcdr_server.task_executor.get_queue_sizes()
 		source.reply(self.tr('mcdr_command.print_mcdr_status.extra.queue_info', qsizes[TaskPriority.INFO], core_constant.MAX_TASK_QUEUE_SIZE_INFO))
+		source.reply(self.tr('mcdr_command.print_mcdr_status.extra.queue_command', qsizes[TaskPriority.COMMAND], core_constant.MAX_TASK_QUEUE_SIZE_COMMAND))
 		source.reply(self.tr('mcdr_command.print_mcdr_status.extra.queue_regular', qsizes[TaskPriority.REGULAR], core_constant.MAX_TASK_QUEUE_SIZE_REGULAR))
 		source.reply(self.tr('mcdr_command.print_mcdr_status.extra.thread', threading.active_count()))
@@ -91,7 +91,7 @@ class SubCommand(ABC):
 
 	@staticmethod
 	def public_command_root(literal) -> Literal:
-		return Literal(literal).requires(Requirements.has_permission(PermissionLevel.USER))
+		return Literal(literal).requires(Requirements.has_permission(PermissionLevel.USER), pure=True)
 
 	@staticmethod
 	def can_see_rtext(source: CommandSource) -> bool:
@@ -105,7 +105,7 @@ class MCDReforgedPlugin(BuiltinPlugin):
 	def __register_commands(self):
 		main_root = (
 			Literal(self.control_command_prefix).
-			requires(Requirements.has_permission(PermissionLevel.USER)).
+			requires(Requirements.has_permission(PermissionLevel.USER), pure=True).
 			runs(self.process_mcdr_command).
 			on_error(RequirementNotMet, self.on_mcdr_command_permission_denied, handled=True).
 			on_error(UnknownArgument, self.on_mcdr_command_unknown_argument).
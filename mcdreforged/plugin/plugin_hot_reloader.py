@@ -0,0 +1,162 @@
+"""
+Reload plugins automatically when their files are modified
+"""
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Set, List, Callable
+
+from typing_extensions import override
+
+from mcdreforged.constants import plugin_constant
+from mcdreforged.executor.background_thread_executor import BackgroundThreadExecutor
+from mcdreforged.logging.debug_option import DebugOption
+from mcdreforged.mcdr_config import MCDReforgedConfig
+from mcdreforged.plugin.type.directory_plugin import LinkedDirectoryPlugin
+from mcdreforged.plugin.type.regular_plugin import RegularPlugin
+from mcdreforged.utils import path_utils
+from mcdreforged.utils.file_watcher import FileWatcher, create_file_watcher
+
+if TYPE_CHECKING:
+	from mcdreforged.mcdr_server import MCDReforgedServer
+	from mcdreforged.plugin.plugin_manager import PluginManager
+
+
+class _PluginFileWatcherThread(BackgroundThreadExecutor):
+	def __init__(self, mcdr_server: 'MCDReforgedServer', watcher: FileWatcher, watch_roots_getter: Callable[[], List[Path]]):
+		super().__init__(mcdr_server.logger)
+		self.set_name('PluginFileWatcher')
+		self.mcdr_server = mcdr_server
+		self.plugin_manager: 'PluginManager' = mcdr_server.plugin_manager
+		self.__tr = mcdr_server.create_internal_translator('plugin_hot_reloader').tr
+		self.__watcher = watcher
+		self.__watch_roots_getter = watch_roots_getter
+		self.__pending_changes: Set[Path] = set()
+		self.__last_change_time = 0.0
+
+	@override
+	def loop(self):
+		try:
+			super().loop()
+		finally:
+			self.__watcher.close()
+
+	@override
+	def tick(self):
+		try:
+			self.__watcher.set_roots(self.__watch_roots_getter())
+			changes = self.__watcher.poll(plugin_constant.PLUGIN_HOT_RELOAD_POLL_TIMEOUT_SEC)
+		except Exception:
+			self.logger.exception('Error watching plugin files')
+			self._wait_for_stop(plugin_constant.PLUGIN_HOT_RELOAD_POLLING_INTERVAL_SEC)
+			return
+		now = time.monotonic()
+		if len(changes) > 0:
+			self.__pending_changes.update(changes)
+			self.__last_change_time = now
+
+		# debounce: wait until there's no more file change for a while, e.g. a file copy or a git checkout is done
+		if len(self.__pending_changes) > 0 and now - self.__last_change_time >= plugin_constant.PLUGIN_HOT_RELOAD_DEBOUNCE_SEC:
+			changes, self.__pending_changes = self.__pending_changes, set()
+			# plugin states are only accessed in the task executor thread, same as other plugin manipulations
+			self.mcdr_server.task_executor.submit(lambda: self.__reload_changed_plugins(changes))
+
+	def __get_affected_plugins(self, changes: Set[Path]) -> List[RegularPlugin]:
+		affected_plugins = []
+		for plugin in self.plugin_manager.get_regular_plugins():
+			roots = {plugin.plugin_path.absolute()}
+			if isinstance(plugin, LinkedDirectoryPlugin):
+				roots.add(plugin.target_plugin_path.absolute())
+			# a changed directory containing the plugin also counts, e.g. the watch roots are reported when the watcher lost events.
+			# False positives are fine, since they will be filtered by file_changed()
+			if any(path == root or path_utils.is_relative_to(path, root) or path_utils.is_relative_to(root, path) for path in changes for root in roots):
+				affected_plugins.append(plugin)
+		return affected_plugins
+
+	def __reload_changed_plugins(self, changes: Set[Path]):
+		if not self.should_keep_looping():
+			return
+		self.mcdr_server.logger.mdebug('Plugin file changes: {}'.format(sorted(map(str, changes))), option=DebugOption.PLUGIN)
+
+		to_reload: List[RegularPlugin] = []
+		to_unload: List[RegularPlugin] = []
+		for plugin in self.__get_affected_plugins(changes):
+			if not plugin.file_exists():
+				to_unload.append(plugin)
+			elif plugin.file_changed():
+				to_reload.append(plugin)
+		if len(to_reload) + len(to_unload) == 0:
+			return
+
+		self.mcdr_server.logger.info(self.__tr('detected', ', '.join(map(str, to_reload + to_unload))))
+		self.plugin_manager.manipulate_plugins(reload=to_reload, unload=to_unload)
+
+
+class PluginHotReloader:
+	"""
+	Watch the plugin directories, and reload the changed plugins and their dependents automatically.
+	Switched by the config option "plugin_hot_reload"
+	"""
+	def __init__(self, mcdr_server: 'MCDReforgedServer'):
+		self.mcdr_server = mcdr_server
+		self.logger = mcdr_server.logger
+		self.__tr = mcdr_server.create_internal_translator('plugin_hot_reloader').tr
+		self.__lock = threading.Lock()
+		self.__started = False
+		self.__thread: Optional[_PluginFileWatcherThread] = None
+		# the plugin list can only be accessed on the task executor thread, so a snapshot is made for the watcher thread
+		self.__watch_roots_lock = threading.Lock()
+		self.__linked_plugin_targets: List[Path] = []
+
+		mcdr_server.add_config_changed_callback(self.__on_mcdr_config_loaded)
+
+	def __on_mcdr_config_loaded(self, config: MCDReforgedConfig, log: bool):
+		with self.__lock:
+			if self.__started:
+				self.__apply(config.plugin_hot_reload, log)
+
+	def __apply(self, enabled: bool, log: bool):
+		if enabled and self.__thread is None:
+			watcher = create_file_watcher(plugin_constant.PLUGIN_HOT_RELOAD_POLLING_INTERVAL_SEC)
+			self.__thread = _PluginFileWatcherThread(self.mcdr_server, watcher, self.__get_watch_roots)
+			self.__thread.start()
+			if log:
+				self.logger.info(self.__tr('enabled', type(watcher).__name__))
+		elif not enabled and self.__thread is not None:
+			self.__thread.stop()
+			self.__thread = None
+			if log:
+				self.logger.info(self.__tr('disabled'))
+
+	def __get_watch_roots(self) -> List[Path]:
+		with self.__watch_roots_lock:
+			linked_plugin_targets = self.__linked_plugin_targets
+		return [*self.mcdr_server.plugin_manager.plugin_directories, *linked_plugin_targets]
+
+	def on_plugins_changed(self):
+		"""
+		Update the snapshot of the linked plugin targets to watch. It should be invoked on the task executor thread after plugin manipulations
+		"""
+		linked_plugin_targets = [
+			plugin.target_plugin_path
+			for plugin in self.mcdr_server.plugin_manager.get_regular_plugins()
+			if isinstance(plugin, LinkedDirectoryPlugin)
+		]
+		with self.__watch_roots_lock:
+			self.__linked_plugin_targets = linked_plugin_targets
+
+	def is_running(self) -> bool:
+		return self.__thread is not None
+
+	def start(self):
+		"""
+		Start watching if it's enabled in the config. It should be invoked after plugins are loaded on MCDR start
+		"""
+		with self.__lock:
+			self.__started = True
+			self.__apply(self.mcdr_server.config.plugin_hot_reload, True)
+
+	def stop(self):
+		with self.__lock:
+			self.__started = False
+			self.__apply(False, False)
@@ -7,11 +7,11 @@ import functools
 import os
 import queue
 import threading
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from contextvars import ContextVar
 from pathlib import Path
-from typing import Callable, Dict, Optional, Any, Tuple, List, TYPE_CHECKING, Set, cast
+from typing import Callable, Dict, Optional, Any, Tuple, List, TYPE_CHECKING, Set, cast, TypeVar
 
 from mcdreforged.constants import plugin_constant
 from mcdreforged.logging.debug_option import DebugOption
@@ -30,11 +30,16 @@ from mcdreforged.plugin.type.plugin import AbstractPlugin
 from mcdreforged.plugin.type.regular_plugin import RegularPlugin
 from mcdreforged.utils import file_utils, string_utils, class_utils, path_utils, function_utils, future_utils, collection_utils
 from mcdreforged.utils.exception import SelfJoinError, IllegalPluginStructure
+from mcdreforged.utils.file_hash_cache import FileHashCache
+from mcdreforged.utils.serializer import clear_serializer_cache
 from mcdreforged.utils.types.path_like import PathStr
 
 if TYPE_CHECKING:
 	from mcdreforged.mcdr_server import MCDReforgedServer
 
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
 
 class PluginManager:
 	TLS_PLUGIN_KEY = 'current_plugin'
@@ -51,6 +56,8 @@ class PluginManager:
 		self.__plugin_file_paths: Dict[Path, str] = {}
 		# storage for event listeners, help messages and commands
 		self.registry_storage = PluginRegistryStorage(self)
+		# hashes of plugin files, shared by plugin loading, file change detection and PIM
+		self.file_hash_cache = FileHashCache()
 
 		# thread local storage, to store current plugin
 		self.__current_plugin: ContextVar[Optional[AbstractPlugin]] = ContextVar('tls', default=None)
@@ -195,19 +202,39 @@ class PluginManager:
 		else:
 			self.logger.exception(err_msg)
 
-	def __load_plugin(self, file_path: Path) -> Optional[RegularPlugin]:
+	def __preload_plugin(self, file_path: Path) -> Tuple[RegularPlugin, Optional[Exception]]:
+		"""
+		Create the plugin instance from the given file, and load it if it can be loaded concurrently
+		This method does not touch the plugin storage, so it can be executed in a worker thread
+		:return: a tuple of (the plugin instance, the exception raised during loading)
+		"""
+		plugin = plugin_factory.create_regular_plugin(self, file_path)
+		if plugin.is_concurrently_loadable():
+			try:
+				plugin.load()
+			except Exception as e:
+				return plugin, e
+		return plugin, None
+
+	def __load_plugin(self, file_path: Path, preloaded: Optional[Tuple[RegularPlugin, Optional[Exception]]] = None) -> Optional[RegularPlugin]:
 		"""
 		Try to load a plugin from the given file
 		If succeeds, add the plugin to the plugin list, the plugin state will be set to LOADED
 		If fails, nothing will happen
 		:param file_path: The path to the plugin file
+		:param preloaded: Optional. The result of self.__preload_plugin() for the given file, if it has been done already
 		:return: the new plugin instance if succeeds, otherwise None
 		"""
-		plugin = plugin_factory.create_regular_plugin(self, file_path)
-		try:
-			plugin.load()
-		except Exception as e:
-			self.__log_plugin_loading_error(plugin, e, 'load_plugin.fail')
+		if preloaded is None:
+			preloaded = self.__preload_plugin(file_path)
+		plugin, error = preloaded
+		if error is None and plugin.in_states({PluginState.UNINITIALIZED}):
+			try:
+				plugin.load()
+			except Exception as e:
+				error = e
+		if error is not None:
+			self.__log_plugin_loading_error(plugin, error, 'load_plugin.fail')
 			return None
 		else:
 			existed_plugin = self.__plugins.get(plugin.get_id())
@@ -280,27 +307,53 @@ class PluginManager:
 	#   Regular Plugin Collector & Handlers
 	# ---------------------------------------
 
+	@staticmethod
+	def __map_concurrently(func: Callable[[_T], _R], items: List[_T]) -> List['Future[_R]']:
+		"""
+		Apply the function to all items with a short-lived thread pool, and wait for all of them to finish
+		:return: the futures of the results, in the same order as the given items
+		"""
+		if len(items) <= 1:
+			futures: List['Future[_R]'] = []
+			for item in items:
+				future: 'Future[_R]' = Future()
+				try:
+					future.set_result(func(item))
+				except Exception as e:
+					future.set_exception(e)
+				futures.append(future)
+			return futures
+		max_workers = min(len(items), plugin_constant.PLUGIN_LOADING_MAX_WORKERS)
+		with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='PluginLoader') as executor:
+			return [executor.submit(func, item) for item in items]
+
 	def __collect_possible_plugin_file_paths(self) -> List[Path]:
-		paths: List[Path] = []
+		file_paths: List[Path] = []
 		for plugin_directory in self.plugin_directories:
 			if plugin_directory.is_dir():
 				for file in os.listdir(plugin_directory):
-					file_path = plugin_directory / file
-					if plugin_factory.is_plugin(file_path):
-						paths.append(file_path)
+					file_paths.append(plugin_directory / file)
 			else:
 				self.logger.warning('Plugin directory {!r} not found'.format(plugin_directory))
-		return paths
+		# checking the file type needs a few stat calls per file, which can be slow on e.g. network mounted disks
+		futures = self.__map_concurrently(plugin_factory.is_plugin, file_paths)
+		return [file_path for file_path, future in zip(file_paths, futures) if future.result()]
 
 	def __load_given_new_plugins(self, plugin_paths: List[Path]) -> SingleOperationResult:
 		result = SingleOperationResult()
+		new_plugin_paths: List[Path] = []
 		for file_path in plugin_paths:
 			if (ex_pid := self.__plugin_file_paths.get(file_path.absolute())) is not None:
 				self.logger.warning('Skipped loading of an existing plugin {} at {}'.format(ex_pid, file_path))
 				result.fail(file_path)
-				continue
+			else:
+				new_plugin_paths.append(file_path)
 
-			plugin = self.__load_plugin(file_path)
+		# reading metadata, checking requirements etc. of the plugins are done concurrently,
+		# then plugins are added sequentially in the given order, so the results stay deterministic
+		preload_futures = self.__map_concurrently(self.__preload_plugin, new_plugin_paths)
+		for file_path, future in zip(new_plugin_paths, preload_futures):
+			plugin = self.__load_plugin(file_path, future.result())
 			if plugin is None:
 				result.fail(file_path)
 			else:
@@ -512,6 +565,8 @@ class PluginManager:
 		# do remove
 		for plugin in to_be_removed_plugins:
 			plugin.remove()
+		if len(to_be_removed_plugins) > 0 or len(reload_result.success_list) > 0:
+			clear_serializer_cache()  # don't let the cached serializers keep the classes of the old plugin modules alive
 
 		# get ready
 		for plugin in dependency_check_result.success_list:
@@ -533,6 +588,7 @@ class PluginManager:
 
 		self.__update_registry()
 		self.__sort_plugins_by_id()
+		self.file_hash_cache.save()
 
 		return PluginOperationResult(load_result, unload_result, reload_result, dependency_check_result)
 
@@ -9,7 +9,7 @@ from mcdreforged.handler.plugin_provided_server_handler_holder import PluginProv
 from mcdreforged.info_reactor.info_filter import InfoFilter, InfoFilterHolder
 from mcdreforged.minecraft.rtext.text import RTextBase
 from mcdreforged.plugin.plugin_event import EventListener
-from mcdreforged.translation.translation_text import RTextMCDRTranslation
+from mcdreforged.translation.translation_text import RTextMCDRTranslation, clear_translation_cache
 from mcdreforged.utils import translation_utils, class_utils
 from mcdreforged.utils.types.message import TranslationStorage, MessageText, TranslationKeyMappingNested, TranslationKeyMappingRich
 
@@ -112,6 +112,7 @@ class PluginRegistry(_BasePluginRegistry):
 		# Translation should be updated immediately
 		translation_utils.update_storage(self._translations, language, mapping)
 		translation_utils.update_storage(self.target_storage._translations, language, mapping)
+		clear_translation_cache()
 
 	def register_server_handler(self, server_handler: 'ServerHandler'):
 		self._server_handler = server_handler
@@ -132,6 +133,7 @@ class PluginRegistryStorage(_BasePluginRegistry):
 	def clear(self):
 		super().clear()
 		self.__pch = None
+		clear_translation_cache()
 
 	def collect(self, plugin: 'AbstractPlugin', plugin_registry: _BasePluginRegistry):
 		for event_id, plg_listeners in plugin_registry._event_listeners.items():
@@ -154,6 +156,7 @@ class PluginRegistryStorage(_BasePluginRegistry):
 		self._help_messages.sort()
 		for listeners in self._event_listeners.values():
 			listeners.sort()
+		clear_translation_cache()  # translations are fully collected
 
 	def export_commands(self, exporter: Callable[[PluginCommandHolder], Any]):
 		for pch in self._command_roots:
@@ -0,0 +1,330 @@
+import contextlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, TypeVar, overload, TYPE_CHECKING, cast
+
+from mcdreforged.constants import plugin_constant
+from mcdreforged.executor.write_behind_saver import WriteBehindSaver
+from mcdreforged.utils import sqlite_utils
+from mcdreforged.utils.exception import IllegalStateError
+from mcdreforged.utils.serializer import serialize, deserialize
+
+if TYPE_CHECKING:
+	from mcdreforged.logging.logger import MCDReforgedLogger
+
+T = TypeVar('T')
+_MISSING = object()
+_DELETED = None  # the pending value of a deleted key
+
+
+def _dump_value(value: Any) -> str:
+	return json.dumps(serialize(value), ensure_ascii=False, separators=(',', ':'))
+
+
+def _load_value(data: str, target_class: Optional[Type[T]]) -> Any:
+	value = json.loads(data)
+	if target_class is not None:
+		value = deserialize(value, target_class)
+	return value
+
+
+def _get_prefix_upper_bound(prefix: str) -> Optional[str]:
+	"""
+	Return the smallest string that is larger than all strings starting with the prefix,
+	or None if there's no such string
+	"""
+	while len(prefix) > 0:
+		if ord(prefix[-1]) < 0x10FFFF:
+			return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+		prefix = prefix[:-1]
+	return None
+
+
+class PluginDataStore:
+	"""
+	A persistent key-value store for plugin data, backed by a sqlite database in the :meth:`data folder
+	<mcdreforged.plugin.si.plugin_server_interface.PluginServerInterface.get_data_folder>` of the plugin.
+	Use :meth:`~mcdreforged.plugin.si.plugin_server_interface.PluginServerInterface.get_data_store` to get one
+
+	Keys are strings. Values can be anything that :func:`~mcdreforged.utils.serializer.serialize` supports,
+	and they are stored in their serialized json form
+
+	Modifications are visible immediately, and are written into the database in batch by a background thread shortly after.
+	Use :meth:`flush` if you need the modifications to be persisted right now.
+	Every batch is written in a single database transaction, so modifications made in one :meth:`transaction` are always persisted together
+
+	The store will be flushed and closed automatically when the plugin unloads
+
+	Example::
+
+		class PlayerData(Serializable):
+			join_count: int = 0
+			home: Optional[List[float]] = None
+
+		def on_player_joined(server: PluginServerInterface, player: str, info: Info):
+			store = server.get_data_store()
+			data = store.get('player.' + player, target_class=PlayerData) or PlayerData()
+			data.join_count += 1
+			store.put('player.' + player, data)
+
+		def list_players(server: PluginServerInterface):
+			for key, data in server.get_data_store().scan('player.', target_class=PlayerData):
+				server.logger.info('{}: {}'.format(key, data.join_count))
+
+	.. versionadded:: v2.16.0
+	"""
+
+	def __init__(self, logger: 'MCDReforgedLogger', db_path: Path):
+		"""
+		:meta private:
+		"""
+		self.__db_path = db_path
+		self.__lock = threading.RLock()
+		# held by modifications. A transaction holds it during the whole with statement,
+		# so the values it reads will not be modified by others before it's applied
+		self.__write_lock = threading.RLock()
+		self.__closed = False
+		# key -> serialized value, or _DELETED. Modifications that are not written into the database yet
+		self.__pending: Dict[str, Optional[str]] = {}
+		self.__conn = sqlite_utils.open_database(db_path)
+		with self.__conn:
+			self.__conn.execute('CREATE TABLE IF NOT EXISTS data (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID')
+		self.__saver = WriteBehindSaver(
+			logger, 'DataStoreSaver@{}'.format(db_path.stem), self.__write_pending,
+			delay=plugin_constant.DATA_STORE_FLUSH_DELAY_SEC,
+			max_delay=plugin_constant.DATA_STORE_FLUSH_MAX_DELAY_SEC,
+		)
+
+	@property
+	def path(self) -> Path:
+		"""
+		The path to the database file
+		"""
+		return self.__db_path
+
+	@property
+	def closed(self) -> bool:
+		"""
+		If the store is closed
+		"""
+		return self.__closed
+
+	def __ensure_open(self):
+		if self.__closed:
+			raise IllegalStateError('Data store {} is closed'.format(self.__db_path))
+
+	def __read_raw(self, key: str) -> Optional[str]:
+		with self.__lock:
+			self.__ensure_open()
+			if (data := self.__pending.get(key, _MISSING)) is not _MISSING:
+				return cast(Optional[str], data)
+			row = self.__conn.execute('SELECT value FROM data WHERE key = ?', (key,)).fetchone()
+		return row[0] if row is not None else None
+
+	def __apply(self, changes: Dict[str, Optional[str]]):
+		if len(changes) == 0:
+			return
+		with self.__write_lock, self.__lock:
+			self.__ensure_open()
+			self.__pending.update(changes)
+		self.__saver.mark_dirty()
+
+	def __write_pending(self):
+		with self.__lock:
+			if self.__closed or len(self.__pending) == 0:
+				return
+			with self.__conn:
+				self.__conn.executemany(
+					'INSERT INTO data (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value',
+					[(key, data) for key, data in self.__pending.items() if data is not _DELETED],
+				)
+				self.__conn.executemany(
+					'DELETE FROM data WHERE key = ?',
+					[(key,) for key, data in self.__pending.items() if data is _DELETED],
+				)
+			self.__pending.clear()
+
+	# ------------
+	#   Querying
+	# ------------
+
+	@overload
+	def get(self, key: str, default: Any = None) -> Any:
+		...
+
+	@overload
+	def get(self, key: str, default: Any = None, *, target_class: Type[T]) -> Optional[T]:
+		...
+
+	def get(self, key: str, default: Any = None, *, target_class: Optional[Type[T]] = None) -> Any:
+		"""
+		Get the value of a key
+
+		:param key: The key to query
+		:param default: The value to return if the key does not exist
+		:keyword target_class: If given, the value will be deserialized into this class with :func:`~mcdreforged.utils.serializer.deserialize`.
+			Otherwise, the value is returned in its serialized form
+		"""
+		data = self.__read_raw(key)
+		if data is None:
+			return default
+		return _load_value(data, target_class)
+
+	def contains(self, key: str) -> bool:
+		"""
+		Check if the key exists in the store
+		"""
+		return self.__read_raw(key) is not None
+
+	def __contains__(self, key: str) -> bool:
+		return self.contains(key)
+
+	@overload
+	def scan(self, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+		...
+
+	@overload
+	def scan(self, prefix: str = '', *, target_class: Type[T]) -> Iterator[Tuple[str, T]]:
+		...
+
+	def scan(self, prefix: str = '', *, target_class: Optional[Type[T]] = None) -> Iterator[Tuple[str, Any]]:
+		"""
+		Iterate through all keys starting with the given prefix, in the ascending order of the keys
+
+		The result is a snapshot at the time this method is invoked
+
+		:param prefix: The prefix of the keys. Default: all keys
+		:keyword target_class: See the *target_class* argument of :meth:`get`
+		:return: An iterator of (key, value) tuples
+		"""
+		upper_bound = _get_prefix_upper_bound(prefix)
+		with self.__lock:
+			self.__ensure_open()
+			if upper_bound is not None:
+				rows = self.__conn.execute('SELECT key, value FROM data WHERE key >= ? AND key < ?', (prefix, upper_bound)).fetchall()
+			else:
+				rows = self.__conn.execute('SELECT key, value FROM data WHERE key >= ?', (prefix,)).fetchall()
+			items = dict(rows)
+			for key, data in self.__pending.items():
+				if key.startswith(prefix):
+					items[key] = data
+		return (
+			(key, _load_value(data, target_class))
+			for key, data in sorted(items.items())
+			if data is not _DELETED
+		)
+
+	# ----------------
+	#   Modification
+	# ----------------
+
+	def put(self, key: str, value: Any):
+		"""
+		Set the value of a key
+
+		:param key: The key to set
+		:param value: The value to set. It needs to be serializable by :func:`~mcdreforged.utils.serializer.serialize`
+		"""
+		self.__apply({key: _dump_value(value)})
+
+	def delete(self, key: str):
+		"""
+		Delete a key from the store. Nothing happens if the key does not exist
+		"""
+		self.__apply({key: _DELETED})
+
+	@contextlib.contextmanager
+	def transaction(self) -> Iterator['DataStoreTransaction']:
+		"""
+		Make a batch of modifications, which will be applied atomically
+
+		If an exception is raised inside the with statement, none of the modifications will be applied
+
+		Modifications from other threads, including other transactions, are blocked until the with statement exits,
+		so values read in the transaction stay unchanged until the transaction is applied.
+		Keep the with statement short
+
+		Example::
+
+			with store.transaction() as txn:
+				txn.put('bank.Steve', txn.get('bank.Steve', 0) - 10)
+				txn.put('bank.Alex', txn.get('bank.Alex', 0) + 10)
+		"""
+		with self.__write_lock:
+			txn = DataStoreTransaction(self)
+			yield txn
+			# noinspection PyProtectedMember
+			self.__apply(txn._changes)
+
+	# --------------
+	#   Life cycle
+	# --------------
+
+	def flush(self):
+		"""
+		Write all modifications into the database now
+		"""
+		self.__saver.flush()
+
+	def close(self):
+		"""
+		Flush and close the store. The store cannot be used after closed
+
+		:meta private:
+		"""
+		self.__saver.stop()
+		with self.__lock:
+			if not self.__closed:
+				self.__closed = True
+				self.__conn.close()
+
+
+class DataStoreTransaction:
+	"""
+	A batch of modifications to a :class:`PluginDataStore`, created by :meth:`PluginDataStore.transaction`
+
+	Reads in the transaction see the modifications made in the transaction.
+	Other threads cannot modify the store until the transaction is applied
+
+	.. versionadded:: v2.16.0
+	"""
+
+	def __init__(self, store: PluginDataStore):
+		"""
+		:meta private:
+		"""
+		self.__store = store
+		self._changes: Dict[str, Optional[str]] = {}
+
+	@overload
+	def get(self, key: str, default: Any = None) -> Any:
+		...
+
+	@overload
+	def get(self, key: str, default: Any = None, *, target_class: Type[T]) -> Optional[T]:
+		...
+
+	def get(self, key: str, default: Any = None, *, target_class: Optional[Type[T]] = None) -> Any:
+		"""
+		See :meth:`PluginDataStore.get`
+		"""
+		if (data := self._changes.get(key, _MISSING)) is _MISSING:
+			if target_class is None:
+				return self.__store.get(key, default)
+			return self.__store.get(key, default, target_class=target_class)
+		if data is _DELETED:
+			return default
+		return _load_value(cast(str, data), target_class)
+
+	def put(self, key: str, value: Any):
+		"""
+		See :meth:`PluginDataStore.put`
+		"""
+		self._changes[key] = _dump_value(value)
+
+	def delete(self, key: str):
+		"""
+		See :meth:`PluginDataStore.delete`
+		"""
+		self._changes[key] = _DELETED
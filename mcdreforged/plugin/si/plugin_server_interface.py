@@ -1,6 +1,9 @@
 import logging
 import os
-from typing import Callable, TYPE_CHECKING, Union, Optional, IO, Type, TypeVar, Any
+import re
+import threading
+from pathlib import Path
+from typing import Callable, TYPE_CHECKING, Union, Optional, IO, Type, TypeVar, Any, Dict
 from typing import Literal as TLiteral
 
 from typing_extensions import override
@@ -15,6 +18,7 @@ from mcdreforged.plugin.meta.metadata import Metadata
 from mcdreforged.plugin.plugin_event import EventListener, LiteralEvent, PluginEvent
 from mcdreforged.plugin.plugin_registry import DEFAULT_LISTENER_PRIORITY, HelpMessage
 from mcdreforged.plugin.si._simple_config_handler import FileFormat, SimpleConfigHandler
+from mcdreforged.plugin.si.plugin_data_store import PluginDataStore
 from mcdreforged.plugin.si.server_interface import ServerInterface
 from mcdreforged.plugin.type.multi_file_plugin import MultiFilePlugin
 from mcdreforged.plugin.type.plugin import AbstractPlugin
@@ -51,6 +55,8 @@ class PluginServerInterface(ServerInterface):
 		super().__init__(mcdr_server)
 		self.__plugin = plugin
 		self.__logger_for_plugin: Optional[MCDReforgedLogger] = None
+		self.__data_stores: Dict[str, PluginDataStore] = {}
+		self.__data_stores_lock = threading.Lock()
 
 	# -----------------------
 	#     Not public APIs
@@ -59,6 +65,16 @@ class PluginServerInterface(ServerInterface):
 	def _reset_on_load(self):
 		self.__logger_for_plugin = None
 
+	def _close_data_stores(self):
+		with self.__data_stores_lock:
+			data_stores = list(self.__data_stores.values())
+			self.__data_stores.clear()
+		for data_store in data_stores:
+			try:
+				data_store.close()
+			except Exception:
+				self._mcdr_server.logger.exception('Failed to close data store {}'.format(data_store.path))
+
 	# -----------------------
 	#   Overwritten methods
 	# -----------------------
@@ -448,3 +464,30 @@ class PluginServerInterface(ServerInterface):
 
 		config_handler = SimpleConfigHandler(file_name, file_format, self.get_data_folder() if in_data_folder else '.')
 		config_handler.save(data, encoding=encoding)
+
+	def get_data_store(self, name: str = 'data') -> PluginDataStore:
+		"""
+		Get a key-value data store for the plugin's runtime data, e.g. player statistics
+
+		Unlike :meth:`save_config_simple`, which rewrites the whole file on every save,
+		the data store only writes the modified keys, in batch, into a sqlite database ``<name>.db`` in the :meth:`data folder <get_data_folder>`
+
+		The same store instance is returned for the same name. Stores are flushed and closed automatically when the plugin unloads
+
+		Example::
+
+			store = server.get_data_store()
+			store.put('counter', store.get('counter', 0) + 1)
+
+		:param name: The name of the data store. It can only contain letters, digits, ``_`` and ``-``
+		:raise ValueError: If the name is invalid
+
+		.. versionadded:: v2.16.0
+		"""
+		if not re.fullmatch(r'[a-zA-Z0-9_\-]+', name):
+			raise ValueError('Invalid data store name {!r}'.format(name))
+		with self.__data_stores_lock:
+			if (data_store := self.__data_stores.get(name)) is None:
+				db_path = Path(self.get_data_folder()) / (name + plugin_constant.DATA_STORE_FILE_SUFFIX)
+				data_store = self.__data_stores[name] = PluginDataStore(self._mcdr_server.logger, db_path)
+			return data_store
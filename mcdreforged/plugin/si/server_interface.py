@@ -4,7 +4,7 @@ import logging
 import threading
 from concurrent.futures import Future
 from pathlib import Path
-from typing import Callable, TYPE_CHECKING, Tuple, Any, Union, Optional, List, Dict, overload, Literal, Coroutine, TypeVar, cast, Sequence
+from typing import Callable, TYPE_CHECKING, Tuple, Any, Union, Optional, List, Dict, overload, Literal, Coroutine, TypeVar, cast, Sequence, Iterable
 
 import psutil
 
@@ -213,7 +213,7 @@ class ServerInterface:
 		.. versionadded:: v2.1.0
 		"""
 		text = RTextMCDRTranslation(translation_key, *args, **kwargs)
-		text.set_translator(cast(TranslateFunc, self.tr))  # not that necessary tbh, just in case self.tr != ServerInterface.get_instance().tr somehow
+		text.set_translator(cast(TranslateFunc, self.tr), cacheable=True)  # not that necessary tbh, just in case self.tr != ServerInterface.get_instance().tr somehow
 		return text
 
 	def has_translation(self, translation_key: str, *, language: Optional[str] = None, no_auto_fallback: bool = False):
@@ -465,6 +465,39 @@ class ServerInterface:
 		if command is not None:
 			self.execute(command, encoding=encoding)
 
+	def tell_many(self, players: Iterable[str], text: MessageText, *, encoding: Optional[str] = None) -> None:
+		"""
+		Send the message to multiple players. It works like calling :meth:`tell` for each player, but is more efficient
+
+		Players are grouped by their :ref:`preferred language <preference-language>`,
+		the message is rendered only once for each language,
+		and all the generated commands are written into the server's standard input stream at once
+
+		:param players: The names of the players you want to tell
+		:param text: The message you want to send to the players
+		:keyword encoding: The encoding method for the text.
+			Leave it empty to use the encoding method from the configuration of MCDR
+
+		.. versionadded:: v2.16.0
+		"""
+		preference_manager = self._mcdr_server.preference_manager
+		players_by_language: Dict[str, List[str]] = {}
+		for player in players:
+			players_by_language.setdefault(preference_manager.get_preferred_language(player), []).append(player)
+
+		server_handler = self.__server_handler
+		server_information = self.get_server_information()
+		commands: List[str] = []
+		for language, language_players in players_by_language.items():
+			with RTextMCDRTranslation.language_context(language):
+				language_commands: List[str] = server_handler.get_send_message_commands(language_players, text, server_information)
+			commands.extend(language_commands)
+		if len(commands) > 0:
+			logger = self.logger
+			if isinstance(logger, MCDReforgedLogger):  # make type checker happy
+				logger.mdebug('Sending {} commands: {!r}'.format(len(commands), commands), option=DebugOption.PLUGIN)
+			self._mcdr_server.send('\n'.join(commands), encoding=encoding)
+
 	def say(self, text: MessageText, *, encoding: Optional[str] = None) -> None:
 		"""
 		Use command like ``/tellraw @a`` to broadcast the message in game
@@ -2,7 +2,7 @@ import json
 import os
 from abc import ABC
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Collection
+from typing import IO, TYPE_CHECKING, Collection, Optional
 
 from typing_extensions import override
 
@@ -10,6 +10,7 @@ from mcdreforged.constants import plugin_constant
 from mcdreforged.plugin.type.common import PluginType
 from mcdreforged.plugin.type.multi_file_plugin import MultiFilePlugin
 from mcdreforged.utils.exception import IllegalPluginStructure
+from mcdreforged.utils.file_tree_fingerprint import FileTreeFingerprinter, FileTreeFingerprint
 from mcdreforged.utils.serializer import Serializable
 
 if TYPE_CHECKING:
@@ -17,6 +18,26 @@ if TYPE_CHECKING:
 
 
 class _DirectoryPluginBase(MultiFilePlugin, ABC):
+	def __init__(self, plugin_manager: 'PluginManager', file_path: Path):
+		super().__init__(plugin_manager, file_path)
+		self.__fingerprinter = FileTreeFingerprinter()
+		self.__file_tree_fingerprint: Optional[FileTreeFingerprint] = None
+
+	def _calculate_file_tree_fingerprint(self) -> FileTreeFingerprint:
+		"""
+		:raise OSError: if the files cannot be accessed
+		"""
+		return self.__fingerprinter.calculate(self._file_root)
+
+	@override
+	def _reset(self):
+		super()._reset()
+		# calculated before any file is read, so modifications during the loading will be detected in the next check
+		try:
+			self.__file_tree_fingerprint = self._calculate_file_tree_fingerprint()
+		except OSError:
+			self.__file_tree_fingerprint = None
+
 	@override
 	def open_file(self, file_path: str) -> IO[bytes]:
 		return open(self._file_root / file_path, 'rb')
@@ -44,9 +65,12 @@ class _DirectoryPluginBase(MultiFilePlugin, ABC):
 
 	@override
 	def file_changed(self):
-		# It's not that easy to access all files in the directory
-		# So just consider Directory Plugin to be always changed
-		return True
+		if self.__file_tree_fingerprint is None:
+			return True
+		try:
+			return self._calculate_file_tree_fingerprint() != self.__file_tree_fingerprint
+		except OSError:
+			return True
 
 	@override
 	def calculate_file_modify_time(self):
@@ -108,6 +132,13 @@ class LinkedDirectoryPlugin(_DirectoryPluginBase):
 		if not self.__ldp_meta.skip_package_legality_check:
 			super()._check_dir_legality()
 
+	@override
+	def _calculate_file_tree_fingerprint(self) -> FileTreeFingerprint:
+		# the link file decides the target directory, so it's a part of the fingerprint too.
+		# Its absolute path never collides with the relative paths of the files in the tree
+		link_file_stat = os.stat(self.link_file)
+		return ((str(self.link_file), link_file_stat.st_size, link_file_stat.st_mtime_ns), *super()._calculate_file_tree_fingerprint())
+
 	@override
 	def _on_load(self):
 		self.__ldp_meta = self.__read_ldp_meta()
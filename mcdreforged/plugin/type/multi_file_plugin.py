@@ -46,6 +46,11 @@ class MultiFilePlugin(RegularPlugin, ABC):
 		plugin_id = self.get_id()
 		return module_name == plugin_id or module_name.startswith('{}.'.format(plugin_id))
 
+	@override
+	def is_concurrently_loadable(self) -> bool:
+		# only metadata and file structure are read during loading. The entrypoint is imported on ready
+		return True
+
 	@override
 	def _import_entrypoint_module(self) -> ModuleType:
 		mod = importlib.import_module(self.get_metadata().entrypoint)
@@ -1,28 +1,172 @@
 import contextlib
 import functools
+import io
 import os
 import sys
+import threading
 import zipimport
-from io import BytesIO
 from pathlib import Path
-from typing import IO, Collection, TYPE_CHECKING, Optional
-from zipfile import ZipFile
+from typing import IO, Collection, TYPE_CHECKING, Optional, Tuple, BinaryIO, cast
+from zipfile import ZipFile, ZipExtFile
 
 from typing_extensions import override
 
 from mcdreforged.plugin.type.common import PluginType
 from mcdreforged.plugin.type.multi_file_plugin import MultiFilePlugin
-from mcdreforged.utils import path_utils, file_utils
+from mcdreforged.utils import path_utils
 from mcdreforged.utils.exception import IllegalPluginStructure
+from mcdreforged.utils.file_hash_cache import FileFingerprint
 
 if TYPE_CHECKING:
 	from mcdreforged.plugin.plugin_manager import PluginManager
 
 
+class _FileBackedReader:
+	"""
+	A readonly seekable binary file-like object for :class:`ZipFile`. The file content is not kept in memory
+
+	A file handle is only held while there are opened members, see :meth:`acquire`.
+	Otherwise, the file is opened during each read, so no file handle is kept between reads
+	"""
+
+	def __init__(self, file_path: Path):
+		self.name = str(file_path)
+		self.__file_path = file_path
+		stat = file_path.stat()
+		self.__size = stat.st_size
+		self.__fingerprint: Tuple[int, int] = (stat.st_size, stat.st_mtime_ns)
+		self.__pos = 0
+		self.__lock = threading.Lock()
+		self.__handle: Optional[BinaryIO] = None
+		self.__handle_users = 0
+		self.__closed = False
+
+	def seekable(self) -> bool:
+		return True
+
+	def tell(self) -> int:
+		return self.__pos
+
+	def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+		if whence == os.SEEK_SET:
+			pos = offset
+		elif whence == os.SEEK_CUR:
+			pos = self.__pos + offset
+		elif whence == os.SEEK_END:
+			pos = self.__size + offset
+		else:
+			raise ValueError('Invalid whence {!r}'.format(whence))
+		if pos < 0:
+			raise OSError('Invalid seek position {} for {}'.format(pos, self.__file_path))
+		self.__pos = pos
+		return pos
+
+	def __open_handle(self) -> BinaryIO:
+		file_handler = open(self.__file_path, 'rb')
+		try:
+			stat = os.fstat(file_handler.fileno())
+			if (stat.st_size, stat.st_mtime_ns) != self.__fingerprint:
+				raise OSError('File {} has been modified after it was opened'.format(self.__file_path))
+		except BaseException:
+			file_handler.close()
+			raise
+		return file_handler
+
+	def __close_handle(self):
+		if self.__handle is not None:
+			self.__handle.close()
+			self.__handle = None
+
+	def read(self, n: Optional[int] = -1) -> bytes:
+		with self.__lock:
+			if self.__handle is not None:
+				file_handler = self.__handle
+			else:
+				file_handler = self.__open_handle()
+				if self.__handle_users > 0 and not self.__closed:
+					self.__handle = file_handler
+			try:
+				file_handler.seek(self.__pos)
+				data = file_handler.read(n if n is not None and n >= 0 else -1)
+			finally:
+				if file_handler is not self.__handle:
+					file_handler.close()
+		self.__pos += len(data)
+		return data
+
+	def acquire(self):
+		"""
+		Keep the file handle opened between reads, until the corresponding :meth:`release` call.
+		It's used by the opened member files, which usually perform lots of small reads
+		"""
+		with self.__lock:
+			self.__handle_users += 1
+
+	def release(self):
+		with self.__lock:
+			self.__handle_users -= 1
+			if self.__handle_users <= 0:
+				self.__close_handle()
+
+	def close(self):
+		"""
+		Close the file handle, even if there are still opened member files. Further reads will not keep the file handle
+		"""
+		with self.__lock:
+			self.__closed = True
+			self.__close_handle()
+
+
+class _ZipMemberFile(io.BufferedIOBase):
+	"""
+	An opened member file of the zip file, which releases the acquired :class:`_FileBackedReader` on close
+	"""
+
+	def __init__(self, member: ZipExtFile, reader: _FileBackedReader):
+		super().__init__()
+		self.__member = member
+		self.__reader = reader
+
+	@override
+	def readable(self) -> bool:
+		return True
+
+	@override
+	def seekable(self) -> bool:
+		return self.__member.seekable()
+
+	@override
+	def read(self, n: Optional[int] = -1) -> bytes:
+		return self.__member.read(-1 if n is None else n)
+
+	@override
+	def read1(self, n: int = -1) -> bytes:
+		return self.__member.read1(n)
+
+	@override
+	def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+		return self.__member.seek(offset, whence)
+
+	@override
+	def tell(self) -> int:
+		return self.__member.tell()
+
+	@override
+	def close(self):
+		if not self.closed:
+			try:
+				self.__member.close()
+			finally:
+				self.__reader.release()
+				super().close()
+
+
 class PackedPlugin(MultiFilePlugin):
 	def __init__(self, plugin_manager: 'PluginManager', file_path: Path):
 		super().__init__(plugin_manager, file_path)
 		self.__zip_file_cache: Optional[ZipFile] = None
+		self.__zip_reader: Optional[_FileBackedReader] = None
+		self.__file_fingerprint: Optional[FileFingerprint] = None
 		self.__file_sha256: Optional[str] = None
 
 	@override
@@ -32,12 +176,19 @@ class PackedPlugin(MultiFilePlugin):
 	@property
 	def __zip_file(self) -> ZipFile:
 		if self.__zip_file_cache is None:
-			with open(self.plugin_path, 'rb') as file_handler:
-				content = BytesIO()
-				content.write(file_handler.read())
-			self.__zip_file_cache = ZipFile(content)
+			# only the central directory is kept in memory. Members are read from the file on demand
+			self.__zip_reader = _FileBackedReader(self.plugin_path)
+			self.__zip_file_cache = ZipFile(self.__zip_reader)
 		return self.__zip_file_cache
 
+	def __close_zip_file(self):
+		if self.__zip_file_cache is not None:
+			self.__zip_file_cache.close()
+		if self.__zip_reader is not None:
+			self.__zip_reader.close()
+		self.__zip_file_cache = None
+		self.__zip_reader = None
+
 	@classmethod
 	def __format_path(cls, path: str) -> str:
 		return path.replace('\\', '/')
@@ -45,13 +196,21 @@ class PackedPlugin(MultiFilePlugin):
 	@override
 	def _reset(self):
 		super()._reset()
-		if self.__zip_file_cache is not None:
-			self.__zip_file_cache.close()
-		self.__zip_file_cache = None
+		self.__close_zip_file()
 
 	@override
 	def open_file(self, file_path: str) -> IO[bytes]:
-		return self.__zip_file.open(self.__format_path(file_path), 'r')
+		zip_file = self.__zip_file
+		reader = self.__zip_reader
+		assert reader is not None
+		# the file handle is kept for all reads of the member, until the member is closed
+		reader.acquire()
+		try:
+			member = cast(ZipExtFile, zip_file.open(self.__format_path(file_path), 'r'))
+		except BaseException:
+			reader.release()
+			raise
+		return cast(IO[bytes], _ZipMemberFile(member, reader))
 
 	@override
 	def list_directory(self, directory_name: str) -> Collection[str]:
@@ -102,9 +261,24 @@ class PackedPlugin(MultiFilePlugin):
 		self.release_file_occupation()
 
 	@override
-	def _load_entry_instance(self):
-		self.__file_sha256 = file_utils.calc_file_sha256(self.plugin_path)
-		super()._load_entry_instance()
+	def _on_load(self):
+		# hash the file during loading instead of the entrypoint importing, so it can be done concurrently
+		self.__file_fingerprint = FileFingerprint.of(self.plugin_path)
+		self.__file_sha256 = self.plugin_manager.file_hash_cache.get_sha256(self.plugin_path, fingerprint=self.__file_fingerprint)
+		super()._on_load()
+
+	@override
+	def file_changed(self) -> bool:
+		if self.__file_fingerprint is None or self.__file_sha256 is None:
+			return super().file_changed()
+		try:
+			fingerprint = FileFingerprint.of(self.plugin_path)
+			if fingerprint == self.__file_fingerprint:
+				return False
+			# the file might just be touched, or replaced by a file with the same content
+			return self.plugin_manager.file_hash_cache.get_sha256(self.plugin_path, fingerprint=fingerprint) != self.__file_sha256
+		except OSError:
+			return True
 
 	def get_file_sha256(self) -> str:
 		if self.__file_sha256 is None:
@@ -117,6 +291,8 @@ class PackedPlugin(MultiFilePlugin):
 		to prevent the Windows error "The process cannot access the file because it is being used by another process"
 		during operations on the packed plugin file
 		"""
+		# the file handle held by opened member files is closed here. The central directory might also be outdated after the file operation
+		self.__close_zip_file()
 
 		def release_importlib_zip_path_cache():
 			if sys.version_info < (3, 10):
@@ -75,6 +75,13 @@ class RegularPlugin(AbstractPlugin, ABC):
 	def is_own_module(self, module_name: str) -> bool:
 		raise NotImplementedError()
 
+	def is_concurrently_loadable(self) -> bool:
+		"""
+		If method load() executes no plugin code, so it can be done in a worker thread,
+		concurrently with the loading of other plugins
+		"""
+		return False
+
 	def _load_entry_instance(self):
 		self.old_entry_module_instance = self.entry_module_instance
 		with self.plugin_manager.with_plugin_context(self):
@@ -141,6 +148,8 @@ class RegularPlugin(AbstractPlugin, ABC):
 	def unload(self):
 		self.assert_state({PluginState.LOADING, PluginState.LOADED, PluginState.READY})
 		self._on_unload()
+		# noinspection PyProtectedMember
+		self.server_interface._close_data_stores()
 		self.set_state(PluginState.UNLOADING)
 
 	@override
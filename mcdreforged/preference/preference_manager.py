@@ -1,12 +1,13 @@
-import json
+import threading
 from pathlib import Path
 from typing import Literal as TLiteral
-from typing import Optional, Dict, TYPE_CHECKING, Union, overload
+from typing import Optional, Dict, TYPE_CHECKING, Union, overload, Set
 
 from mcdreforged.command.command_source import CommandSource, PlayerCommandSource, ConsoleCommandSource
 from mcdreforged.constants import core_constant, plugin_constant
-from mcdreforged.utils import file_utils
-from mcdreforged.utils.serializer import Serializable, deserialize, serialize
+from mcdreforged.executor.write_behind_saver import WriteBehindSaver
+from mcdreforged.preference.preference_storage import PreferenceStorageBackend, JsonPreferenceStorageBackend, SqlitePreferenceStorageBackend
+from mcdreforged.utils.serializer import Serializable
 
 if TYPE_CHECKING:
 	from mcdreforged.mcdr_server import MCDReforgedServer
@@ -35,24 +36,106 @@ class PreferenceManager:
 		self.logger = mcdr_server.logger
 		self.preferences: PreferenceStorage = {}
 		self.__store_file_path = PREFERENCE_FILE_PATH
+		self.__backend: Optional[PreferenceStorageBackend] = None
+		self.__lock = threading.RLock()
+		self.__dirty_names: Set[str] = set()
+		# modifications are saved in a background thread in batch, so the command thread will not be blocked by file writing
+		self.__saver = WriteBehindSaver(
+			mcdr_server.logger, 'PreferenceSaver', self.__save_dirty_preferences,
+			delay=core_constant.PREFERENCE_SAVE_DELAY_SEC,
+			max_delay=core_constant.PREFERENCE_SAVE_MAX_DELAY_SEC,
+		)
 
-	def load_preferences(self):
+	def __create_backend(self) -> PreferenceStorageBackend:
+		db_path = self.__store_file_path.with_suffix('.db')
+		if self.mcdr_server.config.player_data_storage == 'sqlite':
+			return SqlitePreferenceStorageBackend(db_path, self.__store_file_path)
+		else:
+			backend = JsonPreferenceStorageBackend(self.__store_file_path, journal=True)
+			if db_path.is_file():
+				self.__migrate_from_sqlite(backend, db_path)
+			return backend
+
+	def __migrate_from_sqlite(self, backend: JsonPreferenceStorageBackend, db_path: Path):
+		"""
+		Switched back to the file storage, move the preferences in the database into the json file
+
+		The database is renamed afterward, so a later switch to sqlite migrates from the json file again
+		"""
+		sqlite_backend = SqlitePreferenceStorageBackend(db_path, self.__store_file_path)
 		try:
-			with open(self.__store_file_path, 'r', encoding='utf8') as file:
-				self.preferences = deserialize(json.load(file), PreferenceStorage, error_at_missing=True, error_at_redundancy=True)
-		except Exception as e:
-			if not isinstance(e, FileNotFoundError):
-				self.logger.exception('Failed to load preference file')
-			self.preferences = {}
-			self.__save_preferences()
-
-	def __save_preferences(self):
+			db_preferences = sqlite_backend.load()
+		finally:
+			sqlite_backend.close()
+		try:
+			preferences = backend.load()
+		except FileNotFoundError:
+			preferences = {}
+		preferences.update(db_preferences)  # the database was the source of truth
+		backend.save(preferences, db_preferences.keys())
+		backup_path = db_path.with_name(db_path.name + '.bak')
+		db_path.replace(backup_path)
+		self.logger.info('Migrated {} preferences from {} into {}, the database is renamed to {}'.format(len(db_preferences), db_path, self.__store_file_path, backup_path))
+
+	def load_preferences(self):
+		self.__saver.flush()
+		with self.__lock:
+			self.__close_backend()
+			self.__dirty_names.clear()
+			try:
+				self.__backend = self.__create_backend()
+				self.preferences = self.__backend.load()
+			except Exception as e:
+				if not isinstance(e, FileNotFoundError):
+					self.logger.exception('Failed to load preference file')
+				if self.__backend is None:
+					self.__backend = JsonPreferenceStorageBackend(self.__store_file_path, journal=True)
+				self.preferences = {}
+				try:
+					self.__backend.reset()
+				except Exception:
+					self.logger.exception('Failed to save preference file')
+
+	def __mark_dirty(self, name: str):
+		with self.__lock:
+			self.__dirty_names.add(name)
+		self.__saver.mark_dirty()
+
+	def __save_dirty_preferences(self):
+		with self.__lock:
+			if self.__backend is None or len(self.__dirty_names) == 0:
+				return
+			backend = self.__backend
+			names, self.__dirty_names = self.__dirty_names, set()
+			preferences = self.preferences.copy()
 		try:
-			self.__store_file_path.parent.mkdir(exist_ok=True, parents=True)
-			with file_utils.safe_write(self.__store_file_path, encoding='utf8') as file:
-				json.dump(serialize(self.preferences), file, indent=4, ensure_ascii=False)
+			backend.save(preferences, names)
 		except Exception:
-			self.logger.exception('Failed to save preference file')
+			with self.__lock:
+				self.__dirty_names.update(names)
+			raise
+
+	def __close_backend(self):
+		with self.__lock:
+			if self.__backend is not None:
+				try:
+					self.__backend.close()
+				except Exception:
+					self.logger.exception('Failed to close preference storage')
+				self.__backend = None
+
+	def flush(self):
+		"""
+		Write the pending modifications into the storage now
+		"""
+		self.__saver.flush()
+
+	def close(self):
+		"""
+		Save the pending modifications, and close the storage
+		"""
+		self.__saver.stop()
+		self.__close_backend()
 
 	def get_default_preference(self) -> PreferenceItem:
 		return PreferenceItem(
@@ -89,8 +172,9 @@ class PreferenceManager:
 		if pref is None:
 			pref = self.get_default_preference()
 			if auto_add and name is not None:
-				self.preferences[name] = pref
-				self.__save_preferences()
+				with self.__lock:
+					self.preferences[name] = pref
+				self.__mark_dirty(name)
 		else:
 			pref = pref.copy()
 		return pref
@@ -100,8 +184,9 @@ class PreferenceManager:
 
 	def set_preference(self, obj: PreferenceSource, pref: PreferenceItem):
 		name: str = self.__get_name(obj, strict_type_check=True)
-		self.preferences[name] = pref.copy()
-		self.__save_preferences()
+		with self.__lock:
+			self.preferences[name] = pref.copy()
+		self.__mark_dirty(name)
 
 	def get_preferred_language(self, obj: PreferenceSource) -> str:
 		pref = self.get_preference(obj)
@@ -0,0 +1,186 @@
+"""
+Storages of player preferences
+"""
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, TYPE_CHECKING, Iterable
+
+from typing_extensions import override
+
+from mcdreforged.constants import core_constant
+from mcdreforged.utils import file_utils, sqlite_utils
+from mcdreforged.utils.serializer import deserialize, serialize
+
+if TYPE_CHECKING:
+	from mcdreforged.preference.preference_manager import PreferenceItem
+
+
+class PreferenceStorageBackend(ABC):
+	@abstractmethod
+	def load(self) -> Dict[str, 'PreferenceItem']:
+		"""
+		Load all stored preferences
+
+		:raise FileNotFoundError: If there's nothing stored yet
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def save(self, preferences: Dict[str, 'PreferenceItem'], names: Iterable[str]):
+		"""
+		Save the preferences of the given names
+
+		:param preferences: All preferences
+		:param names: The names whose preference is modified
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def reset(self):
+		"""
+		Remove all stored preferences, e.g. when the stored data is corrupted
+		"""
+		raise NotImplementedError()
+
+	def close(self):
+		pass
+
+
+class JsonPreferenceStorageBackend(PreferenceStorageBackend):
+	"""
+	Store all preferences in a json file. It's the default storage
+
+	With journal enabled, modified preferences are appended to a journal file next to the json file,
+	so a save only writes the modified preferences. The journal is compacted into the json file
+	when it grows larger than the preferences, or when the backend is closed
+	"""
+	def __init__(self, file_path: Path, *, journal: bool = False):
+		self.__file_path = file_path
+		self.__journal_path = file_path.with_suffix('.journal')
+		self.__journal_enabled = journal
+		self.__journal_size = 0
+		self.__preferences: Dict[str, 'PreferenceItem'] = {}
+
+	@override
+	def load(self) -> Dict[str, 'PreferenceItem']:
+		from mcdreforged.preference.preference_manager import PreferenceItem, PreferenceStorage
+		try:
+			with open(self.__file_path, 'r', encoding='utf8') as file:
+				preferences = deserialize(json.load(file), PreferenceStorage, error_at_missing=True, error_at_redundancy=True)
+		except FileNotFoundError:
+			if not self.__journal_path.is_file():
+				raise
+			preferences = {}
+
+		# the journal might exist even if journal is disabled now, e.g. MCDR crashed last time
+		journal_size = 0
+		torn_tail = False
+		if self.__journal_path.is_file():
+			with open(self.__journal_path, 'r', encoding='utf8') as file:
+				content = file.read()
+			# every complete entry ends with a newline. Without it, the last entry was being written when MCDR crashed
+			torn_tail = len(content) > 0 and not content.endswith('\n')
+			lines = content.splitlines()
+			for i, line in enumerate(lines):
+				try:
+					entry = json.loads(line)
+				except ValueError:
+					if torn_tail and i == len(lines) - 1:
+						break  # the incomplete tailing entry
+					raise
+				preferences[entry['name']] = deserialize(entry['preference'], PreferenceItem, error_at_missing=True, error_at_redundancy=True)
+				journal_size += 1
+
+		self.__preferences = preferences
+		self.__journal_size = journal_size
+		# compact a torn journal as well, or the next appended entry would be glued to the incomplete tail
+		if torn_tail or (self.__journal_size > 0 and not self.__journal_enabled):
+			self.__compact()
+		return preferences
+
+	def __compact(self):
+		self.__file_path.parent.mkdir(exist_ok=True, parents=True)
+		with file_utils.safe_write(self.__file_path, encoding='utf8') as file:
+			json.dump(serialize(self.__preferences), file, ensure_ascii=False, separators=(',', ':'))
+		# the journal is removed after the json file is written, so nothing is lost even if MCDR crashes in between
+		self.__journal_path.unlink(missing_ok=True)
+		self.__journal_size = 0
+
+	@override
+	def save(self, preferences: Dict[str, 'PreferenceItem'], names: Iterable[str]):
+		self.__preferences = preferences
+		names = list(names)
+		compaction_size = max(core_constant.PREFERENCE_JOURNAL_MIN_COMPACTION_SIZE, len(preferences))
+		if not self.__journal_enabled or not self.__file_path.is_file() or self.__journal_size + len(names) > compaction_size:
+			self.__compact()
+			return
+
+		with open(self.__journal_path, 'a', encoding='utf8') as file:
+			for name in names:
+				entry = {'name': name, 'preference': serialize(preferences[name])}
+				file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+			file.flush()
+			os.fsync(file.fileno())
+		self.__journal_size += len(names)
+
+	@override
+	def reset(self):
+		# always compact, or an appended journal entry would leave the corrupted json file and journal on the disk
+		self.__preferences = {}
+		self.__compact()
+
+	@override
+	def close(self):
+		if self.__journal_size > 0:
+			self.__compact()
+
+
+class SqlitePreferenceStorageBackend(PreferenceStorageBackend):
+	"""
+	Store preferences in a sqlite database, indexed by the name. A modification only upserts the row of the modified name
+
+	On creation of the database, preferences in the json file are migrated into the database
+	"""
+	def __init__(self, db_path: Path, json_file_path: Path):
+		self.__lock = threading.Lock()
+		need_migration = not db_path.is_file()
+		self.__conn = sqlite_utils.open_database(db_path)
+		with self.__lock, self.__conn:
+			self.__conn.execute('CREATE TABLE IF NOT EXISTS preference (name TEXT PRIMARY KEY, data TEXT NOT NULL)')
+		if need_migration and json_file_path.is_file():
+			self.__migrate_from_json(json_file_path)
+
+	def __migrate_from_json(self, json_file_path: Path):
+		preferences = JsonPreferenceStorageBackend(json_file_path).load()
+		rows = [(name, json.dumps(serialize(pref), ensure_ascii=False)) for name, pref in preferences.items()]
+		with self.__lock, self.__conn:
+			self.__conn.executemany('INSERT OR REPLACE INTO preference (name, data) VALUES (?, ?)', rows)
+
+	@override
+	def load(self) -> Dict[str, 'PreferenceItem']:
+		from mcdreforged.preference.preference_manager import PreferenceItem
+		with self.__lock:
+			rows = self.__conn.execute('SELECT name, data FROM preference').fetchall()
+		return {
+			name: deserialize(json.loads(data), PreferenceItem, error_at_missing=True, error_at_redundancy=True)
+			for name, data in rows
+		}
+
+	@override
+	def save(self, preferences: Dict[str, 'PreferenceItem'], names: Iterable[str]):
+		rows = [(name, json.dumps(serialize(preferences[name]), ensure_ascii=False)) for name in names]
+		with self.__lock, self.__conn:
+			self.__conn.executemany('INSERT INTO preference (name, data) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET data = excluded.data', rows)
+
+	@override
+	def reset(self):
+		with self.__lock, self.__conn:
+			self.__conn.execute('DELETE FROM preference')
+
+	@override
+	def close(self):
+		with self.__lock:
+			self.__conn.close()
@@ -1,6 +1,6 @@
 import dataclasses
 import functools
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from typing_extensions import Self
 
@@ -11,12 +11,17 @@ from mcdreforged.constants import core_constant
 class LanguageFallbackHandler:
 	default_fallback: Optional[str]
 	preferred_fallbacks: Dict[str, List[str]]
-
-	def get_fallbacks(self, language: str) -> List[str]:
-		fallbacks: List[str] = []
-		fallbacks.extend(self.preferred_fallbacks.get(language, []))
-		if self.default_fallback is not None:
-			fallbacks.append(self.default_fallback)
+	__fallbacks_cache: Dict[str, Tuple[str, ...]] = dataclasses.field(default_factory=dict, init=False, repr=False, compare=False)
+
+	def get_fallbacks(self, language: str) -> Tuple[str, ...]:
+		if (fallbacks := self.__fallbacks_cache.get(language)) is None:
+			if len(self.__fallbacks_cache) >= 64:
+				self.__fallbacks_cache.clear()  # languages might come from anywhere, don't let the cache grow unboundedly
+			fallback_list: List[str] = []
+			fallback_list.extend(self.preferred_fallbacks.get(language, []))
+			if self.default_fallback is not None:
+				fallback_list.append(self.default_fallback)
+			fallbacks = self.__fallbacks_cache[language] = tuple(fallback_list)
 		return fallbacks
 
 	@classmethod
@@ -25,6 +30,7 @@ class LanguageFallbackHandler:
 		return cls(default_fallback=None, preferred_fallbacks={})
 
 	@classmethod
+	@functools.lru_cache(maxsize=64)
 	def specified(cls, language: str) -> Self:
 		return cls(default_fallback=language, preferred_fallbacks={})
 
@@ -11,7 +11,9 @@ from ruamel.yaml import YAML
 from mcdreforged.constants import core_constant
 from mcdreforged.minecraft.rtext.text import RTextBase
 from mcdreforged.translation.language_fallback_handler import LanguageFallbackHandler
-from mcdreforged.utils import file_utils, translation_utils
+from mcdreforged.translation.translation_template import TranslationTemplate
+from mcdreforged.translation.translation_text import clear_translation_cache
+from mcdreforged.utils import file_utils, translation_utils, parse_cache
 from mcdreforged.utils.types.message import TranslationStorage, MessageText
 
 if TYPE_CHECKING:
@@ -33,17 +35,24 @@ class TranslationManager:
 		for file_path in file_utils.list_file_with_suffix(MCDR_LANGUAGE_DIRECTORY, core_constant.LANGUAGE_FILE_SUFFIX):
 			language, _ = os.path.basename(file_path).rsplit('.', 1)
 			try:
-				with open(os.path.join(MCDR_LANGUAGE_DIRECTORY, file_path), encoding='utf8') as file_handler:
-					translations: dict = YAML(typ='safe').load(file_handler)
+				translations: dict
+				translations, _ = parse_cache.load_with_cache(MCDR_LANGUAGE_DIRECTORY / file_path, 'yaml_safe', self.__load_yaml_file, lambda data: data)
 				for key, text in translation_utils.unpack_nest_translation(translations).items():
 					self.translations[key][language] = text
 				self.available_languages.add(language)
 				self.logger.mdebug('Loaded translation for {} with {} entries'.format(language, len(translations)))
 			except Exception:
 				self.logger.exception('Failed to load language {} from {!r}'.format(language, file_path))
+		clear_translation_cache()
+
+	@staticmethod
+	def __load_yaml_file(file_path: Path) -> dict:
+		with open(file_path, encoding='utf8') as file_handler:
+			return YAML(typ='safe').load(file_handler)
 
 	def set_language(self, language: str):
 		self.language = language
+		clear_translation_cache()
 		if language not in self.available_languages:
 			self.logger.warning('Setting language to {} with 0 available translation'.format(language))
 
@@ -70,25 +79,21 @@ class TranslationManager:
 			except KeyError:
 				translated_formatter = None
 
-		# Check if there's any rtext inside args and kwargs
-		use_rtext = any([isinstance(e, RTextBase) for e in list(args) + list(kwargs.values())])
-
 		# Processing
 		if translated_formatter is not None:
 			if not isinstance(translated_formatter, str):
 				raise AssertionError('translated_formatter must be a string, got {}'.format(type(translated_formatter)))
 
-			translated_formatter = translated_formatter.strip('\n\r')
+			template = TranslationTemplate.of(translated_formatter)
 			try:
-				if use_rtext:
-					translated_formatter = RTextBase.format(translated_formatter, *args, **kwargs)
-				else:
-					translated_formatter = translated_formatter.format(*args, **kwargs)
+				return template.format(args, kwargs)
 			except Exception as e:
-				raise ValueError('Failed to apply args {} and kwargs {} to translated_text {}: {}'.format(args, kwargs, translated_formatter, e))
-			return translated_formatter
+				raise ValueError('Failed to apply args {} and kwargs {} to translated_text {}: {}'.format(args, kwargs, template.formatter, e))
 		else:
 			if not allow_failure:
 				raise KeyError('Translation key {!r} not found with language {}, fallback_language {}'.format(key, language, fallback_handler))
 			self.logger.error('Error translate text {!r} to language {}'.format(key, language))
+
+			# Check if there's any rtext inside args and kwargs
+			use_rtext = any(isinstance(e, RTextBase) for e in (*args, *kwargs.values()))
 			return key if not use_rtext else RTextBase.from_any(key)
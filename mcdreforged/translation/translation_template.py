@@ -0,0 +1,124 @@
+import functools
+import string
+from typing import List, Union, Optional, NamedTuple, Any
+
+from mcdreforged.minecraft.rtext.text import RTextBase, RTextList
+from mcdreforged.utils.types.message import MessageText
+
+
+class _Field(NamedTuple):
+	key: Union[int, str]
+	conversion: Optional[str]
+	format_spec: str
+
+
+def _convert(value: Any, conversion: Optional[str]) -> Any:
+	if conversion is None:
+		return value
+	elif conversion == 's':
+		return str(value)
+	elif conversion == 'r':
+		return repr(value)
+	elif conversion == 'a':
+		return ascii(value)
+	raise ValueError('Unknown conversion specifier {}'.format(conversion))
+
+
+class TranslationTemplate:
+	"""
+	A translation formatter string that is parsed once and can be formatted many times
+
+	Formatting with plain args is delegated to :meth:`str.format`,
+	while formatting with :class:`~mcdreforged.minecraft.rtext.text.RTextBase` args joins the pre-split
+	literal and placeholder segments directly, instead of going through :meth:`RTextBase.format`
+	"""
+
+	def __init__(self, formatter: str):
+		self.formatter: str = formatter.strip('\n\r')
+		self.__segments: Optional[List[Union[str, _Field]]] = self.__parse(self.formatter)
+
+	@classmethod
+	@functools.lru_cache(maxsize=4096)
+	def of(cls, formatter: str) -> 'TranslationTemplate':
+		"""
+		Get the compiled template of the given formatter string. The compiled result is cached,
+		and the cache is cleared in :func:`~mcdreforged.translation.translation_text.clear_translation_cache`
+		"""
+		return cls(formatter)
+
+	@classmethod
+	def __parse(cls, formatter: str) -> Optional[List[Union[str, _Field]]]:
+		"""
+		:return: The segments, or None if the formatter uses features that are not supported in segment joining,
+			e.g. attribute / item access, nested format spec, or the formatter is malformed
+		"""
+		segments: List[Union[str, _Field]] = []
+		literal_buf: List[str] = []
+		auto_index = 0
+		manual_index_used = False
+		try:
+			for literal_text, field_name, format_spec, conversion in string.Formatter().parse(formatter):
+				literal_buf.append(literal_text)
+				if field_name is None:
+					continue
+				format_spec = format_spec or ''
+				if '.' in field_name or '[' in field_name or '{' in format_spec:
+					return None
+
+				# a decimal field name is an index, just like what str.format does
+				first: Union[int, str] = int(field_name) if field_name.isdecimal() else field_name
+				key: Union[int, str]
+				if first == '':
+					if manual_index_used:
+						return None
+					key = auto_index
+					auto_index += 1
+				else:
+					if isinstance(first, int):
+						if auto_index > 0:
+							return None
+						manual_index_used = True
+					key = first
+
+				if len(literal := ''.join(literal_buf)) > 0:
+					segments.append(literal)
+				literal_buf.clear()
+				segments.append(_Field(key, conversion, format_spec))
+		except ValueError:
+			return None
+		if len(literal := ''.join(literal_buf)) > 0:
+			segments.append(literal)
+		return segments
+
+	def format(self, args: tuple, kwargs: dict) -> MessageText:
+		"""
+		Format the template with given args and kwargs, just like :meth:`RTextBase.format`
+
+		If there's any :class:`~mcdreforged.minecraft.rtext.text.RTextBase` inside args and kwargs, the result will be a RText,
+		otherwise the result will be a regular str
+		"""
+		if not (any(isinstance(arg, RTextBase) for arg in args) or any(isinstance(value, RTextBase) for value in kwargs.values())):
+			return self.formatter.format(*args, **kwargs)
+		if self.__segments is None:
+			return RTextBase.format(self.formatter, *args, **kwargs)
+
+		texts: List[Union[str, RTextBase]] = []
+		str_buf: List[str] = []
+		for segment in self.__segments:
+			if isinstance(segment, str):
+				str_buf.append(segment)
+				continue
+			value = args[segment.key] if isinstance(segment.key, int) else kwargs[segment.key]
+			if isinstance(value, RTextBase):
+				if segment.conversion is not None or len(segment.format_spec) > 0:
+					# let RTextBase.format handle the weird usage
+					return RTextBase.format(self.formatter, *args, **kwargs)
+				if len(s := ''.join(str_buf)) > 0:
+					texts.append(s)
+				str_buf.clear()
+				texts.append(value)
+			else:
+				str_buf.append(format(_convert(value, segment.conversion), segment.format_spec))
+		if len(s := ''.join(str_buf)) > 0:
+			texts.append(s)
+		return RTextList(*texts)
@@ -1,16 +1,37 @@
+import functools
 import threading
 from contextlib import contextmanager
-from typing import Union, Iterable, Optional, List, Callable, Any, cast
+from typing import Union, Iterable, Optional, List, Callable, Any, cast, Tuple, Hashable
 
 from typing_extensions import Self, override, Unpack
 
 from mcdreforged.minecraft.rtext.click_event import RClickEvent
 from mcdreforged.minecraft.rtext.hover_event import RHoverEvent
+from mcdreforged.minecraft.rtext.schema import RTextJsonFormat
 from mcdreforged.minecraft.rtext.style import RColor, RStyle
 from mcdreforged.minecraft.rtext.text import RTextBase, RText
 from mcdreforged.translation.functions import TranslateFunc
+from mcdreforged.translation.translation_template import TranslationTemplate
 from mcdreforged.utils import translation_utils, class_utils, function_utils
-from mcdreforged.utils.types.message import TranslationKeyMappingRich
+from mcdreforged.utils.types.message import TranslationKeyMappingRich, MessageText
+
+
+@functools.lru_cache(maxsize=1024)
+def _translate_cached(tr_func: TranslateFunc, translation_key: str, language: str, typed_args: Tuple[Tuple[type, Any], ...], typed_kwargs: Tuple[Tuple[str, type, Any], ...]) -> MessageText:
+	# argument types are included in the cache key, since 1, True and 1.0 are equal but might be formatted differently
+	args = [arg for _, arg in typed_args]
+	kwargs = {key: value for key, _, value in typed_kwargs}
+	return tr_func(translation_key, *args, **kwargs, _mcdr_tr_language=language)
+
+
+def clear_translation_cache():
+	"""
+	Clear the cached translation results of :class:`RTextMCDRTranslation`
+
+	It should be invoked whenever the translation results might change, e.g. translations got updated
+	"""
+	_translate_cached.cache_clear()
+	TranslationTemplate.of.cache_clear()
 
 
 class RTextMCDRTranslation(RTextBase):
@@ -39,15 +60,24 @@ class RTextMCDRTranslation(RTextBase):
 		self.args = args
 		self.kwargs = kwargs
 		self.__tr_func: TranslateFunc = function_utils.always(RText(self.translation_key))
+		self.__tr_cacheable = False
 		self.__post_process: List[Callable[[RTextBase], Any]] = []
 
 		from mcdreforged.plugin.si.server_interface import ServerInterface
 		server: Optional[ServerInterface] = ServerInterface.get_instance()
 		if server is not None:
-			self.set_translator(cast(TranslateFunc, server.tr))
+			self.set_translator(cast(TranslateFunc, server.tr), cacheable=True)
 
-	def set_translator(self, translate_function: TranslateFunc) -> 'RTextMCDRTranslation':
+	def set_translator(self, translate_function: TranslateFunc, *, cacheable: bool = False) -> 'RTextMCDRTranslation':
+		"""
+		:meta private:
+
+		:param translate_function: The function to translate the text
+		:param cacheable: If the result of the translate function only depends on its arguments and MCDR's translations,
+			so it can be cached when all translation arguments are hashable
+		"""
 		self.__tr_func = translate_function
+		self.__tr_cacheable = cacheable
 		return self
 
 	@classmethod
@@ -55,14 +85,29 @@ class RTextMCDRTranslation(RTextBase):
 		def fake_tr(*_args, **_kwargs):
 			return translation_utils.translate_from_dict(translation_dict, language=_kwargs['_mcdr_tr_language'])
 
+		# not cacheable, the closure is different for every call, so the cache would never be hit
 		return RTextMCDRTranslation('').set_translator(fake_tr)
 
+	def __translate(self, language: str) -> MessageText:
+		if self.__tr_cacheable:
+			typed_args = tuple((type(arg), arg) for arg in self.args)
+			typed_kwargs = tuple((key, type(value), value) for key, value in self.kwargs.items())
+			try:
+				hash((typed_args, typed_kwargs))
+			except TypeError:
+				pass  # unhashable args, e.g. RText, cannot be cached
+			else:
+				translated = _translate_cached(cast(Hashable, self.__tr_func), self.translation_key, language, typed_args, typed_kwargs)
+				if isinstance(translated, RTextBase) and len(self.__post_process) > 0:
+					translated = translated.copy()  # the cached result is shared, don't let post processes modify it
+				return translated
+		return self.__tr_func(self.translation_key, *self.args, **self.kwargs, _mcdr_tr_language=language)
+
 	def __get_translated_text(self) -> RTextBase:
 		language = getattr(self.__TLS, 'language', None)
 		if language is None:
 			language = translation_utils.get_mcdr_language()
-		processed_text = self.__tr_func(self.translation_key, *self.args, **self.kwargs, _mcdr_tr_language=language)
-		processed_text = RTextBase.from_any(processed_text)
+		processed_text = RTextBase.from_any(self.__translate(language))
 		for process in self.__post_process:
 			process(processed_text)
 		return processed_text
@@ -98,6 +143,15 @@ class RTextMCDRTranslation(RTextBase):
 		finally:
 			cls.__TLS.language = prev
 
+	@override
+	def _is_json_str_cacheable(self) -> bool:
+		# the translated text depends on the language context
+		return False
+
+	@override
+	def _write_json(self, buf: List[str], json_format: RTextJsonFormat):
+		self.__get_translated_text()._write_json(buf, json_format)
+
 	@override
 	def to_json_object(self, **kwargs: Unpack[RTextBase.ToJsonKwargs]) -> Union[dict, list]:
 		return self.__get_translated_text().to_json_object(**kwargs)
@@ -118,6 +172,7 @@ class RTextMCDRTranslation(RTextBase):
 	def copy(self) -> 'RTextMCDRTranslation':
 		copied = RTextMCDRTranslation(self.translation_key, *self.args, **self.kwargs)
 		copied.__tr_func = self.__tr_func
+		copied.__tr_cacheable = self.__tr_cacheable
 		copied.__post_process = self.__post_process.copy()
 		return copied
 
@@ -125,6 +180,7 @@ class RTextMCDRTranslation(RTextBase):
 	def set_color(self, color: RColor) -> Self:
 		def add_color(rt: RTextBase):
 			return rt.set_color(color)
+		self._ensure_not_frozen()
 		self.__post_process.append(add_color)
 		return self
 
@@ -132,6 +188,7 @@ class RTextMCDRTranslation(RTextBase):
 	def set_styles(self, styles: Union[RStyle, Iterable[RStyle]]) -> Self:
 		def set_styles(rt: RTextBase):
 			return rt.set_styles(styles)
+		self._ensure_not_frozen()
 		self.__post_process.append(set_styles)
 		return self
 
@@ -139,6 +196,7 @@ class RTextMCDRTranslation(RTextBase):
 	def _set_click_event_direct(self, click_event: RClickEvent) -> Self:
 		def set_click_event(rt: RTextBase):
 			return rt._set_click_event_direct(click_event)
+		self._ensure_not_frozen()
 		self.__post_process.append(set_click_event)
 		return self
 
@@ -146,6 +204,7 @@ class RTextMCDRTranslation(RTextBase):
 	def set_hover_event(self, hover_event: RHoverEvent) -> Self:
 		def set_hover_event(rt: RTextBase):
 			return rt.set_hover_event(hover_event)
+		self._ensure_not_frozen()
 		self.__post_process.append(set_hover_event)
 		return self
 
@@ -153,6 +212,7 @@ class RTextMCDRTranslation(RTextBase):
 	def set_hover_text(self, *args) -> Self:
 		def set_hover_text(rt: RTextBase):
 			return rt.set_hover_text(*args)
+		self._ensure_not_frozen()
 		self.__post_process.append(set_hover_text)
 		return self
 
@@ -0,0 +1,99 @@
+"""
+A persistent cache of file hashes, so unchanged files don't need to be rehashed on every plugin load / reload
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple, Dict, Optional, List
+
+from mcdreforged.constants import core_constant, plugin_constant
+from mcdreforged.utils import file_utils
+from mcdreforged.utils.types.path_like import PathStr
+
+FILE_HASH_CACHE_FILE_PATH = Path(plugin_constant.PLUGIN_CONFIG_DIRECTORY) / core_constant.PACKAGE_NAME / 'file_hash_cache.json'
+
+
+class FileFingerprint(NamedTuple):
+	size: int
+	mtime_ns: int
+	inode: int
+
+	@classmethod
+	def of(cls, file_path: PathStr) -> 'FileFingerprint':
+		"""
+		:raise OSError: if the file cannot be accessed
+		"""
+		stat = os.stat(file_path)
+		return cls(stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+class FileHashCache:
+	"""
+	A cached hash is only used if the fingerprint of the file, i.e. (size, mtime_ns, inode), is unchanged.
+	Modifications are kept in memory until :meth:`save` is called
+	"""
+	def __init__(self, cache_file_path: Path = FILE_HASH_CACHE_FILE_PATH):
+		self.__cache_file_path = cache_file_path
+		self.__lock = threading.Lock()
+		# absolute file path -> [size, mtime_ns, inode, sha256]. Loaded lazily
+		self.__entries: Optional[Dict[str, list]] = None
+		self.__dirty = False
+
+	def __get_entries(self) -> Dict[str, list]:
+		if self.__entries is None:
+			self.__entries = {}
+			try:
+				with open(self.__cache_file_path, 'r', encoding='utf8') as file:
+					data = json.load(file)
+			except (OSError, ValueError):
+				data = {}
+			if isinstance(data, dict):
+				for path, entry in data.items():
+					# drop entries of files that no longer exist, e.g. packed plugins replaced by newer versions
+					if isinstance(entry, list) and len(entry) == 4 and os.path.isfile(path):
+						self.__entries[path] = entry
+				self.__dirty = len(self.__entries) != len(data)
+		return self.__entries
+
+	def get_sha256(self, file_path: PathStr, *, fingerprint: Optional[FileFingerprint] = None) -> str:
+		"""
+		Get the sha256 hash of the given file, in lowercase hex string
+
+		:param file_path: The file to hash
+		:param fingerprint: Optional. The fingerprint of the file, if the caller has already got it
+		:raise OSError: if the file cannot be read
+		"""
+		file_path = Path(file_path).absolute()
+		if fingerprint is None:
+			fingerprint = FileFingerprint.of(file_path)
+		key = str(file_path)
+		with self.__lock:
+			entry: Optional[List] = self.__get_entries().get(key)
+			if entry is not None and tuple(entry[:3]) == fingerprint:
+				return entry[3]
+
+		sha256 = file_utils.calc_file_sha256(file_path)
+		# don't cache the result if the file gets modified during the hashing
+		if FileFingerprint.of(file_path) == fingerprint:
+			with self.__lock:
+				self.__get_entries()[key] = [*fingerprint, sha256]
+				self.__dirty = True
+		return sha256
+
+	def save(self):
+		"""
+		Write the cache into the cache file, if there's any modification.
+		Nothing will be written if the directory of the cache file does not exist
+		"""
+		with self.__lock:
+			if not self.__dirty or self.__entries is None:
+				return
+			self.__dirty = False
+			data = dict(self.__entries)
+		if self.__cache_file_path.parent.is_dir():
+			try:
+				with file_utils.safe_write(self.__cache_file_path, encoding='utf8') as file:
+					json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+			except OSError:
+				pass  # it's just a cache
@@ -0,0 +1,75 @@
+"""
+Fingerprints of directory trees, for detecting file changes inside a directory
+"""
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+FileTreeFingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+class FileTreeFingerprinter:
+	"""
+	Calculate the fingerprint of a directory tree, i.e. the (relative path, size, mtime_ns) of all relevant files inside
+
+	Directory listings are cached by the mtime of the directory, so checking an unchanged tree only costs a stat call per file and directory
+	"""
+	_IGNORED_DIRECTORY_NAMES = ('__pycache__',)
+	_IGNORED_FILE_SUFFIXES = ('.pyc', '.pyo')
+
+	@classmethod
+	def is_ignored(cls, name: str, is_dir: bool) -> bool:
+		"""
+		Check if a file or a directory is irrelevant, e.g. python bytecode caches and hidden files like .git
+		"""
+		if name.startswith('.'):
+			return True
+		if is_dir:
+			return name in cls._IGNORED_DIRECTORY_NAMES
+		else:
+			return name.endswith(cls._IGNORED_FILE_SUFFIXES)
+
+	def __init__(self):
+		# directory path -> (directory mtime_ns, file names, subdirectory names)
+		self.__listing_cache: Dict[Path, Tuple[int, List[str], List[str]]] = {}
+
+	def __list_directory(self, directory: Path) -> Tuple[List[str], List[str]]:
+		mtime_ns = os.stat(directory).st_mtime_ns
+		if (cached := self.__listing_cache.get(directory)) is not None and cached[0] == mtime_ns:
+			return cached[1], cached[2]
+		file_names: List[str] = []
+		directory_names: List[str] = []
+		with os.scandir(directory) as it:
+			for entry in it:
+				is_dir = entry.is_dir(follow_symlinks=False)  # symlinks are not followed, in case of loops
+				if not self.is_ignored(entry.name, is_dir):
+					(directory_names if is_dir else file_names).append(entry.name)
+		file_names.sort()
+		directory_names.sort()
+		self.__listing_cache[directory] = (mtime_ns, file_names, directory_names)
+		return file_names, directory_names
+
+	def calculate(self, root: Path) -> FileTreeFingerprint:
+		"""
+		:raise OSError: if the file tree cannot be accessed
+		"""
+		result: List[Tuple[str, int, int]] = []
+		visited_directories = set()
+
+		def walk(directory: Path, rel_path: str):
+			visited_directories.add(directory)
+			file_names, directory_names = self.__list_directory(directory)
+			for file_name in file_names:
+				try:
+					stat = os.stat(directory / file_name)
+				except FileNotFoundError:
+					continue  # removed after the directory listing was cached. The directory mtime will change
+				result.append((rel_path + file_name, stat.st_size, stat.st_mtime_ns))
+			for directory_name in directory_names:
+				walk(directory / directory_name, rel_path + directory_name + '/')
+
+		walk(root, '')
+		for directory in list(self.__listing_cache.keys()):
+			if directory not in visited_directories:
+				self.__listing_cache.pop(directory)
+		return tuple(result)
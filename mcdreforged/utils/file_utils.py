@@ -48,6 +48,9 @@ def __safe_write(target_file_path: PathStr, mode: str, encoding: Optional[str])
 	temp_file_path = target_file_path.parent / (target_file_path.name + '.tmp')
 	with open(temp_file_path, mode, encoding=encoding) as file:
 		yield file
+		# make sure the content reaches the disk before the replacement, so a crash will not leave an empty file
+		file.flush()
+		os.fsync(file.fileno())
 	os.replace(temp_file_path, target_file_path)
 
 
@@ -0,0 +1,262 @@
+"""
+Watchers reporting file changes inside directory trees
+"""
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Collection, Dict, Set, Optional, List
+
+from typing_extensions import override
+
+from mcdreforged.utils.file_tree_fingerprint import FileTreeFingerprinter
+
+
+class FileWatcher(ABC):
+	def __init__(self):
+		self._roots: Set[Path] = set()
+
+	def set_roots(self, roots: Collection[Path]):
+		"""
+		Set the root directories to watch. All files inside the directory trees will be watched
+		"""
+		roots = {Path(root).absolute() for root in roots}
+		old_roots, self._roots = self._roots, roots
+		for root in old_roots - roots:
+			self._remove_root(root)
+		for root in roots - old_roots:
+			self._add_root(root)
+
+	@abstractmethod
+	def _add_root(self, root: Path):
+		raise NotImplementedError()
+
+	@abstractmethod
+	def _remove_root(self, root: Path):
+		raise NotImplementedError()
+
+	@abstractmethod
+	def poll(self, timeout: float) -> Set[Path]:
+		"""
+		Wait for file changes for at most *timeout* seconds
+
+		:return: The paths of the changed files and directories. Might be empty.
+			A changed directory means that anything inside it might be changed as well
+		"""
+		raise NotImplementedError()
+
+	def close(self):
+		pass
+
+
+class PollingFileWatcher(FileWatcher):
+	"""
+	Detect changes by comparing the fingerprints of the directory trees periodically
+	"""
+	def __init__(self, interval: float):
+		super().__init__()
+		self.__interval = interval
+		self.__fingerprinter = FileTreeFingerprinter()
+		# root -> {relative path -> (size, mtime_ns)}
+		self.__snapshots: Dict[Path, Dict[str, tuple]] = {}
+		self.__last_poll_time = time.monotonic()
+
+	def __take_snapshot(self, root: Path) -> Dict[str, tuple]:
+		try:
+			return {rel_path: (size, mtime_ns) for rel_path, size, mtime_ns in self.__fingerprinter.calculate(root)}
+		except OSError:
+			return {}
+
+	@override
+	def _add_root(self, root: Path):
+		self.__snapshots[root] = self.__take_snapshot(root)
+
+	@override
+	def _remove_root(self, root: Path):
+		self.__snapshots.pop(root, None)
+
+	@override
+	def poll(self, timeout: float) -> Set[Path]:
+		wait_time = self.__last_poll_time + self.__interval - time.monotonic()
+		if wait_time > timeout:
+			time.sleep(timeout)
+			return set()
+		time.sleep(max(0.0, wait_time))
+		self.__last_poll_time = time.monotonic()
+
+		changes: Set[Path] = set()
+		for root, snapshot in list(self.__snapshots.items()):
+			new_snapshot = self.__take_snapshot(root)
+			for rel_path in snapshot.keys() | new_snapshot.keys():
+				if snapshot.get(rel_path) != new_snapshot.get(rel_path):
+					changes.add(root / rel_path)
+			self.__snapshots[root] = new_snapshot
+		return changes
+
+
+class InotifyFileWatcher(FileWatcher):
+	"""
+	Detect changes with the inotify API of Linux. A watch is added to every directory in the directory trees
+	"""
+	__IN_MODIFY = 0x00000002
+	__IN_ATTRIB = 0x00000004
+	__IN_CLOSE_WRITE = 0x00000008
+	__IN_MOVED_FROM = 0x00000040
+	__IN_MOVED_TO = 0x00000080
+	__IN_CREATE = 0x00000100
+	__IN_DELETE = 0x00000200
+	__IN_DELETE_SELF = 0x00000400
+	__IN_MOVE_SELF = 0x00000800
+	__IN_Q_OVERFLOW = 0x00004000
+	__IN_IGNORED = 0x00008000
+	__IN_ONLYDIR = 0x01000000
+	__IN_ISDIR = 0x40000000
+	__IN_NONBLOCK = os.O_NONBLOCK
+	__IN_CLOEXEC = 0o2000000
+
+	__WATCH_MASK = (
+		__IN_MODIFY | __IN_ATTRIB | __IN_CLOSE_WRITE | __IN_MOVED_FROM | __IN_MOVED_TO |
+		__IN_CREATE | __IN_DELETE | __IN_DELETE_SELF | __IN_MOVE_SELF | __IN_ONLYDIR
+	)
+	__EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+	def __init__(self):
+		super().__init__()
+		self.__libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+		fd = self.__libc.inotify_init1(self.__IN_NONBLOCK | self.__IN_CLOEXEC)
+		if fd < 0:
+			err = ctypes.get_errno()
+			raise OSError(err, 'inotify_init1 failed: {}'.format(os.strerror(err)))
+		self.__fd: int = fd
+		self.__wd_to_path: Dict[int, Path] = {}
+		self.__path_to_wd: Dict[Path, int] = {}
+
+	@classmethod
+	def is_supported(cls) -> bool:
+		return sys.platform.startswith('linux')
+
+	def __add_watch(self, directory: Path):
+		if directory in self.__path_to_wd:
+			return
+		wd = self.__libc.inotify_add_watch(self.__fd, os.fsencode(directory), self.__WATCH_MASK)
+		if wd < 0:
+			err = ctypes.get_errno()
+			if err in (errno.ENOENT, errno.ENOTDIR):
+				return  # removed already, or not a directory
+			raise OSError(err, 'inotify_add_watch failed for {}: {}'.format(directory, os.strerror(err)))
+		self.__wd_to_path[wd] = directory
+		self.__path_to_wd[directory] = wd
+
+	def __add_watch_recursively(self, directory: Path):
+		self.__add_watch(directory)
+		try:
+			with os.scandir(directory) as it:
+				sub_directories = [
+					Path(entry.path) for entry in it
+					if entry.is_dir(follow_symlinks=False) and not FileTreeFingerprinter.is_ignored(entry.name, True)
+				]
+		except OSError:
+			return
+		for sub_directory in sub_directories:
+			self.__add_watch_recursively(sub_directory)
+
+	def __remove_watch(self, directory: Path):
+		wd = self.__path_to_wd.pop(directory, None)
+		if wd is not None:
+			self.__wd_to_path.pop(wd, None)
+			self.__libc.inotify_rm_watch(self.__fd, wd)
+
+	@override
+	def _add_root(self, root: Path):
+		self.__add_watch_recursively(root)
+
+	@override
+	def _remove_root(self, root: Path):
+		def is_inside(directory: Path, r: Path) -> bool:
+			return directory == r or r in directory.parents
+
+		for directory in list(self.__path_to_wd.keys()):
+			# keep the watches that are still needed by other roots
+			if is_inside(directory, root) and not any(is_inside(directory, r) for r in self._roots):
+				self.__remove_watch(directory)
+
+	def __read_events(self) -> bytes:
+		buf = b''
+		while True:
+			try:
+				data = os.read(self.__fd, 64 * 1024)
+			except BlockingIOError:
+				break
+			if len(data) == 0:
+				break
+			buf += data
+		return buf
+
+	@override
+	def poll(self, timeout: float) -> Set[Path]:
+		readable, _, _ = select.select([self.__fd], [], [], timeout)
+		if len(readable) == 0:
+			return set()
+
+		changes: Set[Path] = set()
+		new_directories: List[Path] = []
+		buf = self.__read_events()
+		offset = 0
+		while offset + self.__EVENT_HEADER.size <= len(buf):
+			wd, mask, _, name_len = self.__EVENT_HEADER.unpack_from(buf, offset)
+			offset += self.__EVENT_HEADER.size
+			name = os.fsdecode(buf[offset:offset + name_len].rstrip(b'\0'))
+			offset += name_len
+
+			if mask & self.__IN_Q_OVERFLOW:
+				# events are lost, so everything might be changed. Report the roots, which contain everything
+				changes.update(self._roots)
+				continue
+			directory: Optional[Path] = self.__wd_to_path.get(wd)
+			if directory is None:
+				continue
+			if mask & self.__IN_IGNORED:
+				# the watch is removed, e.g. the directory is deleted
+				self.__wd_to_path.pop(wd, None)
+				self.__path_to_wd.pop(directory, None)
+				continue
+			if len(name) == 0:  # event of the watched directory itself
+				changes.add(directory)
+				continue
+			is_dir = (mask & self.__IN_ISDIR) != 0
+			if FileTreeFingerprinter.is_ignored(name, is_dir):
+				continue
+			path = directory / name
+			changes.add(path)
+			if is_dir and mask & (self.__IN_CREATE | self.__IN_MOVED_TO):
+				new_directories.append(path)
+
+		for directory in new_directories:
+			self.__add_watch_recursively(directory)
+		return changes
+
+	@override
+	def close(self):
+		if self.__fd >= 0:
+			os.close(self.__fd)
+			self.__fd = -1
+		self.__wd_to_path.clear()
+		self.__path_to_wd.clear()
+
+
+def create_file_watcher(polling_interval: float) -> FileWatcher:
+	"""
+	Create an inotify based file watcher if possible, otherwise create a polling file watcher
+	"""
+	if InotifyFileWatcher.is_supported():
+		try:
+			return InotifyFileWatcher()
+		except (OSError, AttributeError):
+			pass  # libc not found, or inotify not available
+	return PollingFileWatcher(polling_interval)
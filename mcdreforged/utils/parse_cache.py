@@ -0,0 +1,63 @@
+"""
+A cache of parsed data files, so unchanged files can skip the slow parsing (e.g. yaml) on startup / reload
+"""
+import hashlib
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Any, Tuple, TypeVar
+
+from mcdreforged.constants import core_constant, plugin_constant
+from mcdreforged.utils.types.path_like import PathStr
+
+T = TypeVar('T')
+
+CACHE_DIRECTORY = Path(plugin_constant.PLUGIN_CONFIG_DIRECTORY) / core_constant.PACKAGE_NAME / 'parse_cache'
+_CACHE_FILE_SUFFIX = '.marshal'
+
+
+def __get_cache_file_path(file_path: Path, parser_name: str) -> Path:
+	file_id = hashlib.sha1('{}\0{}'.format(parser_name, file_path).encode('utf8')).hexdigest()
+	return CACHE_DIRECTORY / (file_id + _CACHE_FILE_SUFFIX)
+
+
+def load_with_cache(file_path: PathStr, parser_name: str, parser: Callable[[Path], T], to_plain: Callable[[T], Any]) -> Tuple[Any, bool]:
+	"""
+	Load and parse a file with cache
+
+	The cache is keyed by the path, size and modification time of the file, the parser name, and the version of MCDR and python.
+	Cached data is stored with :mod:`marshal`, so the plain data needs to consist of builtin types only.
+	Nothing will be cached before the MCDR environment is set up, i.e. the parent of :data:`CACHE_DIRECTORY` exists
+
+	:param file_path: The file to parse
+	:param parser_name: The name of the parser, as a part of the cache key
+	:param parser: The function to parse the file
+	:param to_plain: The function to convert the parsed result into plain data for caching
+	:return: A tuple of (data, from cache). If the data is from the cache, it's the plain data.
+		Otherwise, it's the value returned by the parser
+	"""
+	file_path = Path(file_path).absolute()
+	stat = file_path.stat()
+	key = (str(file_path), stat.st_size, stat.st_mtime_ns, parser_name, core_constant.VERSION, sys.version)
+	cache_file_path = __get_cache_file_path(file_path, parser_name)
+
+	try:
+		cached_key, cached_data = marshal.loads(cache_file_path.read_bytes())
+	except (OSError, ValueError, EOFError, TypeError):
+		pass
+	else:
+		if cached_key == key:
+			return cached_data, True
+
+	data = parser(file_path)
+	if CACHE_DIRECTORY.parent.is_dir():
+		try:
+			buf = marshal.dumps((key, to_plain(data)))
+			CACHE_DIRECTORY.mkdir(exist_ok=True)
+			temp_file_path = cache_file_path.with_name(cache_file_path.name + '.tmp')
+			temp_file_path.write_bytes(buf)
+			os.replace(temp_file_path, cache_file_path)
+		except (OSError, ValueError):
+			pass  # unsupported data type, or the cache is not writable. It's fine
+	return data, False
@@ -1,7 +1,11 @@
 import threading
-from typing import Optional, Union, Tuple, List, Iterable
+from typing import Optional, Union, Tuple, List, Iterable, TYPE_CHECKING
 
-import requests
+if TYPE_CHECKING:
+	import requests
+
+# "requests" is imported on first request, since it's slow to import,
+# and it's only needed by optional subsystems like the telemetry reporter, the update helper and PIM
 
 _proxy_dict: dict = {}
 _proxy_dict_lock = threading.Lock()
@@ -38,11 +42,12 @@ def get_direct(
 		timeout: Optional[Union[float, Tuple[float, float]]] = None,
 		stream: Optional[bool] = None,
 		allow_redirects: bool = True,  # GET requests are usually ok to allow redirects
-) -> requests.Response:
+) -> 'requests.Response':
+	import requests
 	return requests.get(url, timeout=timeout, headers=ua_header(what), proxies=get_proxies(), stream=stream, allow_redirects=allow_redirects)
 
 
-def __get_response_buf_with_size_limited(response: requests.Response, max_size: Optional[int] = None) -> bytes:
+def __get_response_buf_with_size_limited(response: 'requests.Response', max_size: Optional[int] = None) -> bytes:
 	if max_size is None:
 		return response.content
 
@@ -56,12 +61,12 @@ def __get_response_buf_with_size_limited(response: requests.Response, max_size:
 	return b''.join(buf_list)
 
 
-def get_buf(url: str, what: str, *, timeout: Optional[Union[float, Tuple[float, float]]] = None, max_size: Optional[int] = None) -> Tuple[requests.Response, bytes]:
+def get_buf(url: str, what: str, *, timeout: Optional[Union[float, Tuple[float, float]]] = None, max_size: Optional[int] = None) -> Tuple['requests.Response', bytes]:
 	response = get_direct(url, what, timeout=timeout, stream=True)
 	return response, __get_response_buf_with_size_limited(response, max_size=max_size)
 
 
-def get_buf_multi(urls: Iterable[str], what: str, *, timeout: Optional[Union[float, Tuple[float, float]]] = None, max_size: Optional[int] = None) -> Tuple[requests.Response, bytes]:
+def get_buf_multi(urls: Iterable[str], what: str, *, timeout: Optional[Union[float, Tuple[float, float]]] = None, max_size: Optional[int] = None) -> Tuple['requests.Response', bytes]:
 	errors: List[Exception] = []
 	for url in urls:
 		try:
@@ -71,6 +76,7 @@ def get_buf_multi(urls: Iterable[str], what: str, *, timeout: Optional[Union[flo
 	raise Exception('All attempts failed: {}'.format('; '.join(map(str, errors))))
 
 
-def post_json(url: str, what: str, payload: dict, *, timeout: Optional[Union[float, Tuple[float, float]]] = None, max_size: Optional[int] = None) -> Tuple[requests.Response, bytes]:
+def post_json(url: str, what: str, payload: dict, *, timeout: Optional[Union[float, Tuple[float, float]]] = None, max_size: Optional[int] = None) -> Tuple['requests.Response', bytes]:
+	import requests
 	response = requests.post(url, timeout=timeout, headers=ua_header(what), proxies=get_proxies(), json=payload, stream=True)
 	return response, __get_response_buf_with_size_limited(response, max_size=max_size)
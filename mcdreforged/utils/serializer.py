@@ -1,11 +1,13 @@
 import copy
 import functools
 import re
+import sys
+import types
 import uuid
-from abc import ABC
+from abc import ABC, ABCMeta
 from enum import EnumMeta, Enum
 from typing import Literal as TLiteral
-from typing import Union, TypeVar, List, Dict, Type, get_type_hints, Any, Callable, Optional, Tuple, cast
+from typing import Union, TypeVar, List, Dict, Type, get_type_hints, Any, Callable, Optional, Tuple, cast, NamedTuple, NoReturn, ClassVar
 
 from typing_extensions import Self, TypedDict, NotRequired, Unpack
 
@@ -57,52 +59,117 @@ def serialize(obj: Any) -> JsonLike:
 
 	.. tip:: For more complex serialization/deserialization requirements, take a look at the `pydantic <https://github.com/pydantic/pydantic>`__ library
 	"""
-	if type(obj) in (type(None), bool, int, float, str):
-		return obj
-	elif isinstance(obj, (bool, int, float, str)):
-		for cls in (bool, int, float, str):
-			if isinstance(obj, cls):
-				return cls(obj)
-		raise AssertionError()
-	elif isinstance(obj, list) or isinstance(obj, tuple):
-		return list(map(serialize, obj))
-	elif isinstance(obj, dict):
-		return {key: serialize(value) for key, value in obj.items()}
-	elif isinstance(obj.__class__, EnumMeta):
-		return obj.name
-	elif isinstance(obj, re.Pattern):
-		if isinstance(obj.pattern, str):
-			return obj.pattern
-		elif isinstance(obj.pattern, bytes):
-			return obj.pattern.decode('utf8')
-		else:
-			raise TypeError('bad pattern property type for the given Pattern object: {}'.format(type(obj.pattern)))
-	elif isinstance(obj, uuid.UUID):
-		return str(obj)
+	return _get_serializer(type(obj))(obj)
+
+
+_Serializer = Callable[[Any], JsonLike]
+
 
+def _get_serializer(obj_type: type) -> _Serializer:
 	try:
-		attr_dict: Dict[str, Any] = vars(obj).copy()
-		# don't serialize protected fields
-		for attr_name in list(attr_dict.keys()):
-			if attr_name.startswith('_'):
-				attr_dict.pop(attr_name)
-		if isinstance(obj, Serializable):
-			order_dict: Dict[str, int] = {}
-			for i, attr_name in enumerate(_get_type_hints(type(obj)).keys()):
-				if not attr_name.startswith('_'):
-					order_dict[attr_name] = i
-
-			def sort_key_getter(item: Tuple[str, Any]) -> int:
-				return order_dict.get(item[0], len(order_dict))
-
-			attr_dict = {
-				key: value
-				for key, value in sorted(attr_dict.items(), key=sort_key_getter)
-			}
-	except Exception:
-		raise TypeError('Unsupported input type {}'.format(type(obj))) from None
+		return _get_serializer_cached(obj_type)
+	except TypeError:  # unhashable type
+		return _compile_serializer(obj_type)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_serializer_cached(obj_type: type) -> _Serializer:
+	return _compile_serializer(obj_type)
+
+
+def clear_serializer_cache():
+	"""
+	Clear the compiled serializers and deserializers
+
+	The caches are keyed by classes, so it should be invoked when classes might be discarded, e.g. plugins got unloaded,
+	or those classes will be kept alive by the caches
+	"""
+	_get_serializer_cached.cache_clear()
+	_get_deserializer_cached.cache_clear()
+	Serializable.get_field_annotations.cache_clear()
+
+
+def _compile_serializer(obj_type: type) -> _Serializer:
+	"""
+	Create the serializer for objects in the given type. The returned function does what :func:`serialize` describes
+	"""
+	if obj_type in (type(None), bool, int, float, str):
+		return _serialize_immutable
+	elif issubclass(obj_type, (bool, int, float, str)):
+		for base_class in (bool, int, float, str):
+			if issubclass(obj_type, base_class):
+				return base_class
+		raise AssertionError()
+	elif issubclass(obj_type, (list, tuple)):
+		return _serialize_list
+	elif issubclass(obj_type, dict):
+		return _serialize_dict
+	elif isinstance(obj_type, EnumMeta):
+		return _serialize_enum
+	elif issubclass(obj_type, re.Pattern):
+		return _serialize_pattern
+	elif issubclass(obj_type, uuid.UUID):
+		return str
 	else:
-		return serialize(attr_dict)
+		return _compile_object_serializer(obj_type)
+
+
+def _serialize_immutable(obj: Any) -> JsonLike:
+	return obj
+
+
+def _serialize_list(obj: Union[list, tuple]) -> JsonLike:
+	return list(map(serialize, obj))
+
+
+def _serialize_dict(obj: dict) -> JsonLike:
+	return {key: serialize(value) for key, value in obj.items()}
+
+
+def _serialize_enum(obj: Enum) -> JsonLike:
+	return obj.name
+
+
+def _serialize_pattern(obj: re.Pattern) -> JsonLike:
+	if isinstance(obj.pattern, str):
+		return obj.pattern
+	elif isinstance(obj.pattern, bytes):
+		return obj.pattern.decode('utf8')
+	else:
+		raise TypeError('bad pattern property type for the given Pattern object: {}'.format(type(obj.pattern)))
+
+
+def _compile_object_serializer(obj_type: type) -> _Serializer:
+	is_serializable = issubclass(obj_type, Serializable)
+	# public attributes stored in __slots__, which do not present in vars(obj)
+	slot_names = [name for name in _get_mro_slots(obj_type) if not name.startswith('_')] if is_serializable else []
+	# field name -> field order. Evaluated lazily, since the type hints might not be resolvable yet
+	order_dict: Optional[Dict[str, int]] = None
+
+	def serialize_object(obj: Any) -> JsonLike:
+		nonlocal order_dict
+		try:
+			# don't serialize protected fields
+			if len(slot_names) > 0:
+				attr_items = [(name, value) for name in slot_names if (value := getattr(obj, name, _NONE)) is not _NONE]
+				if (obj_dict := getattr(obj, '__dict__', None)) is not None:
+					attr_items.extend(item for item in obj_dict.items() if not item[0].startswith('_'))
+			else:
+				attr_items = [item for item in vars(obj).items() if not item[0].startswith('_')]
+			if is_serializable:
+				if order_dict is None:
+					order_dict = {
+						attr_name: i
+						for i, attr_name in enumerate(_get_type_hints(obj_type).keys())
+						if not attr_name.startswith('_')
+					}
+				orders = order_dict
+				attr_items.sort(key=lambda item: orders.get(item[0], len(orders)))
+		except Exception:
+			raise TypeError('Unsupported input type {}'.format(type(obj))) from None
+		return {key: serialize(value) for key, value in attr_items}
+
+	return serialize_object
 
 
 _BASIC_CLASSES_NO_NONE = (bool, int, float, str, list, dict)
@@ -194,169 +261,381 @@ def deserialize(
 
 	.. tip:: For more complex serialization/deserialization requirements, take a look at the `pydantic <https://github.com/pydantic/pydantic>`__ library
 	"""
-	def mismatch(*expected_class: Type):
-		if expected_class != (cls,):
-			classes = ' or '.join(map(str, expected_class))
-			raise TypeError('Mismatched input type: expected class {} (deduced from {}) but found data with class {}'.format(classes, cls, type(data)))
-		else:
-			raise TypeError('Mismatched input type: expected class {} but found data with class {}'.format(cls, type(data)))
-
 	# in case None instead of NoneType is passed
 	if cls is None:
 		cls = type(None)
-	kwargs = _DeserializeKwargs(
+	options = _DeserializeOptions(
 		error_at_missing=error_at_missing,
 		error_at_redundancy=error_at_redundancy,
 		missing_callback=missing_callback,
 		redundancy_callback=redundancy_callback,
 	)
+	return _get_deserializer(cls)(data, options)
+
+
+class _DeserializeOptions(NamedTuple):
+	error_at_missing: bool
+	error_at_redundancy: bool
+	missing_callback: Optional[Callable[[Any, Type, str], Any]]
+	redundancy_callback: Optional[Callable[[Any, Type, str, Any], Any]]
+
+
+_Deserializer = Callable[[Any, _DeserializeOptions], Any]
+
+
+def _get_type_key(cls: Any) -> Any:
+	"""
+	typing considers e.g. ``Union[int, float]`` and ``Union[float, int]`` equal, but the candidate order matters in deserialization,
+	so the type arguments are included in the key in order, recursively
+	"""
+	args = getattr(cls, '__args__', None)
+	if isinstance(args, tuple) and len(args) > 0:
+		return cls, tuple((type(arg), _get_type_key(arg)) for arg in args)
+	return cls
+
+
+def _get_deserializer(cls: Any) -> _Deserializer:
+	if cls is None:
+		cls = type(None)
+	try:
+		return _get_deserializer_cached(_get_type_key(cls))
+	except TypeError:  # unhashable type, e.g. a Literal with unhashable values
+		return _compile_deserializer(cls)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_deserializer_cached(type_key: Any) -> _Deserializer:
+	return _compile_deserializer(type_key[0] if isinstance(type_key, tuple) else type_key)
+
+
+def _mismatch(cls: Any, data: Any, *expected_class: Type) -> NoReturn:
+	if expected_class != (cls,):
+		classes = ' or '.join(map(str, expected_class))
+		raise TypeError('Mismatched input type: expected class {} (deduced from {}) but found data with class {}'.format(classes, cls, type(data)))
+	else:
+		raise TypeError('Mismatched input type: expected class {} but found data with class {}'.format(cls, type(data)))
+
 
+def _compile_deserializer(cls: Any) -> _Deserializer:
+	"""
+	Create the deserializer for the given target class. The returned function does what :func:`deserialize` describes
+
+	All inspections on the target class are done here, so the returned function only needs to check the data.
+	Deserializers of nested classes are obtained when the returned function gets invoked for the first time,
+	so recursive class definitions are fine
+	"""
 	cls_org = _get_origin(cls)
 
 	# if the target class is Any, then simply return the data
 	if cls is Any:
-		return data
+		return _deserialize_any
 
 	# Union
 	# Unpack Union first since the target class is not confirmed yet
 	elif cls_org == Union:
-		for possible_cls in _get_args(cls):
-			try:
-				return deserialize(data, possible_cls, **kwargs)
-			except (TypeError, ValueError):
-				pass
-		raise TypeError('Data in type {} cannot match any candidate of target class {}'.format(type(data), cls))
+		candidates = _get_args(cls)
+		candidate_deserializers: Optional[List[_Deserializer]] = None
+
+		def deserialize_union(data: Any, options: _DeserializeOptions) -> Any:
+			nonlocal candidate_deserializers
+			if candidate_deserializers is None:
+				candidate_deserializers = list(map(_get_deserializer, candidates))
+			for deserializer in candidate_deserializers:
+				try:
+					return deserializer(data, options)
+				except (TypeError, ValueError):
+					pass
+			raise TypeError('Data in type {} cannot match any candidate of target class {}'.format(type(data), cls))
+		return deserialize_union
 
 	# Element (None, int, float, str, list, dict)
 	# For list and dict, since it doesn't have any type hint, we choose to simply return the data
 	elif cls in _BASIC_CLASSES:
-		if type(data) is cls:
-			return data
-		# int is ok for float
-		elif cls is float and isinstance(data, int):
-			return cast(T, float(data))
+		if cls is float:
+			def deserialize_float(data: Any, _: _DeserializeOptions) -> Any:
+				if type(data) is float:
+					return data
+				# int is ok for float
+				elif isinstance(data, int):
+					return float(data)
+				_mismatch(cls, data, float, int)
+			return deserialize_float
 		else:
-			if cls is float:
-				mismatch(float, int)
-			else:
-				mismatch(cls)
+			def deserialize_basic(data: Any, _: _DeserializeOptions) -> Any:
+				if type(data) is cls:
+					return data
+				_mismatch(cls, data, cls)
+			return deserialize_basic
 
 	# Custom class that inherits one of the base class (no generic)
 	elif isinstance(cls, type) and issubclass(cls, _BASIC_CLASSES_NO_NONE):
-		ctor: Callable[[Any], T] = cls
-		return ctor(data)
+		ctor: Callable[[Any], Any] = cls
+
+		def deserialize_inherited_basic(data: Any, _: _DeserializeOptions) -> Any:
+			return ctor(data)
+		return deserialize_inherited_basic
 
 	# List (generic with type hint)
 	elif cls_org == getattr(List[int], '__origin__') or (isinstance(cls_org, type) and issubclass(cls_org, list)):
 		cls_real = cls_org if isinstance(cls_org, type) else list
-		if isinstance(data, list):
-			element_type = _get_args(cls)[0]
-			return cls_real(
-				deserialize(e, element_type, **kwargs)
-				for e in data
-			)
-		else:
-			mismatch(cls_org)
+		element_deserializer: Optional[_Deserializer] = None
+
+		def deserialize_list(data: Any, options: _DeserializeOptions) -> Any:
+			nonlocal element_deserializer
+			if isinstance(data, list):
+				if element_deserializer is None:
+					element_deserializer = _get_deserializer(_get_args(cls)[0])
+				result = [element_deserializer(e, options) for e in data]
+				return result if cls_real is list else cls_real(result)
+			_mismatch(cls, data, cls_org)
+		return deserialize_list
 
 	# Dict (generic with type hint)
 	elif cls_org == getattr(Dict[int, int], '__origin__') or (isinstance(cls_org, type) and issubclass(cls_org, dict)):
 		cls_real = cls_org if isinstance(cls_org, type) else dict
-		if isinstance(data, dict):
-			key_type = _get_args(cls)[0]
-			val_type = _get_args(cls)[1]
-			result = cls_real()
-			for key, value in data.items():
-				deserialized_key = deserialize(key, key_type, **kwargs)
-				deserialized_value = deserialize(value, val_type, **kwargs)
-				result[deserialized_key] = deserialized_value
-			return result
-		else:
-			mismatch(cls_real)
+		key_deserializer: Optional[_Deserializer] = None
+		val_deserializer: Optional[_Deserializer] = None
+
+		def deserialize_dict(data: Any, options: _DeserializeOptions) -> Any:
+			nonlocal key_deserializer, val_deserializer
+			if isinstance(data, dict):
+				if key_deserializer is None or val_deserializer is None:
+					key_deserializer = _get_deserializer(_get_args(cls)[0])
+					val_deserializer = _get_deserializer(_get_args(cls)[1])
+				result = cls_real()
+				for key, value in data.items():
+					deserialized_key = key_deserializer(key, options)
+					deserialized_value = val_deserializer(value, options)
+					result[deserialized_key] = deserialized_value
+				return result
+			_mismatch(cls, data, cls_real)
+		return deserialize_dict
 
 	# Enum
 	elif isinstance(cls, EnumMeta):
-		if isinstance(data, str):
-			return cls[data]
-		else:
-			mismatch(str)
+		def deserialize_enum(data: Any, _: _DeserializeOptions) -> Any:
+			if isinstance(data, str):
+				return cls[data]
+			_mismatch(cls, data, str)
+		return deserialize_enum
 
 	# Literal
 	elif cls_org == TLiteral:
 		literals = _get_args(cls)
-		if data in literals:
-			return data
-		else:
+
+		def deserialize_literal(data: Any, _: _DeserializeOptions) -> Any:
+			if data in literals:
+				return data
 			raise ValueError('Input object {} does''t matches given literal {}'.format(data, cls))
+		return deserialize_literal
 
 	# regex
 	elif cls == re.Pattern:
-		if isinstance(data, str):
-			try:
-				return cast(T, re.compile(data))
-			except re.error as e:
-				raise ValueError('Invalid regular expression {!r}: {}'.format(data, e))
-		else:
-			mismatch(str)
+		def deserialize_pattern(data: Any, _: _DeserializeOptions) -> Any:
+			if isinstance(data, str):
+				try:
+					return re.compile(data)
+				except re.error as e:
+					raise ValueError('Invalid regular expression {!r}: {}'.format(data, e))
+			_mismatch(cls, data, str)
+		return deserialize_pattern
 
 	# UUID
 	elif cls == uuid.UUID:
-		if isinstance(data, str):
-			try:
-				return cast(T, uuid.UUID(hex=data))
-			except ValueError as e:
-				raise ValueError('Invalid uuid expression {!r}: {}'.format(data, e))
-		else:
-			mismatch(str)
+		def deserialize_uuid(data: Any, _: _DeserializeOptions) -> Any:
+			if isinstance(data, str):
+				try:
+					return uuid.UUID(hex=data)
+				except ValueError as e:
+					raise ValueError('Invalid uuid expression {!r}: {}'.format(data, e))
+			_mismatch(cls, data, str)
+		return deserialize_uuid
 
 	# Object
 	elif isinstance(cls, type):
-		if isinstance(data, dict):
-			try:
-				result = cls()
-			except Exception:
-				raise TypeError('Failed to construct instance of class {}'.format(type(cls)))
-
-			def set_result_attr(attr_name_, attr_value_):
-				if isinstance(result, Serializable):
-					result.validate_attribute(attr_name_, attr_value_)
-				result.__setattr__(attr_name_, attr_value_)
-
-			remaning_keys = set(data.keys())
-			for attr_name, attr_type in _get_type_hints(cls).items():
-				if not attr_name.startswith('_'):
-					if attr_name in data:
-						set_result_attr(attr_name, deserialize(data[attr_name], attr_type, **kwargs))
-						remaning_keys.remove(attr_name)
-					else:
-						if missing_callback is not None:
-							missing_callback(data, cls, attr_name)
-						if error_at_missing:
-							raise ValueError('Missing field {} for class {} in input object {}'.format(attr_name, cls, data))
-						elif hasattr(cls, attr_name):
-							set_result_attr(attr_name, copy.copy(getattr(cls, attr_name)))
-			if redundancy_callback is not None:
-				for k, v in data.items():
-					if k in remaning_keys:
-						redundancy_callback(data, cls, k, v)
-			if error_at_redundancy and len(remaning_keys) > 0:
-				raise ValueError('Unknown input attributes {} for class {} in input object {}'.format(remaning_keys, cls, data))
-			if isinstance(result, Serializable):
-				result.on_deserialization()
-			return result
-		else:
-			mismatch(dict)
+		return _compile_object_deserializer(cls)
 
 	# Unsupported
 	else:
-		raise TypeError('Unsupported target class: {}'.format(cls))
+		def deserialize_unsupported(data: Any, _: _DeserializeOptions) -> Any:
+			raise TypeError('Unsupported target class: {}'.format(cls))
+		return deserialize_unsupported
+
+
+def _deserialize_any(data: Any, _: _DeserializeOptions) -> Any:
+	return data
+
+
+def _compile_object_deserializer(cls: type) -> _Deserializer:
+	# (field name, field deserializer). Evaluated lazily, since the type hints might not be resolvable yet
+	fields: Optional[List[Tuple[str, _Deserializer]]] = None
+
+	def deserialize_object(data: Any, options: _DeserializeOptions) -> Any:
+		nonlocal fields
+		if not isinstance(data, dict):
+			_mismatch(cls, data, dict)
+		try:
+			result = cls()
+		except Exception:
+			raise TypeError('Failed to construct instance of class {}'.format(type(cls)))
+		if fields is None:
+			fields = [
+				(attr_name, _get_deserializer(attr_type))
+				for attr_name, attr_type in _get_type_hints(cls).items()
+				if not attr_name.startswith('_')
+			]
+
+		validate_attribute = result.validate_attribute if isinstance(result, Serializable) else None
+		assigned_count = 0
+		for attr_name, attr_deserializer in fields:
+			if attr_name in data:
+				attr_value = attr_deserializer(data[attr_name], options)
+				assigned_count += 1
+			else:
+				if options.missing_callback is not None:
+					options.missing_callback(data, cls, attr_name)
+				if options.error_at_missing:
+					raise ValueError('Missing field {} for class {} in input object {}'.format(attr_name, cls, data))
+				elif (attr_default := _get_field_default(cls, attr_name)) is not _NONE:
+					attr_value = copy.copy(attr_default)
+				else:
+					continue
+			if validate_attribute is not None:
+				validate_attribute(attr_name, attr_value)
+			result.__setattr__(attr_name, attr_value)
+
+		if options.redundancy_callback is not None or (options.error_at_redundancy and assigned_count < len(data)):
+			remaining_keys = set(data.keys())
+			for attr_name, _ in fields:
+				remaining_keys.discard(attr_name)
+			if options.redundancy_callback is not None:
+				for k, v in data.items():
+					if k in remaining_keys:
+						options.redundancy_callback(data, cls, k, v)
+			if options.error_at_redundancy and len(remaining_keys) > 0:
+				raise ValueError('Unknown input attributes {} for class {} in input object {}'.format(remaining_keys, cls, data))
+		if isinstance(result, Serializable):
+			result.on_deserialization()
+		return result
 
-	raise RuntimeError('if-else chain escape')
+	return deserialize_object
 
 
 _NONE = object()
 
 
-class Serializable(ABC):
+def _get_mro_slots(cls: type) -> List[str]:
+	slots: List[str] = []
+	for klass in reversed(cls.__mro__):
+		klass_slots = vars(klass).get('__slots__', ())
+		for name in ((klass_slots,) if isinstance(klass_slots, str) else klass_slots):
+			if name not in ('__dict__', '__weakref__') and name not in slots:
+				slots.append(name)
+	return slots
+
+
+def _get_field_default(cls: type, attr_name: str) -> Any:
+	"""
+	Return the default value of the field declared in the class, or _NONE if it does not have a default value
+	"""
+	if getattr(cls, '_slot_field_defaults', None) is None:
+		return getattr(cls, attr_name, _NONE)
+	# The default values of slot fields are stored in _slot_field_defaults,
+	# since the class attributes with the same names are the slot descriptors
+	for klass in cls.__mro__:
+		klass_vars = vars(klass)
+		slot_defaults: Optional[Dict[str, Any]] = klass_vars.get('_slot_field_defaults')
+		if slot_defaults is not None:
+			if attr_name in slot_defaults:
+				return slot_defaults[attr_name]
+			if isinstance(klass_vars.get(attr_name), types.MemberDescriptorType):
+				continue
+		if attr_name in klass_vars:
+			return klass_vars[attr_name]
+	return _NONE
+
+
+def _get_namespace_annotations(namespace: Dict[str, Any]) -> Dict[str, Any]:
+	if '__annotations__' in namespace:
+		return namespace['__annotations__']
+	if sys.version_info >= (3, 14):  # see PEP 649
+		if (annotate := namespace.get('__annotate__')) is not None:
+			import annotationlib
+			return annotationlib.call_annotate_function(annotate, annotationlib.Format.FORWARDREF)
+	return {}
+
+
+def _is_class_var_annotation(annotation: Any) -> bool:
+	if isinstance(annotation, str):
+		return annotation.startswith(('ClassVar', 'typing.ClassVar'))
+	return annotation is ClassVar or _get_origin(annotation) is ClassVar
+
+
+_IMMUTABLE_DEFAULT_CLASSES = (type(None), bool, int, float, str, bytes, Enum)
+
+
+def _create_slots_init(cls: Type['Serializable']) -> Callable[..., None]:
+	# (field name, default value, if the default value needs to be copied). Evaluated lazily, since the type hints might not be resolvable yet
+	init_plan: Optional[List[Tuple[str, Any, bool]]] = None
+
+	def __init__(self: 'Serializable', **kwargs):
+		nonlocal init_plan
+		if type(self) is not cls:  # a subclass without slots mode
+			Serializable.__init__(self, **kwargs)
+			return
+
+		if init_plan is None:
+			init_plan = []
+			for attr_name in cls.get_field_annotations():
+				default = _get_field_default(cls, attr_name)
+				init_plan.append((attr_name, default, not isinstance(default, _IMMUTABLE_DEFAULT_CLASSES)))
+		if len(kwargs) > 0:
+			field_annotations = cls.get_field_annotations()
+			for key in kwargs.keys():
+				if key not in field_annotations:
+					raise KeyError('Unknown key received in __init__ of class {}: {}'.format(cls, key))
+
+		for attr_name, default, copy_needed in init_plan:
+			value = kwargs.get(attr_name, _NONE)
+			if value is _NONE:
+				if default is _NONE:
+					continue
+				value = copy.copy(default) if copy_needed else default
+			setattr(self, attr_name, value)
+
+	__init__.__doc__ = Serializable.__init__.__doc__
+	return __init__
+
+
+class _SerializableMeta(ABCMeta):
+	def __new__(mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], *, slots: bool = False, **kwargs):
+		if slots:
+			if '__slots__' in namespace:
+				raise TypeError('Class {} in slots mode should not declare __slots__ by itself'.format(name))
+			inherited_slots = set()
+			for base in bases:
+				inherited_slots.update(_get_mro_slots(base))
+
+			namespace = dict(namespace)
+			slot_names: List[str] = []
+			slot_defaults: Dict[str, Any] = {}
+			for attr_name, annotation in _get_namespace_annotations(namespace).items():
+				if not _is_class_var_annotation(annotation) and attr_name not in inherited_slots:
+					slot_names.append(attr_name)
+			for attr_name in (*slot_names, *inherited_slots):
+				# the default value cannot be a class attribute, or it will conflict with the slot
+				if attr_name in namespace:
+					slot_defaults[attr_name] = namespace.pop(attr_name)
+			namespace['__slots__'] = tuple(slot_names)
+			namespace['_slot_field_defaults'] = slot_defaults
+
+		cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+		if slots and '__init__' not in namespace:
+			setattr(cls, '__init__', _create_slots_init(cast(Type['Serializable'], cls)))
+		return cls
+
+
+class Serializable(ABC, metaclass=_SerializableMeta):
 	"""
 	An abstract class for easy serializing / deserializing
 
@@ -425,8 +704,30 @@ class Serializable(ABC):
 		>>> Person.deserialize({'name': 'li_si', 'gender': 'female'}).gender == Gender.female
 		True
 
+	If you need to create a large amount of instances, you can enable the slots mode with the ``slots`` class keyword.
+	All fields annotated in the class will be stored in ``__slots__`` instead of the instance ``__dict__``,
+	which reduces the memory usage and speeds up the object creation::
+
+		>>> class BlockEntry(Serializable, slots=True):
+		... 	x: int = 0
+		... 	y: int = 0
+		... 	tags: List[str] = []
+
+		>>> BlockEntry(x=1).serialize()
+		{'x': 1, 'y': 0, 'tags': []}
+
+	Notes for the slots mode:
+
+	*   Subclasses need to enable the slots mode on their own, or their instances will still have a ``__dict__``
+	*   Attributes that are not annotated in the class cannot be set to the instances
+	*   The default values of the fields cannot be modified by assigning the class attributes after the class is created
+
+	.. versionadded:: v2.16.0
+		Added the slots mode
+
 	.. tip:: For more complex serialization/deserialization requirements, take a look at the `pydantic <https://github.com/pydantic/pydantic>`__ library
 	"""
+	__slots__ = ()
 
 	def __init__(self, **kwargs):
 		"""
@@ -492,8 +793,8 @@ class Serializable(ABC):
 		cls = self.__class__
 		for attr_name, attr_type in self.get_field_annotations().items():
 			value = value_provider(attr_name)
-			if value is _NONE and copy_default and hasattr(cls, attr_name):
-				value = copy.copy(getattr(cls, attr_name))
+			if value is _NONE and copy_default and (default := _get_field_default(cls, attr_name)) is not _NONE:
+				value = copy.copy(default)
 			if value is not _NONE:
 				setattr(self, attr_name, value)
 
@@ -0,0 +1,19 @@
+import sqlite3
+from pathlib import Path
+
+from mcdreforged.utils.types.path_like import PathStr
+
+
+def open_database(db_path: PathStr) -> sqlite3.Connection:
+	"""
+	Open a sqlite database connection, with the parent directory created
+
+	The connection can be used in multiple threads, but the caller needs to serialize the access to it.
+	WAL journal mode is used, so a commit is cheap and a crash will not corrupt the database
+	"""
+	db_path = Path(db_path)
+	db_path.parent.mkdir(parents=True, exist_ok=True)
+	conn = sqlite3.connect(db_path, check_same_thread=False)
+	conn.execute('PRAGMA journal_mode=WAL')
+	conn.execute('PRAGMA synchronous=NORMAL')
+	return conn
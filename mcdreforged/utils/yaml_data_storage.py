@@ -3,13 +3,14 @@ from io import StringIO
 from logging import Logger
 from pathlib import Path
 from threading import RLock
-from typing import Tuple, Callable, Optional
+from typing import Tuple, Callable, Optional, Any
 
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.scalarbool import ScalarBoolean
 
-from mcdreforged.utils import resources_utils, file_utils
+from mcdreforged.constants import core_constant
+from mcdreforged.utils import resources_utils, file_utils, parse_cache
 from mcdreforged.utils.lazy_item import LazyItem
 
 
@@ -29,15 +30,47 @@ def transform_yaml_to_dict(source: dict) -> dict:
 	return ret
 
 
+def transform_yaml_to_plain(value: Any) -> Any:
+	"""
+	Recursively transform the yaml data into data with builtin types only
+	"""
+	if isinstance(value, dict):
+		return {transform_yaml_to_plain(k): transform_yaml_to_plain(v) for k, v in value.items()}
+	elif isinstance(value, (list, tuple)):
+		return [transform_yaml_to_plain(v) for v in value]
+	elif isinstance(value, ScalarBoolean):  # ScalarBoolean uses int as the base class
+		return bool(value)
+	for cls in [bool, int, float, str]:
+		if isinstance(value, cls):
+			return cls(value)
+	return value
+
+
+def load_yaml_file(file_path: Path) -> Any:
+	with open(file_path, encoding='utf8') as file:
+		return YAML().load(file)
+
+
 class YamlDataStorage:
 	def __init__(self, logger: Logger, file_path: str, default_file_path: str):
 		self._logger = logger
 		self.__file_path = Path(file_path)
 		self.__default_file_path = default_file_path
 		self.__default_data = LazyItem(lambda: resources_utils.get_yaml(self.__default_file_path))
+		self.__default_plain_data = LazyItem(self.__load_default_plain_data)
 		self._data: dict = CommentedMap()
+		# If _data is loaded from the parse cache. If so, it contains no comment, and the comments need to be loaded before saving
+		self.__data_from_cache = False
 		self._data_operation_lock = RLock()
 
+	def __load_default_plain_data(self) -> dict:
+		default_file_path = Path(core_constant.PACKAGE_PATH) / self.__default_file_path
+		if default_file_path.is_file():
+			data, _ = parse_cache.load_with_cache(default_file_path, 'yaml', load_yaml_file, transform_yaml_to_plain)
+		else:
+			data = self.__default_data.get()
+		return transform_yaml_to_plain(data)
+
 	def __getitem__(self, option: str):
 		return self._data[option]
 
@@ -56,21 +89,33 @@ class YamlDataStorage:
 		:return: if there is any missing data entry
 		:raise: FileNotFoundError
 		"""
+		from_cache = False
 		if self.file_presents():
-			with open(self.__file_path, encoding='utf8') as file:
-				users_data = YAML().load(file)
+			# parsing with comments is slow, so try the cache first. Comments are loaded on demand in save()
+			users_data, from_cache = parse_cache.load_with_cache(self.__file_path, 'yaml', load_yaml_file, transform_yaml_to_plain)
 		else:
 			if not allowed_missing_file:
 				raise FileNotFoundError()
 			users_data = {}
-		fixed_result, has_missing = self.__fix(dict(self.__default_data.get()), users_data)
+		default_data = self.__default_plain_data.get() if from_cache else self.__default_data.get()
+		fixed_result, has_missing = self.__fix(dict(default_data), users_data)
 		with self._data_operation_lock:
 			self._data = fixed_result
+			self.__data_from_cache = from_cache
 		if has_missing and save_on_missing:
 			self.save()
 		return has_missing
 
-	def __fix(self, current_data: dict, users_data: CommentedMap, key_path: str = '') -> Tuple[dict, bool]:
+	def __load_data_with_comments(self) -> dict:
+		"""
+		Load the data file with comments, and apply the current data onto it
+		"""
+		users_data = load_yaml_file(self.__file_path)
+		result, _ = self.__fix(dict(self.__default_data.get()), users_data, log_missing=False)
+		self.merge_dict(self._data, result)
+		return result
+
+	def __fix(self, current_data: dict, users_data: CommentedMap, key_path: str = '', *, log_missing: bool = True) -> Tuple[dict, bool]:
 		"""
 		:return: pair of (fixed result, has missing)
 		"""
@@ -83,18 +128,19 @@ class YamlDataStorage:
 
 			current_users_keys = list(users_data.keys())
 			last_user_key = current_users_keys[-1] if len(current_users_keys) > 0 else None
-			try:
-				comment_dict: dict = result.ca.items
-			except AttributeError:
-				self._logger.warning('Failed to access comment dict for {}'.format(type(result)))
-				comment_dict = {}
+			comment_dict: dict = {}
+			if isinstance(result, CommentedMap):  # data from the parse cache has no comment
+				try:
+					comment_dict = result.ca.items
+				except AttributeError:
+					self._logger.warning('Failed to access comment dict for {}'.format(type(result)))
 			for key in current_data.keys():
 				current_key_path = key_path + divider + key
 				if key in users_data:
 					# if key presents in user's data
 					if isinstance(current_data[key], dict):
 						# dive deeper
-						result[key], missing = self.__fix(current_data[key], users_data[key], current_key_path)
+						result[key], missing = self.__fix(current_data[key], users_data[key], current_key_path, log_missing=log_missing)
 						has_missing |= missing
 					else:
 						# use the value in user's data
@@ -108,7 +154,8 @@ class YamlDataStorage:
 						# notes: in ruamel.yaml, the comment of an element is at the below of the element, not above
 						# example hack fix usage: adding new elements in the mcdr config "debug" dict
 						comment_dict[key] = comment_dict.pop(last_user_key)
-					self._logger.warning('Option {!r} missing, use default value {!r}'.format(current_key_path, current_data[key]))
+					if log_missing:
+						self._logger.warning('Option {!r} missing, use default value {!r}'.format(current_key_path, current_data[key]))
 			return result, has_missing
 
 	def _pre_save(self, data: dict):
@@ -141,6 +188,12 @@ class YamlDataStorage:
 
 	def save(self):
 		with self._data_operation_lock:
+			if self.__data_from_cache:
+				try:
+					self._data = self.__load_data_with_comments()
+				except Exception as e:
+					self._logger.warning('Failed to load comments from {}, saving without comments: {}'.format(self.__file_path, e))
+				self.__data_from_cache = False
 			self.__save(self._data)
 
 	def get_default_yaml(self) -> CommentedMap:
@@ -0,0 +1,52 @@
+"""
+Benchmark for command execution on deep command trees with requirements at each level
+
+Usage: python -m tests.benchmark.bench_command_context
+"""
+import timeit
+
+from typing_extensions import override
+
+from mcdreforged.api.command import *
+from mcdreforged.api.types import CommandSource
+
+
+class _BenchCommandSource(CommandSource):
+	@override
+	def get_server(self):
+		raise RuntimeError()
+
+	@override
+	def get_permission_level(self) -> int:
+		return 4
+
+	@override
+	def reply(self, message, **kwargs) -> None:
+		pass
+
+
+def create_deep_tree(depth: int) -> Literal:
+	root = Literal('root')
+	node: AbstractNode = root
+	for i in range(depth):
+		child = Integer('arg{}'.format(i)) if i % 2 == 0 else Literal('lit{}'.format(i))
+		child.requires(lambda src: src.has_permission(1))
+		child.requires(lambda src, ctx: len(ctx) >= 0)
+		node.then(child)
+		node = child
+	node.runs(lambda src, ctx: None)
+	return root
+
+
+def main():
+	source = _BenchCommandSource()
+	for depth in [8, 32, 128]:
+		root = create_deep_tree(depth)
+		command = ' '.join(['root'] + [str(i) if i % 2 == 0 else 'lit{}'.format(i) for i in range(depth)])
+		number = max(1, 5000 // depth)
+		t = timeit.timeit(lambda: root._entry_execute(source, command), number=number)
+		print('depth {:>3}: _entry_execute {:.3f}ms'.format(depth, t / number * 1000))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,154 @@
+"""
+Benchmark for command tree building, execution and suggestion on synthetic large command trees
+
+The command tree contains all argument node types from :mod:`mcdreforged.command.builder.nodes.arguments`,
+with requirements on every node and a redirecting alias root. Results are printed in json,
+so they can be compared across MCDR versions
+
+Usage: python -m tests.benchmark.bench_command_tree [--width 8] [--depth 6] [--number 200] [--output result.json]
+"""
+import argparse
+import json
+import platform
+import timeit
+from enum import Enum
+from typing import List, Callable, Dict, Tuple
+
+from typing_extensions import override
+
+from mcdreforged.api.command import *
+from mcdreforged.api.types import CommandSource
+from mcdreforged.constants import core_constant
+
+
+class _BenchEnum(Enum):
+	alpha = 1
+	beta = 2
+	gamma = 3
+
+
+class _BenchCommandSource(CommandSource):
+	@override
+	def get_server(self):
+		raise RuntimeError()
+
+	@override
+	def get_permission_level(self) -> int:
+		return 4
+
+	@override
+	def reply(self, message, **kwargs) -> None:
+		pass
+
+
+# (node factory, a sample input that the node accepts)
+_ARGUMENT_TYPES: List[Tuple[Callable[[str], ArgumentNode], str]] = [
+	(Number, '1.5'),
+	(Integer, '3'),
+	(Float, '2.5'),
+	(Text, 'word'),
+	(QuotableText, '"quoted text"'),
+	(Boolean, 'true'),
+	(lambda name: Enumeration(name, _BenchEnum), 'beta'),
+]
+_GREEDY_TEXT_SAMPLE = 'the rest of the command'
+_ROOT = '!!bench'
+_ALIAS_ROOT = '!!b'
+
+
+def _callback(src: CommandSource, ctx: CommandContext):
+	pass
+
+
+def _requirement(src: CommandSource, ctx: CommandContext) -> bool:
+	return len(ctx) >= 0
+
+
+def create_builder(width: int, depth: int) -> SimpleCommandBuilder:
+	"""
+	Each level has *width* literal branches. All branches are followed by an argument node,
+	and only the 1st branch continues to the next level. The last level ends with a :class:`GreedyText`
+	"""
+	builder = SimpleCommandBuilder()
+	prefix = _ROOT
+	for level in range(depth):
+		arg_factory = _ARGUMENT_TYPES[level % len(_ARGUMENT_TYPES)][0]
+		builder.arg('a{}'.format(level), arg_factory).requires(_requirement)
+		for i in range(width):
+			literal = 'l{}_{}'.format(level, i)
+			builder.literal(literal).requires(Requirements.has_permission(1))
+			builder.command('{} {} <a{}>'.format(prefix, literal, level), _callback)
+		prefix = '{} l{}_0 <a{}>'.format(prefix, level, level)
+	builder.arg('rest', GreedyText).requires(_requirement)
+	builder.command('{} <rest>'.format(prefix), _callback)
+	return builder
+
+
+def create_trees(width: int, depth: int) -> List[Literal]:
+	root = create_builder(width, depth).build()[0]
+	assert isinstance(root, Literal)
+	alias = Literal(_ALIAS_ROOT).requires(Requirements.has_permission(1)).redirects(root)
+	return [root, alias]
+
+
+def create_full_command(root: str, depth: int) -> str:
+	segments = [root]
+	for level in range(depth):
+		segments.append('l{}_0'.format(level))
+		segments.append(_ARGUMENT_TYPES[level % len(_ARGUMENT_TYPES)][1])
+	segments.append(_GREEDY_TEXT_SAMPLE)
+	return ' '.join(segments)
+
+
+def measure(func: Callable[[], object], number: int) -> Dict[str, float]:
+	repeats = timeit.repeat(func, number=number, repeat=5)
+	return {
+		'best_ms': min(repeats) / number * 1000,
+		'mean_ms': sum(repeats) / len(repeats) / number * 1000,
+	}
+
+
+def run(width: int, depth: int, number: int) -> dict:
+	source = _BenchCommandSource()
+	root, alias = create_trees(width, depth)
+	command = create_full_command(_ROOT, depth)
+	alias_command = create_full_command(_ALIAS_ROOT, depth)
+	suggest_command = command.rsplit(' ', 2)[0] + ' '  # suggest the last argument
+	assert len(root._entry_execute(source, command)) == 1
+	assert len(alias._entry_execute(source, alias_command)) == 1
+
+	builder = create_builder(width, depth)
+	return {
+		'build': measure(lambda: builder.build(use_cache=False), max(1, number // 10)),
+		'execute': measure(lambda: root._entry_execute(source, command), number),
+		'execute_redirected': measure(lambda: alias._entry_execute(source, alias_command), number),
+		'suggest_root': measure(lambda: root._entry_generate_suggestions(source, _ROOT + ' '), number),
+		'suggest_leaf': measure(lambda: root._entry_generate_suggestions(source, suggest_command), number),
+	}
+
+
+def main():
+	parser = argparse.ArgumentParser(description='MCDR command tree benchmark')
+	parser.add_argument('--width', type=int, default=8, help='Amount of the literal branches on each level')
+	parser.add_argument('--depth', type=int, default=6, help='Amount of the levels')
+	parser.add_argument('--number', type=int, default=200, help='Amount of the executions in each measurement')
+	parser.add_argument('--output', help='Write the json result into the given file as well')
+	args = parser.parse_args()
+
+	result = {
+		'mcdr_version': core_constant.VERSION,
+		'python_version': platform.python_version(),
+		'width': args.width,
+		'depth': args.depth,
+		'number': args.number,
+		'results': run(args.width, args.depth, args.number),
+	}
+	result_json = json.dumps(result, indent=2)
+	print(result_json)
+	if args.output is not None:
+		with open(args.output, 'w', encoding='utf8') as f:
+			f.write(result_json)
+
+
+if __name__ == '__main__':
+	main()
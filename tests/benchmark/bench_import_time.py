@@ -0,0 +1,65 @@
+"""
+Benchmark for the import time of MCDR entry modules, measured with ``python -X importtime`` in fresh interpreters
+
+For each entry, the cumulative import time of the entry module and the slowest imported top-level packages are printed
+
+Usage: python -m tests.benchmark.bench_import_time [--number 5] [--top 8]
+"""
+import argparse
+import collections
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).absolute().parent.parent.parent
+ENTRIES = [
+	'mcdreforged',
+	'mcdreforged.cli.cli_entry',
+	'mcdreforged.api.all',
+	'mcdreforged.mcdr_server',
+]
+_IMPORT_TIME_LINE_REGEX = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)$')
+
+
+def measure_import_time(module: str) -> Dict[str, int]:
+	"""
+	:return: a dict, module name -> cumulative import time in microseconds
+	"""
+	proc = subprocess.run(
+		[sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module)],
+		cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+	)
+	result: Dict[str, int] = {}
+	for line in proc.stderr.splitlines():
+		if (m := _IMPORT_TIME_LINE_REGEX.match(line)) is not None:
+			result[m.group(4)] = int(m.group(2))
+	return result
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--number', type=int, default=5, help='Rounds for each entry')
+	parser.add_argument('--top', type=int, default=8, help='Amount of the slowest top-level packages to show')
+	args = parser.parse_args()
+
+	for entry in ENTRIES:
+		totals: List[int] = []
+		packages: Dict[str, List[int]] = collections.defaultdict(list)
+		for _ in range(args.number):
+			result = measure_import_time(entry)
+			totals.append(result[entry])
+			for module, cost in result.items():
+				if '.' not in module and module != entry:
+					packages[module].append(cost)
+
+		print('{}: {:.1f}ms'.format(entry, statistics.median(totals) / 1000))
+		slowest = sorted(packages.items(), key=lambda item: statistics.median(item[1]), reverse=True)[:args.top]
+		for package, costs in slowest:
+			print('  {}: {:.1f}ms'.format(package, statistics.median(costs) / 1000))
+
+
+if __name__ == '__main__':
+	main()
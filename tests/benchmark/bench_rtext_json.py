@@ -0,0 +1,43 @@
+"""
+Benchmark for RText json serialization
+
+Usage: python -m tests.benchmark.bench_rtext_json
+"""
+import json
+import timeit
+
+from mcdreforged.api.rtext import *
+
+
+def create_table(rows: int) -> RTextBase:
+	text = RTextList()
+	for i in range(rows):
+		text.append(
+			RText('[{}]'.format(i), RColor.gray),
+			' ',
+			RText('plugin_{}'.format(i), RColor.yellow, RStyle.bold).c(RClickAction.suggest_command, '!!MCDR plugin info plugin_{}'.format(i)).h(
+				RText('Plugin ', RColor.gray), RText('plugin_{}'.format(i), RColor.yellow), '\n', RTextTranslation('gui.done').arg(i),
+			),
+			' ',
+			RText('v1.0.{}'.format(i), RColorRGB.from_rgb(i % 256, 128, 255)),
+			'\n',
+		)
+	return text
+
+
+def main():
+	text = create_table(200)
+	for json_format in RTextJsonFormat:
+		expected = json.dumps(text.to_json_object(json_format=json_format), ensure_ascii=False, separators=(',', ':'))
+		assert text.to_json_str(json_format=json_format) == expected, json_format
+
+		number = 200
+		t_old = timeit.timeit(lambda: json.dumps(text.to_json_object(json_format=json_format), ensure_ascii=False, separators=(',', ':')), number=number)
+		t_new = timeit.timeit(lambda: text.to_json_str(json_format=json_format), number=number)
+		print('{}: to_json_object + json.dumps {:.3f}ms, to_json_str {:.3f}ms, speedup x{:.2f}'.format(
+			json_format.name, t_old / number * 1000, t_new / number * 1000, t_old / t_new,
+		))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,55 @@
+"""
+Benchmark for the memory usage and the creation speed of Serializable instances, with and without the slots mode
+
+Usage: python -m tests.benchmark.bench_serializable_slots
+"""
+import timeit
+import tracemalloc
+from typing import Callable, List
+
+from mcdreforged.api.utils import Serializable
+
+
+class BlockEntry(Serializable):
+	x: int = 0
+	y: int = 0
+	z: int = 0
+	block: str = 'minecraft:air'
+	tags: List[str] = []
+
+
+class SlotsBlockEntry(Serializable, slots=True):
+	x: int = 0
+	y: int = 0
+	z: int = 0
+	block: str = 'minecraft:air'
+	tags: List[str] = []
+
+
+def measure_memory(factory: Callable[[int], Serializable], amount: int) -> int:
+	tracemalloc.start()
+	try:
+		entries = [factory(i) for i in range(amount)]
+		size, _ = tracemalloc.get_traced_memory()
+		del entries
+	finally:
+		tracemalloc.stop()
+	return size
+
+
+def main():
+	amount = 100000
+	for cls in (BlockEntry, SlotsBlockEntry):
+		def factory(i: int) -> Serializable:
+			return cls(x=i, y=64, z=-i, block='minecraft:stone')
+
+		size = measure_memory(factory, amount)
+		t_init = timeit.timeit(lambda: factory(1), number=amount)
+		t_deserialize = timeit.timeit(lambda: cls.deserialize({'x': 1, 'y': 2, 'z': 3}), number=amount)
+		print('{}: {:.1f} bytes per instance, __init__ {:.3f}us, deserialize {:.3f}us'.format(
+			cls.__name__, size / amount, t_init / amount * 1e6, t_deserialize / amount * 1e6,
+		))
+
+
+if __name__ == '__main__':
+	main()
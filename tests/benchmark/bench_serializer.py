@@ -0,0 +1,65 @@
+"""
+Benchmark for serializing / deserializing a large Serializable data set
+
+Usage: python -m tests.benchmark.bench_serializer
+"""
+import timeit
+from typing import List, Dict, Optional, Union
+
+from mcdreforged.api.utils import serialize, deserialize, Serializable
+
+
+class Position(Serializable):
+	x: float = 0
+	y: float = 0
+	z: float = 0
+	dim: Union[int, str] = 0
+
+
+class Warp(Serializable):
+	name: str = ''
+	pos: Position = Position()
+	description: Optional[str] = None
+	tags: List[str] = []
+
+
+class PlayerStats(Serializable):
+	player: str = ''
+	stats: Dict[str, int] = {}
+	warps: List[Warp] = []
+
+
+Storage = Dict[str, PlayerStats]
+
+
+def create_storage(players: int) -> Storage:
+	storage: Storage = {}
+	for i in range(players):
+		name = 'Player{}'.format(i)
+		storage[name] = PlayerStats(
+			player=name,
+			stats={'stat_{}'.format(j): i * j for j in range(10)},
+			warps=[
+				Warp(name='warp_{}'.format(j), pos=Position(x=i, y=64.5, z=-j, dim='minecraft:overworld'), tags=['home', 'public'])
+				for j in range(5)
+			],
+		)
+	return storage
+
+
+def main():
+	storage = create_storage(1000)
+	data = serialize(storage)
+	assert deserialize(data, Storage, error_at_missing=True, error_at_redundancy=True) == storage
+
+	number = 10
+	t_ser = timeit.timeit(lambda: serialize(storage), number=number)
+	t_de = timeit.timeit(lambda: deserialize(data, Storage), number=number)
+	t_copy = timeit.timeit(lambda: storage['Player0'].copy(), number=number * 100)
+	print('serialize: {:.3f}ms'.format(t_ser / number * 1000))
+	print('deserialize: {:.3f}ms'.format(t_de / number * 1000))
+	print('copy: {:.3f}ms'.format(t_copy / number / 100 * 1000))
+
+
+if __name__ == '__main__':
+	main()
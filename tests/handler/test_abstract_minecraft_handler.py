@@ -35,6 +35,25 @@ class MyTestCase(unittest.TestCase):
 		self.assertTrue(_does_mc_version_has_execute_command('1.21.1 Release Candidate 1'))
 		self.assertTrue(_does_mc_version_has_execute_command('1.21 release candidate 1'))
 
+	def test_get_send_message_commands(self):
+		from mcdreforged.handler.impl import VanillaHandler, Beta18Handler
+		from mcdreforged.info_reactor.server_information import ServerInformation
+		from mcdreforged.minecraft.rtext.style import RColor
+		from mcdreforged.minecraft.rtext.text import RText
+
+		message = RText('hello', RColor.red)
+		for version in [None, '1.12.2', '1.21.5']:
+			server_information = ServerInformation()
+			server_information.version = version
+			for handler in [VanillaHandler(), Beta18Handler()]:
+				with self.subTest(version=version, handler=handler.get_name()):
+					targets = ['Steve', 'Alex', 'Notch']
+					self.assertEqual(
+						[handler.get_send_message_command(target, message, server_information) for target in targets],
+						handler.get_send_message_commands(targets, message, server_information),
+					)
+					self.assertEqual([], handler.get_send_message_commands([], message, server_information))
+
 
 if __name__ == '__main__':
 	unittest.main()
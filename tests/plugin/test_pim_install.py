@@ -0,0 +1,104 @@
+import datetime
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import Mapping, List
+from unittest import mock
+
+from typing_extensions import override
+
+from mcdreforged.logging.logger import MCDReforgedLogger
+from mcdreforged.minecraft.rtext.text import RText, RTextBase
+from mcdreforged.plugin.builtin.mcdr.commands.pim_internal import pim_utils
+from mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_install import PimInstallCommandHandler
+from mcdreforged.plugin.installer.types import MetaRegistry, PluginData, ReleaseData
+
+
+class _TestMetaRegistry(MetaRegistry):
+	def __init__(self, *plugin_ids: str):
+		self.__plugins = {}
+		for plugin_id in plugin_ids:
+			self.__plugins[plugin_id] = PluginData(
+				id=plugin_id, name=plugin_id,
+				repos_url='https://example.com', repos_owner='owner', repos_name=plugin_id,
+				latest_version='1.0.0', description={},
+				releases={'1.0.0': ReleaseData(
+					version='1.0.0', tag_name='v1.0.0', url='', created_at=datetime.datetime.now(),
+					dependencies={}, requirements=[], asset_id=1,
+					file_name='{}-v1.0.0.mcdr'.format(plugin_id), file_size=0, file_url='', file_sha256='0' * 64,
+				)},
+			)
+
+	@property
+	@override
+	def plugins(self) -> Mapping[str, PluginData]:
+		return self.__plugins
+
+
+def _tr(key: str, *args, **kwargs) -> RTextBase:
+	return RText(key)
+
+
+class PimInstallTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.data_dir = Path(self.temp_dir.name) / 'data'
+		self.data_dir.mkdir()
+		self.plugin_dir = Path(self.temp_dir.name) / 'plugins'
+		self.plugin_dir.mkdir()
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	def create_handler(self) -> PimInstallCommandHandler:
+		plugin_manager = mock.Mock()
+		plugin_manager.plugin_directories = [self.plugin_dir]
+		plugin_manager.get_all_plugins.return_value = []
+		plugin_manager.get_regular_plugins.return_value = []
+		plugin_manager.get_plugin_from_id.return_value = None
+
+		pim_ext = mock.Mock()
+		pim_ext.mcdr_plugin.server_interface.logger = MCDReforgedLogger()
+		pim_ext.mcdr_plugin.server_interface.get_data_folder.return_value = str(self.data_dir)
+		pim_ext.mcdr_plugin.mcdr_server.plugin_manager = plugin_manager
+		pim_ext.pim_tr = _tr
+		pim_ext.tr = _tr
+		pim_ext.get_cata_meta.return_value = _TestMetaRegistry('my_plugin')
+		# noinspection PyTypeChecker
+		return PimInstallCommandHandler(pim_ext)
+
+	def create_old_download_temp(self, name: str, age: float) -> Path:
+		path = self.data_dir / name
+		path.mkdir()
+		mtime = time.time() - age
+		os.utime(path, (mtime, mtime))
+		return path
+
+	def test_1_delete_remaining_download_temp(self):
+		old_temp = self.create_old_download_temp('pim_1', pim_utils.DOWNLOAD_TEMP_DIR_MAX_AGE + 60)
+		new_temp = self.create_old_download_temp('pim_2', 60)
+		other_dir = self.create_old_download_temp('other', pim_utils.DOWNLOAD_TEMP_DIR_MAX_AGE + 60)
+		pim_utils.delete_remaining_download_temp(self.data_dir, MCDReforgedLogger())
+		self.assertFalse(old_temp.exists())
+		self.assertTrue(new_temp.is_dir())
+		self.assertTrue(other_dir.is_dir())
+
+	def test_2_install_dry_run(self):
+		old_temp = self.create_old_download_temp('pim_1', pim_utils.DOWNLOAD_TEMP_DIR_MAX_AGE + 60)
+		handler = self.create_handler()
+
+		replies: List[str] = []
+		source = mock.Mock()
+		source.reply.side_effect = lambda msg, **kwargs: replies.append(str(msg))
+		handler.process(source, {'plugin_specifier': ['my_plugin'], 'dry_run': 1, 'skip_confirm': 1})
+
+		self.assertIn('install.downloading_plugin_one', ''.join(replies))
+		self.assertEqual('install.installation_done', replies[-1])
+		self.assertFalse(old_temp.exists())
+		self.assertEqual([], os.listdir(self.plugin_dir))
+
+
+if __name__ == '__main__':
+	unittest.main()
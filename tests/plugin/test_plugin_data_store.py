@@ -0,0 +1,130 @@
+import logging
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import List
+
+from mcdreforged.plugin.si.plugin_data_store import PluginDataStore
+from mcdreforged.utils.exception import IllegalStateError
+from mcdreforged.utils.serializer import Serializable
+
+
+class _PlayerData(Serializable):
+	kills: int = 0
+	tags: List[str] = []
+
+
+class PluginDataStoreTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.db_path = Path(self.temp_dir.name) / 'data.db'
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	def create_store(self) -> PluginDataStore:
+		# noinspection PyTypeChecker
+		return PluginDataStore(logging.getLogger('test'), self.db_path)
+
+	def read_db_keys(self) -> List[str]:
+		conn = sqlite3.connect(self.db_path)
+		try:
+			return [row[0] for row in conn.execute('SELECT key FROM data ORDER BY key')]
+		finally:
+			conn.close()
+
+	def test_1_get_put_scan(self):
+		store = self.create_store()
+		self.assertIsNone(store.get('a'))
+		self.assertEqual(1, store.get('a', 1))
+
+		store.put('a', 1)
+		store.put('player.Steve', _PlayerData(kills=2))
+		store.put('player.Alex', _PlayerData(tags=['x']))
+		store.put('playerX', 'not a player')
+		self.assertEqual(1, store.get('a'))
+		self.assertIn('a', store)
+		self.assertEqual({'kills': 2, 'tags': []}, store.get('player.Steve'))
+		self.assertEqual(_PlayerData(kills=2), store.get('player.Steve', target_class=_PlayerData))
+		self.assertEqual([], self.read_db_keys())  # not written yet
+
+		store.flush()
+		self.assertEqual(['a', 'player.Alex', 'player.Steve', 'playerX'], self.read_db_keys())
+
+		store.delete('player.Alex')
+		store.put('player.Bob', _PlayerData())
+		self.assertNotIn('player.Alex', store)
+		# pending modifications are merged with the database
+		self.assertEqual(
+			[('player.Bob', _PlayerData()), ('player.Steve', _PlayerData(kills=2))],
+			list(store.scan('player.', target_class=_PlayerData)),
+		)
+		self.assertEqual(['a', 'player.Bob', 'player.Steve', 'playerX'], [key for key, _ in store.scan()])
+
+		# closing flushes
+		store.close()
+		self.assertTrue(store.closed)
+		self.assertRaises(IllegalStateError, store.get, 'a')
+		self.assertRaises(IllegalStateError, store.put, 'a', 2)
+		self.assertEqual(['a', 'player.Bob', 'player.Steve', 'playerX'], self.read_db_keys())
+
+		store = self.create_store()
+		self.assertEqual(_PlayerData(kills=2), store.get('player.Steve', target_class=_PlayerData))
+		store.close()
+
+	def test_2_transaction(self):
+		store = self.create_store()
+		store.put('Steve', 10)
+		with store.transaction() as txn:
+			txn.put('Steve', txn.get('Steve', 0) - 3)
+			txn.put('Alex', txn.get('Alex', 0) + 3)
+			self.assertEqual(7, txn.get('Steve'))
+			self.assertEqual(10, store.get('Steve'))  # not applied yet
+			txn.delete('Bob')
+		self.assertEqual(7, store.get('Steve'))
+		self.assertEqual(3, store.get('Alex'))
+
+		with self.assertRaises(KeyError):
+			with store.transaction() as txn:
+				txn.put('Steve', 0)
+				txn.delete('Alex')
+				raise KeyError()
+		# discarded
+		self.assertEqual(7, store.get('Steve'))
+		self.assertEqual(3, store.get('Alex'))
+		store.close()
+
+	def test_3_transaction_isolation(self):
+		store = self.create_store()
+		store.put('counter', 0)
+
+		def increase():
+			for _ in range(50):
+				with store.transaction() as txn:
+					value = txn.get('counter')
+					time.sleep(0.0001)  # let others try to modify it in between
+					txn.put('counter', value + 1)
+				store.put('other', 1)
+
+		threads = [threading.Thread(target=increase) for _ in range(4)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		self.assertEqual(200, store.get('counter'))
+
+		# flushing inside a transaction is fine
+		with store.transaction() as txn:
+			txn.put('counter', 0)
+			store.flush()
+		store.close()
+		store = self.create_store()
+		self.assertEqual(0, store.get('counter'))
+		store.close()
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,231 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import unittest
+import zipfile
+from pathlib import Path
+from typing import List, Optional, Dict
+from unittest import mock
+
+from mcdreforged.plugin.operation_result import SingleOperationResult
+from mcdreforged.plugin.plugin_manager import PluginManager
+from mcdreforged.plugin.type.common import PluginState
+from mcdreforged.plugin.type.directory_plugin import DirectoryPlugin, LinkedDirectoryPlugin
+from mcdreforged.plugin.type.packed_plugin import PackedPlugin
+from mcdreforged.plugin.type.plugin import AbstractPlugin
+
+
+class _TestLogger(logging.Logger):
+	def mdebug(self, *args, **kwargs):
+		pass
+
+
+class _TestTranslator:
+	def tr(self, key: str, *args, **kwargs) -> str:
+		return key
+
+
+class _TestMCDRServer:
+	def __init__(self):
+		self.logger = _TestLogger('test')
+
+	def create_internal_translator(self, _prefix: str) -> _TestTranslator:
+		return _TestTranslator()
+
+	def add_config_changed_callback(self, _callback):
+		pass
+
+
+class PluginManagerTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.plugin_directory = Path(self.temp_dir.name) / 'plugins'
+		self.plugin_directory.mkdir()
+		self.extra_plugin_directory = Path(self.temp_dir.name) / 'extra_plugins'
+		self.extra_plugin_directory.mkdir()
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	def create_manager(self) -> PluginManager:
+		# noinspection PyTypeChecker
+		manager = PluginManager(_TestMCDRServer())
+		manager.set_plugin_directories([str(self.plugin_directory), str(self.extra_plugin_directory)])
+		return manager
+
+	def create_packed_plugin(self, file_name: str, plugin_id: str, *, directory: Optional[Path] = None, files: Optional[Dict[str, bytes]] = None):
+		with zipfile.ZipFile((directory or self.plugin_directory) / file_name, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+			zip_file.writestr('mcdreforged.plugin.json', json.dumps({'id': plugin_id, 'version': '1.0.0'}))
+			zip_file.writestr('{}/__init__.py'.format(plugin_id), '')
+			for name, content in (files or {}).items():
+				zip_file.writestr(name, content)
+
+	@staticmethod
+	def load_new_plugins(manager: PluginManager) -> SingleOperationResult:
+		# noinspection PyUnresolvedReferences
+		return manager._PluginManager__collect_and_load_new_plugins(lambda _: True)
+
+	def test_1_concurrent_loading(self):
+		for i in range(20):
+			self.create_packed_plugin('plugin_{}.mcdr'.format(i), 'plugin_{}'.format(i))
+		self.create_packed_plugin('duplicated.mcdr', 'plugin_0', directory=self.extra_plugin_directory)
+		with zipfile.ZipFile(self.plugin_directory / 'broken.mcdr', 'w') as zip_file:
+			zip_file.writestr('foo.txt', 'no metadata')
+		(self.plugin_directory / 'not_a_plugin.txt').write_text('foo')
+
+		loading_threads: List[str] = []
+		original_on_load = PackedPlugin._on_load
+
+		def on_load(plugin: PackedPlugin):
+			loading_threads.append(threading.current_thread().name)
+			original_on_load(plugin)
+
+		manager = self.create_manager()
+		with mock.patch.object(PackedPlugin, '_on_load', on_load):
+			result = self.load_new_plugins(manager)
+		self.assertEqual(22, len(loading_threads))
+		self.assertTrue(all(name.startswith('PluginLoader') for name in loading_threads))
+
+		self.assertEqual({'plugin_{}'.format(i) for i in range(20)}, {plugin.get_id() for plugin in result.success_list})
+		self.assertEqual({'duplicated.mcdr', 'broken.mcdr'}, {path.name for path in result.failed_list})
+		self.assertEqual(20, manager.get_plugin_amount())
+		for plugin in result.success_list:
+			self.assertEqual(PluginState.LOADED, plugin.state)
+			self.assertIsInstance(plugin, PackedPlugin)
+			self.assertEqual(64, len(plugin.get_file_sha256()))
+		self.assertEqual(
+			self.plugin_directory / 'plugin_0.mcdr',
+			manager.get_regular_plugin_from_id('plugin_0').plugin_path,
+		)
+
+		# loaded plugins are skipped
+		self.assertEqual(0, len(self.load_new_plugins(manager).success_list))
+
+	def test_2_packed_plugin_file_access(self):
+		asset = os.urandom(1024 * 1024)
+		self.create_packed_plugin('plugin.mcdr', 'my_plugin', files={'assets/map.bin': asset, 'assets/foo.txt': b'foo'})
+		manager = self.create_manager()
+		self.assertEqual(1, len(self.load_new_plugins(manager).success_list))
+		plugin = manager.get_regular_plugin_from_id('my_plugin')
+		self.assertIsInstance(plugin, PackedPlugin)
+
+		self.assertEqual({'map.bin', 'foo.txt'}, set(plugin.list_directory('assets')))
+		with plugin.open_file('assets/foo.txt') as f:
+			self.assertEqual(b'foo', f.read())
+		with plugin.open_file('assets/map.bin') as f:
+			self.assertEqual(asset[:10], f.read(10))
+			self.assertEqual(asset[10:], f.read())
+
+		# the file can be replaced at any time, since no file handle is occupied
+		self.create_packed_plugin('plugin.mcdr', 'my_plugin', files={'assets/foo.txt': b'bar'})
+		os.utime(self.plugin_directory / 'plugin.mcdr', ns=(0, 0))
+		with self.assertRaises(OSError):
+			plugin.open_file('assets/foo.txt').read()
+		plugin.release_file_occupation()
+		with plugin.open_file('assets/foo.txt') as f:
+			self.assertEqual(b'bar', f.read())
+
+	def test_3_packed_plugin_file_changed(self):
+		self.create_packed_plugin('plugin.mcdr', 'my_plugin')
+		manager = self.create_manager()
+		self.load_new_plugins(manager)
+		plugin = manager.get_regular_plugin_from_id('my_plugin')
+		file_path = self.plugin_directory / 'plugin.mcdr'
+		self.assertFalse(plugin.file_changed())
+
+		# touched only
+		os.utime(file_path, ns=(0, 0))
+		self.assertFalse(plugin.file_changed())
+
+		self.create_packed_plugin('plugin.mcdr', 'my_plugin', files={'foo.txt': b'foo'})
+		self.assertTrue(plugin.file_changed())
+		file_path.unlink()
+		self.assertTrue(plugin.file_changed())
+
+	def test_4_directory_plugin_file_changed(self):
+		plugin_root = self.plugin_directory / 'my_plugin'
+		(plugin_root / 'my_plugin').mkdir(parents=True)
+		(plugin_root / 'mcdreforged.plugin.json').write_text(json.dumps({'id': 'my_plugin', 'version': '1.0.0'}))
+		(plugin_root / 'my_plugin' / '__init__.py').write_text('')
+
+		linked_target = Path(self.temp_dir.name) / 'linked_plugin'
+		(linked_target / 'linked_plugin').mkdir(parents=True)
+		(linked_target / 'mcdreforged.plugin.json').write_text(json.dumps({'id': 'linked_plugin', 'version': '1.0.0'}))
+		(linked_target / 'linked_plugin' / '__init__.py').write_text('')
+		(self.plugin_directory / 'linked').mkdir()
+		link_file = self.plugin_directory / 'linked' / 'mcdreforged.linked_directory_plugin.json'
+		link_file.write_text(json.dumps({'target': str(linked_target)}))
+
+		manager = self.create_manager()
+		self.assertEqual(2, len(self.load_new_plugins(manager).success_list))
+		plugin = manager.get_regular_plugin_from_id('my_plugin')
+		linked_plugin = manager.get_regular_plugin_from_id('linked_plugin')
+		self.assertIsInstance(plugin, DirectoryPlugin)
+		self.assertIsInstance(linked_plugin, LinkedDirectoryPlugin)
+		self.assertFalse(plugin.file_changed())
+		self.assertFalse(linked_plugin.file_changed())
+
+		# ignored files
+		(plugin_root / 'my_plugin' / '__pycache__').mkdir()
+		(plugin_root / 'my_plugin' / '__pycache__' / '__init__.cpython-311.pyc').write_bytes(b'')
+		(plugin_root / '.git').mkdir()
+		self.assertFalse(plugin.file_changed())
+
+		def assert_changed_and_reload(plg: AbstractPlugin):
+			self.assertTrue(plg.file_changed())
+			plg.unload()
+			plg.reload()
+			self.assertFalse(plg.file_changed())
+
+		# file added / modified / removed
+		(plugin_root / 'my_plugin' / 'lib.py').write_text('')
+		assert_changed_and_reload(plugin)
+		(plugin_root / 'my_plugin' / 'lib.py').write_text('x = 1')
+		assert_changed_and_reload(plugin)
+		os.utime(plugin_root / 'my_plugin' / 'lib.py', ns=(0, 0))
+		assert_changed_and_reload(plugin)
+		(plugin_root / 'my_plugin' / 'lib.py').unlink()
+		assert_changed_and_reload(plugin)
+		self.assertFalse(linked_plugin.file_changed())
+
+		(linked_target / 'lang').mkdir()
+		(linked_target / 'lang' / 'en_us.yml').write_text('a: b')
+		assert_changed_and_reload(linked_plugin)
+		link_file.write_text(json.dumps({'target': str(linked_target), 'skip_package_legality_check': True}))
+		assert_changed_and_reload(linked_plugin)
+		self.assertFalse(plugin.file_changed())
+
+	def test_5_packed_plugin_file_handle(self):
+		asset = os.urandom(1024 * 1024)
+		self.create_packed_plugin('plugin.mcdr', 'my_plugin', files={'assets/map.bin': asset})
+		manager = self.create_manager()
+		self.assertEqual(1, len(self.load_new_plugins(manager).success_list))
+		plugin = manager.get_regular_plugin_from_id('my_plugin')
+		plugin.list_directory('assets')
+
+		handles = []
+
+		def open_wrapper(*args, **kwargs):
+			handles.append(open(*args, **kwargs))
+			return handles[-1]
+
+		# one file handle is used for all reads of an opened member, and it's released on close
+		with mock.patch('mcdreforged.plugin.type.packed_plugin.open', side_effect=open_wrapper, create=True):
+			with plugin.open_file('assets/map.bin') as f:
+				self.assertEqual(asset, b''.join(iter(lambda: f.read(1024), b'')))
+				self.assertEqual(1, len(handles))
+				self.assertFalse(handles[0].closed)
+			self.assertTrue(handles[0].closed)
+
+			f = plugin.open_file('assets/map.bin')
+			self.assertEqual(asset[:10], f.read(10))
+			self.assertFalse(handles[-1].closed)
+			plugin.release_file_occupation()
+			self.assertTrue(all(handle.closed for handle in handles))
+			f.close()
+
+
+if __name__ == '__main__':
+	unittest.main()
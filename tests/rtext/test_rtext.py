@@ -1,8 +1,11 @@
+import json
 import unittest
+import uuid
 
 from colorama import Fore, Style
 
 from mcdreforged.api.rtext import *
+from mcdreforged.utils.exception import IllegalStateError
 
 
 class RTextComponentTestCase(unittest.TestCase):
@@ -51,6 +54,49 @@ class RTextComponentTestCase(unittest.TestCase):
 		])
 		self.assertEqual(s, text.set_color(RColor.blue).set_styles(RStyle.italic).to_legacy_text())
 
+	def test_3_freeze(self):
+		hover_text = RText('hover', RColor.gold)
+		text = RTextList('foo', RText('bar', RColor.yellow).h(hover_text), RTextTranslation('baz').arg(RText('qux')))
+		self.assertFalse(text.is_frozen())
+		json_strs = {fmt: text.to_json_str(json_format=fmt) for fmt in RTextJsonFormat}
+
+		self.assertIs(text, text.freeze())
+		self.assertTrue(text.is_frozen())
+		self.assertTrue(hover_text.is_frozen())
+		for fmt in RTextJsonFormat:
+			self.assertEqual(json_strs[fmt], text.to_json_str(json_format=fmt))
+			self.assertIs(text.to_json_str(json_format=fmt), text.to_json_str(json_format=fmt))
+		self.assertEqual(json_strs[RTextJsonFormat.default()], text.to_json_str())
+
+		self.assertRaises(IllegalStateError, text.set_color, RColor.red)
+		self.assertRaises(IllegalStateError, text.append, 'x')
+		self.assertRaises(IllegalStateError, hover_text.set_styles, RStyle.bold)
+		self.assertRaises(IllegalStateError, text.children[1].c, RClickAction.run_command, '/help')
+		self.assertRaises(IllegalStateError, text.children[2].arg, 'x')
+
+		copied = text.copy()
+		self.assertFalse(copied.is_frozen())
+		self.assertEqual(text, copied)
+		copied.set_color(RColor.red)
+		self.assertNotEqual(text.to_json_str(), copied.to_json_str())
+
+	def test_4_to_json_str(self):
+		def assert_json_str(text: RTextBase):
+			for fmt in RTextJsonFormat:
+				expected = json.dumps(text.to_json_object(json_format=fmt), ensure_ascii=False, separators=(',', ':'))
+				self.assertEqual(expected, text.to_json_str(json_format=fmt))
+
+		assert_json_str(RText('foo'))
+		assert_json_str(RText('"quoted"\n\\ \u00a7 中文 \U0001F600', RColor.red, [RStyle.bold, RStyle.italic]))
+		assert_json_str(RText('foo', RColorRGB.from_rgb(1, 2, 3)).c(RClickAction.run_command, '/say "hi"').h('hover', RText('bar', RColor.blue)))
+		assert_json_str(RText('foo').set_hover_event(RHoverEntity(id='minecraft:creeper', uuid=uuid.UUID(int=123), name=RText('name'))))
+		assert_json_str(RTextList())
+		assert_json_str(RTextList('a', RText('b', RColor.gold), RTextList('c', 'd').set_color(RColor.red)).set_styles(RStyle.underlined))
+		assert_json_str(RTextTranslation('chat.type.text').arg('foo', 1, None, 2.5, RText('bar').h(RTextList('x'))))
+		assert_json_str(RTextTranslation('item.unknown', color=None).fallback('??'))
+		assert_json_str(RTextTranslation('item.unknown').c(RClickAction.copy_to_clipboard, 'foo').fallback('??'))
+		assert_json_str(RTextList(RTextMCDRTranslation('foo.bar'), 'baz').h(RTextMCDRTranslation('foo.baz')))
+
 
 if __name__ == '__main__':
 	unittest.main()
\ No newline at end of file
@@ -1,13 +1,19 @@
+import gc
+import inspect
+import threading
 import unittest
+import weakref
 from abc import ABC
 from enum import Enum
 from typing import Type, Any, TypeVar, Set
+from unittest import mock
 
 from typing_extensions import override
 
 from mcdreforged.api.command import *
 from mcdreforged.api.types import CommandSource
 from mcdreforged.command.builder.callback import CallbackError, DirectCallbackInvoker
+from mcdreforged.command.builder.common import CommandSuggestionCache
 from mcdreforged.command.builder.nodes.special import CountingLiteral
 from mcdreforged.utils.types.message import MessageText
 
@@ -453,6 +459,149 @@ class CommandTreeTestCase(CommandTestCase):
 		self.assertRaises(UnknownCommand, self.run_command, root, 'a')
 		self.run_command_and_check_hit(root, 'a b', True)
 
+	def test_19_compiled_dispatch(self):
+		root = Literal('test').runs(self.callback_dummy)
+		root.then(CountingLiteral('loop', 'cnt').redirects(root))
+		root._compile()  # redirect loop should be fine
+
+		self.run_command_and_check_hit(root, 'test loop loop', False)
+		self.assertRaises(UnknownArgument, self.run_command, root, 'test foo')
+		self.assertEqual(['loop'], [s.suggest_input for s in root._entry_generate_suggestions(_TestCommandSource(), 'test x')])
+
+		# the dispatch table follows the tree modification
+		root.then(Literal('foo').runs(self.callback_hit))
+		self.run_command_and_check_hit(root, 'test foo', True)
+		self.run_command_and_check_hit(root, 'test loop foo', True)
+		self.assertEqual({'loop', 'foo'}, {s.suggest_input for s in root._entry_generate_suggestions(_TestCommandSource(), 'test x')})
+
+	def test_20_context_isolation(self):
+		def polluting_requirement(src, ctx: dict):
+			ctx['polluted'] = True
+			ctx['a'] = -1
+			return True
+
+		def callback(src, ctx: dict):
+			self.result = dict(ctx)
+
+		root = Literal('test').requires(polluting_requirement).then(
+			Integer('a').requires(polluting_requirement).precondition(polluting_requirement).then(
+				Literal('b').requires(polluting_requirement).runs(callback)
+			)
+		)
+		self.run_command_and_check_result(root, 'test 1 b', {'a': 1})
+
+	def test_21_suggestion_cache(self):
+		calls = []
+
+		def suggest(src, ctx: dict):
+			calls.append(dict(ctx))
+			return ['x{}'.format(ctx['a']), 'y']
+
+		root = Literal('test').then(Integer('a').then(Text('b').suggests(suggest)))
+		cache = CommandSuggestionCache(ttl=60)
+
+		def get_suggestions(command: str):
+			return {s.suggest_input for s in root._entry_generate_suggestions(_TestCommandSource(), command, suggestion_cache=cache)}
+
+		self.assertEqual({'x1', 'y'}, get_suggestions('test 1 '))
+		self.assertEqual({'x1', 'y'}, get_suggestions('test 1 '))
+		self.assertEqual([{'a': 1}], calls)
+
+		# the parsed values are a part of the cache key
+		self.assertEqual({'x1', 'y'}, get_suggestions('test 1 f'))
+		self.assertEqual({'x1', 'y'}, get_suggestions('test 1 f'))
+		self.assertEqual({'x2', 'y'}, get_suggestions('test 2 '))
+		self.assertEqual([{'a': 1}, {'a': 1, 'b': 'f'}, {'a': 2}], calls)
+
+		cache.clear()
+		self.assertEqual({'x1', 'y'}, get_suggestions('test 1 '))
+		self.assertEqual(4, len(calls))
+
+	def test_22_pure_requirement(self):
+		calls = []
+
+		def permission_check(src) -> bool:
+			calls.append('permission')
+			return True
+
+		def range_check(src, ctx: dict) -> bool:
+			calls.append('range')
+			return ctx.get('a', 0) < 10
+
+		root = Literal('test').requires(permission_check, pure=True).requires(range_check, pure=True).then(
+			Integer('a').requires(permission_check, pure=True).requires(range_check, pure=True).then(
+				Literal('b').requires(permission_check, pure=True).requires(range_check, pure=True).runs(self.callback_hit)
+			)
+		)
+		self.run_command_and_check_hit(root, 'test 1 b', True)
+		self.assertEqual(1, calls.count('permission'))
+		self.assertEqual(2, calls.count('range'))  # 1 for {}, 1 for {'a': 1}
+
+		calls.clear()
+		self.run_command_and_check_hit(root, 'test 1 b', True)
+		self.assertEqual(1, calls.count('permission'))  # not memoized across command executions
+
+		calls.clear()
+		root = Literal('test').requires(permission_check).then(Literal('b').requires(permission_check).runs(self.callback_hit))
+		self.run_command_and_check_hit(root, 'test b', True)
+		self.assertEqual(2, calls.count('permission'))
+
+	def test_23_permission_level_cache(self):
+		class CountingCommandSource(_TestCommandSource):
+			query_count = 0
+
+			@override
+			def get_permission_level(self) -> int:
+				self.query_count += 1
+				return 2
+
+		source = CountingCommandSource()
+		self.assertTrue(source.has_permission(2))
+		self.assertFalse(source.has_permission_higher_than(2))
+		self.assertEqual(2, source.query_count)
+
+		with source._permission_level_cache():
+			with source._permission_level_cache():
+				self.assertTrue(source.has_permission(1))
+			self.assertFalse(source.has_permission(3))
+			self.assertEqual(3, source.query_count)
+		self.assertTrue(source.has_permission(2))
+		self.assertEqual(4, source.query_count)
+
+		# the cache is not shared with other threads using the same source
+		with source._permission_level_cache():
+			self.assertTrue(source.has_permission(2))
+			thread = threading.Thread(target=source.has_permission, args=(2,))
+			thread.start()
+			thread.join()
+			self.assertTrue(source.has_permission(2))
+			self.assertEqual(6, source.query_count)
+
+		self.assertIs(Requirements.has_permission(2), Requirements.has_permission(2))
+
+	def test_24_callback_spec(self):
+		inspected = []
+		real_getfullargspec = inspect.getfullargspec
+
+		def getfullargspec(func):
+			inspected.append(func)
+			return real_getfullargspec(func)
+
+		def requirement(src):
+			return True
+
+		root = Literal('test').requires(requirement).runs(self.callback_hit)
+		with mock.patch.object(inspect, 'getfullargspec', getfullargspec):
+			for _ in range(3):
+				self.run_command_and_check_hit(root, 'test', True)
+		self.assertEqual(1, inspected.count(requirement))  # inspected once, and stored in the node
+
+		# the callback is not kept alive by any global cache after the node is gone
+		requirement_ref = weakref.ref(requirement)
+		del root, requirement, inspected
+		gc.collect()
+		self.assertIsNone(requirement_ref())
+
 
 class SimpleCommandBuilderTestCase(CommandTestCase):
 	def test_1_basic(self):
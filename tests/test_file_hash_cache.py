@@ -0,0 +1,84 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from mcdreforged.utils import file_utils
+from mcdreforged.utils.file_hash_cache import FileHashCache, FileFingerprint
+
+
+class FileHashCacheTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.temp_path = Path(self.temp_dir.name)
+		self.cache_file_path = self.temp_path / 'file_hash_cache.json'
+		self.file_path = self.temp_path / 'plugin.mcdr'
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	def write_file(self, content: bytes, mtime_ns: int = 10 ** 18):
+		self.file_path.write_bytes(content)
+		os.utime(self.file_path, ns=(mtime_ns, mtime_ns))
+
+	def assert_hash(self, cache: FileHashCache, content: bytes, hashed: bool):
+		with mock.patch.object(file_utils, 'calc_file_sha256', wraps=file_utils.calc_file_sha256) as calc_func:
+			self.assertEqual(hashlib.sha256(content).hexdigest(), cache.get_sha256(self.file_path))
+		self.assertEqual(hashed, calc_func.called)
+
+	def test_1_invalidation(self):
+		cache = FileHashCache(self.cache_file_path)
+		self.write_file(b'foo')
+		self.assert_hash(cache, b'foo', True)
+		self.assert_hash(cache, b'foo', False)
+
+		# size changed
+		self.write_file(b'foobar')
+		self.assert_hash(cache, b'foobar', True)
+		self.assert_hash(cache, b'foobar', False)
+
+		# mtime changed
+		self.write_file(b'barfoo', mtime_ns=2 * 10 ** 18)
+		self.assert_hash(cache, b'barfoo', True)
+
+		# inode changed, with the same size and mtime
+		old_fingerprint = FileFingerprint.of(self.file_path)
+		temp_file_path = self.temp_path / 'new_file'
+		temp_file_path.write_bytes(b'bazfoo')
+		os.replace(temp_file_path, self.file_path)
+		os.utime(self.file_path, ns=(2 * 10 ** 18, 2 * 10 ** 18))
+		new_fingerprint = FileFingerprint.of(self.file_path)
+		if new_fingerprint.inode != old_fingerprint.inode:
+			self.assert_hash(cache, b'bazfoo', True)
+
+	def test_2_persistence(self):
+		cache = FileHashCache(self.cache_file_path)
+		self.write_file(b'foo')
+		self.assert_hash(cache, b'foo', True)
+		cache.save()
+		self.assertEqual([str(self.file_path.absolute())], list(json.loads(self.cache_file_path.read_text('utf8')).keys()))
+
+		self.assert_hash(FileHashCache(self.cache_file_path), b'foo', False)
+
+		# entries of removed files are dropped
+		self.file_path.unlink()
+		other_file_path = self.temp_path / 'other.mcdr'
+		other_file_path.write_bytes(b'bar')
+		cache = FileHashCache(self.cache_file_path)
+		cache.get_sha256(other_file_path)
+		cache.save()
+		self.assertEqual([str(other_file_path.absolute())], list(json.loads(self.cache_file_path.read_text('utf8')).keys()))
+
+		# nothing is written if the directory does not exist
+		cache = FileHashCache(self.temp_path / 'not_exists' / 'file_hash_cache.json')
+		self.write_file(b'foo')
+		cache.get_sha256(self.file_path)
+		cache.save()
+		self.assertFalse((self.temp_path / 'not_exists').exists())
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import Set
+
+from mcdreforged.utils.file_watcher import FileWatcher, InotifyFileWatcher, PollingFileWatcher
+
+
+class FileWatcherTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.root = Path(self.temp_dir.name).absolute() / 'plugins'
+		(self.root / 'my_plugin' / 'my_plugin').mkdir(parents=True)
+		(self.root / 'my_plugin' / 'my_plugin' / '__init__.py').write_text('')
+		(self.root / 'solo.py').write_text('')
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	@staticmethod
+	def collect_changes(watcher: FileWatcher, duration: float = 0.15) -> Set[Path]:
+		changes = set()
+		end_time = time.monotonic() + duration
+		while (timeout := end_time - time.monotonic()) > 0:
+			changes.update(watcher.poll(timeout))
+		return changes
+
+	def check_watcher(self, watcher: FileWatcher):
+		try:
+			watcher.set_roots([self.root])
+			self.assertEqual(set(), self.collect_changes(watcher))
+
+			(self.root / 'solo.py').write_text('x = 1')
+			self.assertIn(self.root / 'solo.py', self.collect_changes(watcher))
+
+			# nested file
+			(self.root / 'my_plugin' / 'my_plugin' / '__init__.py').write_text('x = 1')
+			self.assertIn(self.root / 'my_plugin' / 'my_plugin' / '__init__.py', self.collect_changes(watcher))
+
+			# ignored files
+			(self.root / 'my_plugin' / 'my_plugin' / '__pycache__').mkdir()
+			(self.root / 'my_plugin' / 'my_plugin' / '__pycache__' / '__init__.cpython-311.pyc').write_bytes(b'')
+			(self.root / '.hidden').write_text('')
+			self.assertEqual(set(), self.collect_changes(watcher))
+
+			# new directory, and files inside it
+			(self.root / 'my_plugin' / 'lang').mkdir()
+			(self.root / 'my_plugin' / 'lang' / 'en_us.yml').write_text('')
+			self.assertTrue(self.collect_changes(watcher) & {self.root / 'my_plugin' / 'lang', self.root / 'my_plugin' / 'lang' / 'en_us.yml'})
+			(self.root / 'my_plugin' / 'lang' / 'en_us.yml').write_text('a: b')
+			self.assertIn(self.root / 'my_plugin' / 'lang' / 'en_us.yml', self.collect_changes(watcher))
+
+			os.remove(self.root / 'solo.py')
+			self.assertIn(self.root / 'solo.py', self.collect_changes(watcher))
+
+			# not watched anymore
+			watcher.set_roots([])
+			(self.root / 'another.py').write_text('')
+			self.assertEqual(set(), self.collect_changes(watcher))
+		finally:
+			watcher.close()
+
+	@unittest.skipUnless(InotifyFileWatcher.is_supported(), 'inotify is not supported')
+	def test_1_inotify(self):
+		self.check_watcher(InotifyFileWatcher())
+
+	def test_2_polling(self):
+		self.check_watcher(PollingFileWatcher(0.05))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,64 @@
+import re
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import Set
+
+
+class ImportTimeTestCase(unittest.TestCase):
+	"""
+	Make sure the light entries don't import the heavy modules, checked with ``python -X importtime``
+
+	Timing numbers are too noisy to be asserted, see tests/benchmark/bench_import_time.py for them
+	"""
+	HEAVY_MODULES = [
+		'mcdreforged.api.all',
+		'mcdreforged.mcdr_server',
+		'mcdreforged.plugin.installer.dependency_resolver',
+		'prompt_toolkit',
+		'psutil',
+		'requests',
+		'resolvelib',
+		'ruamel.yaml',
+	]
+
+	@staticmethod
+	def get_imported_modules(code: str) -> Set[str]:
+		proc = subprocess.run(
+			[sys.executable, '-X', 'importtime', '-c', code],
+			cwd=Path(__file__).absolute().parent.parent, capture_output=True, text=True,
+		)
+		if proc.returncode != 0:
+			raise AssertionError('Failed to run {!r}: {}'.format(code, proc.stderr))
+		return {m.group(1) for m in re.finditer(r'^import time:.*\|\s*(\S+)$', proc.stderr, re.MULTILINE)}
+
+	def assert_not_imported(self, code: str, modules: Set[str]):
+		imported = self.get_imported_modules(code)
+		for module in modules:
+			self.assertNotIn(module, imported, 'module {!r} should not be imported by {!r}'.format(module, code))
+
+	def test_1_package(self):
+		self.assert_not_imported('import mcdreforged', set(self.HEAVY_MODULES))
+		self.assert_not_imported('from mcdreforged import mcdr_entrypoint', set(self.HEAVY_MODULES))
+
+		# the API components are still importable from the package
+		imported = self.get_imported_modules('from mcdreforged import RText, PluginServerInterface; import mcdreforged; assert "RText" in mcdreforged.__all__')
+		self.assertIn('mcdreforged.api.all', imported)
+
+	def test_2_cli(self):
+		self.assert_not_imported('import mcdreforged.cli.cli_entry', set(self.HEAVY_MODULES))
+		self.assert_not_imported('import mcdreforged.cli.cmd_pack', set(self.HEAVY_MODULES))
+
+	def test_3_server(self):
+		# optional subsystems are imported on first use
+		self.assert_not_imported('import mcdreforged.mcdr_server', {
+			'mcdreforged.plugin.builtin.mcdr.commands.pim_internal.handler_install',
+			'mcdreforged.plugin.installer.dependency_resolver',
+			'requests',
+			'resolvelib',
+		})
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,175 @@
+import queue
+import unittest
+from typing import List, Any, Tuple
+from unittest import mock
+
+from mcdreforged.constants import core_constant
+from mcdreforged.executor.task_executor_queue import TaskQueue, TaskQueueItem, TaskPriority
+from mcdreforged.info_reactor.info import Info, InfoSource
+from mcdreforged.info_reactor.info_reactor_manager import InfoReactorManager
+from mcdreforged.logging.logger import MCDReforgedLogger
+from mcdreforged.mcdr_config import MCDReforgedConfig
+from mcdreforged.minecraft.rtext.text import RText
+from mcdreforged.plugin.builtin.mcdr.commands.status_command import StatusCommand
+from mcdreforged.plugin.plugin_event import MCDRPluginEvents
+
+
+class _TestTranslator:
+	@staticmethod
+	def tr(key: str, *args, **kwargs) -> str:
+		return key
+
+
+class _TestTaskExecutor:
+	def __init__(self):
+		self.task_queue = TaskQueue()
+
+	def submit(self, func, *, priority: TaskPriority, raise_if_full: bool = False, need_future: bool = True, plugin=None):
+		self.task_queue.put(TaskQueueItem(func, priority, None, None), block=not raise_if_full)
+
+	def get_queue_sizes(self):
+		return self.task_queue.queue_sizes()
+
+	def run_all(self):
+		while True:
+			try:
+				item = self.task_queue.get(block=False)
+			except queue.Empty:
+				break
+			item.func()
+
+
+class _TestPluginManager:
+	class DispatchEventPolicy:
+		ensure_on_thread = object()
+
+	def __init__(self, records: List[Tuple[str, Any]]):
+		self.records = records
+
+	def dispatch_event(self, event, args, *, dispatch_policy=None):
+		self.records.append((event.id, args[0].content))
+
+
+class _TestCommandManager:
+	def __init__(self, records: List[Tuple[str, Any]]):
+		self.records = records
+
+	def execute_command(self, command: str, source):
+		self.records.append(('command', command))
+
+
+class _TestMCDRServer:
+	def __init__(self):
+		self.logger = MCDReforgedLogger()
+		self.config = MCDReforgedConfig.get_default()
+		self.records: List[Tuple[str, Any]] = []
+		self.task_executor = _TestTaskExecutor()
+		self.plugin_manager = _TestPluginManager(self.records)
+		self.command_manager = _TestCommandManager(self.records)
+
+	def create_internal_translator(self, prefix: str):
+		return _TestTranslator()
+
+	def add_config_changed_callback(self, callback):
+		pass
+
+	def send(self, content: str):
+		self.records.append(('send', content))
+
+
+class InfoReactorManagerTestCase(unittest.TestCase):
+	def setUp(self):
+		self.server = _TestMCDRServer()
+		# noinspection PyTypeChecker
+		self.manager = InfoReactorManager(self.server)
+		self.manager.reactors.append(self.manager.general_reactor)
+
+	@property
+	def records(self) -> List[Tuple[str, Any]]:
+		return self.server.records
+
+	@staticmethod
+	def console_info(content: str) -> Info:
+		return Info(InfoSource.CONSOLE, content, content=content)
+
+	@staticmethod
+	def server_info(content: str) -> Info:
+		return Info(InfoSource.SERVER, '[Server] ' + content, content=content)
+
+	@staticmethod
+	def player_info(content: str) -> Info:
+		return Info(InfoSource.SERVER, '<Steve> ' + content, content=content, player='Steve')
+
+	def test_1_command_before_queued_infos(self):
+		for i in range(3):
+			self.manager.put_info(self.server_info('server {}'.format(i)))
+		self.manager.put_info(self.player_info('!!cmd'))
+
+		queue_sizes = self.server.task_executor.get_queue_sizes()
+		self.assertEqual(1, queue_sizes[TaskPriority.COMMAND])
+		self.assertEqual(4, queue_sizes[TaskPriority.INFO])
+
+		self.server.task_executor.run_all()
+		self.assertEqual(('command', '!!cmd'), self.records[0])
+		self.assertEqual(
+			['server 0', 'server 1', 'server 2', '!!cmd'],
+			[content for event_id, content in self.records if event_id == MCDRPluginEvents.GENERAL_INFO.id]
+		)
+
+	def test_2_command_executed_once(self):
+		info = self.console_info('!!cmd')
+		self.manager.put_info(info)
+		self.server.task_executor.run_all()
+
+		# noinspection PyProtectedMember
+		self.assertTrue(info._is_command_executed())
+		self.assertEqual(1, self.records.count(('command', '!!cmd')))
+		self.assertIn((MCDRPluginEvents.USER_INFO.id, '!!cmd'), self.records)
+		self.assertEqual(('send', '!!cmd'), self.records[-1])
+
+		# infos without the command lane still execute the command in the general reactor
+		info = self.console_info('!!another')
+		# noinspection PyProtectedMember
+		info._attach_and_finalize(self.server)
+		self.manager.process_info(info)
+		self.assertEqual(1, self.records.count(('command', '!!another')))
+
+	def test_3_ordering(self):
+		# A later command runs before the USER_INFO handlers of an earlier info, even from the same source
+		self.manager.put_info(self.console_info('A'))
+		self.manager.put_info(self.console_info('B'))
+		self.server.task_executor.run_all()
+
+		self.assertEqual([
+			('command', 'A'),
+			('command', 'B'),
+			(MCDRPluginEvents.GENERAL_INFO.id, 'A'),
+			(MCDRPluginEvents.USER_INFO.id, 'A'),
+			('send', 'A'),
+			(MCDRPluginEvents.GENERAL_INFO.id, 'B'),
+			(MCDRPluginEvents.USER_INFO.id, 'B'),
+			('send', 'B'),
+		], self.records)
+
+	def test_4_status_queue_command_line(self):
+		for i in range(2):
+			self.manager.put_info(self.console_info('!!cmd {}'.format(i)))
+
+		mcdr_plugin = mock.Mock()
+		mcdr_plugin.tr.side_effect = lambda key, *args: RText('{} {}'.format(key, list(args)))
+		mcdr_plugin.mcdr_server.task_executor = self.server.task_executor
+		mcdr_plugin.mcdr_server.process_manager.get_pid.return_value = None
+		mcdr_plugin.server_interface.is_rcon_running.return_value = False
+		replies: List[str] = []
+		source = mock.Mock()
+		source.has_permission.return_value = True
+		source.reply.side_effect = lambda msg: replies.append(str(msg))
+		# noinspection PyTypeChecker
+		StatusCommand(mcdr_plugin).print_mcdr_status(source)
+
+		self.assertIn('mcdr_command.print_mcdr_status.extra.queue_command [2, {}]'.format(core_constant.MAX_TASK_QUEUE_SIZE_COMMAND), replies)
+		self.assertIn('mcdr_command.print_mcdr_status.extra.queue_info [2, {}]'.format(core_constant.MAX_TASK_QUEUE_SIZE_INFO), replies)
+
+
+if __name__ == '__main__':
+	unittest.main()
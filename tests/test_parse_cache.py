@@ -0,0 +1,70 @@
+import logging
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from mcdreforged.utils import parse_cache, yaml_data_storage
+from mcdreforged.utils.yaml_data_storage import YamlDataStorage, load_yaml_file, transform_yaml_to_plain
+
+
+class ParseCacheTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.temp_path = Path(self.temp_dir.name)
+		cache_directory = self.temp_path / 'cache'
+		cache_directory.mkdir()
+		self.patcher = mock.patch.object(parse_cache, 'CACHE_DIRECTORY', cache_directory / 'parse_cache')
+		self.patcher.start()
+
+	def tearDown(self):
+		self.patcher.stop()
+		self.temp_dir.cleanup()
+
+	def load(self, file_path: Path):
+		return parse_cache.load_with_cache(file_path, 'yaml', load_yaml_file, transform_yaml_to_plain)
+
+	def test_1_load_with_cache(self):
+		file_path = self.temp_path / 'test.yml'
+		file_path.write_text('a: 1  # comment\nb:\n- x\n- y: true\n', encoding='utf8')
+		data, from_cache = self.load(file_path)
+		self.assertFalse(from_cache)
+		self.assertEqual(['a'], list(data.ca.items.keys()))  # the parser result is returned
+
+		data, from_cache = self.load(file_path)
+		self.assertTrue(from_cache)
+		self.assertEqual({'a': 1, 'b': ['x', {'y': True}]}, data)
+		self.assertIs(dict, type(data))
+
+		# file changed
+		file_path.write_text('a: 2\n', encoding='utf8')
+		os.utime(file_path, ns=(0, 0))
+		data, from_cache = self.load(file_path)
+		self.assertFalse(from_cache)
+		self.assertEqual({'a': 2}, data)
+
+	def test_2_yaml_data_storage(self):
+		file_path = self.temp_path / 'permission.yml'
+		file_path.write_text('default_level: user  # the default level\nowner:\n- Steve  # the owner\nadmin:\nhelper:\nuser:\nguest:\n', encoding='utf8')
+		logger = logging.getLogger('test')
+		for _ in range(2):  # warm up the cache for both the data file and the default file
+			YamlDataStorage(logger, str(file_path), 'resources/default_permission.yml').read_config(False)
+
+		storage = YamlDataStorage(logger, str(file_path), 'resources/default_permission.yml')
+		with mock.patch.object(yaml_data_storage, 'load_yaml_file', side_effect=AssertionError('should not be parsed')):
+			self.assertFalse(storage.read_config(False))
+		self.assertEqual({'default_level': 'user', 'owner': ['Steve'], 'admin': None, 'helper': None, 'user': None, 'guest': None}, storage.to_dict())
+
+		# comments are kept on save
+		storage.merge_from_dict({'default_level': 'guest', 'owner': ['Steve', 'Alex']})
+		storage.save()
+		content = file_path.read_text(encoding='utf8')
+		self.assertIn('default_level: guest', content)
+		self.assertIn('# the default level', content)
+		self.assertIn('# the owner', content)
+		self.assertIn('- Alex', content)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,161 @@
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcdreforged.mcdr_config import MCDReforgedConfig
+from mcdreforged.permission.permission_level import PermissionLevel
+from mcdreforged.permission.permission_manager import PermissionManager
+
+
+class _TestLogger(logging.Logger):
+	def mdebug(self, *args, **kwargs):
+		pass
+
+
+class _TestTranslator:
+	def tr(self, key: str, *args, **kwargs) -> str:
+		return key
+
+
+class _TestMCDRServer:
+	def __init__(self, player_data_storage: str):
+		self.logger = _TestLogger('test')
+		self.config = MCDReforgedConfig.get_default()
+		self.config.player_data_storage = player_data_storage
+
+	def create_internal_translator(self, _prefix: str) -> _TestTranslator:
+		return _TestTranslator()
+
+
+class PermissionManagerTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.file_path = Path(self.temp_dir.name) / 'permission.yml'
+		self.file_path.write_text('default_level: user\nowner:\n- Steve\nadmin:\nhelper:\n- Alex\nuser:\n- Alex\n- Bob\nguest:\n', encoding='utf8')
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	def create_manager(self, player_data_storage: str = 'file') -> PermissionManager:
+		# noinspection PyTypeChecker
+		manager = PermissionManager(_TestMCDRServer(player_data_storage), str(self.file_path))
+		manager.load_permission_file()
+		return manager
+
+	def test_1_player_level_index(self):
+		manager = self.create_manager()
+		self.assertEqual({'Steve', 'Alex', 'Bob'}, manager.get_players())
+		self.assertEqual(PermissionLevel.OWNER, manager.get_player_permission_level('Steve'))
+		self.assertEqual(PermissionLevel.HELPER, manager.get_player_permission_level('Alex'))  # the highest level wins
+		self.assertIsNone(manager.get_player_permission_level('Carl', auto_add=False))
+
+		self.assertEqual(PermissionLevel.USER, manager.get_player_permission_level('Carl'))  # auto added
+		self.assertIn('Carl', manager.get_permission_group_list('user'))
+		manager.get_permission_group_list('user').clear()  # a copy is returned
+		self.assertIn('Carl', manager.get_permission_group_list('user'))
+
+		manager.remove_player('Alex')
+		self.assertIsNone(manager.get_player_permission_level('Alex', auto_add=False))
+		self.assertNotIn('Alex', manager.get_permission_group_list('helper'))
+		self.assertNotIn('Alex', manager.get_permission_group_list('user'))
+
+		manager.set_permission_level('Bob', PermissionLevel.from_value('admin'))
+		self.assertEqual(PermissionLevel.ADMIN, manager.get_player_permission_level('Bob'))
+		self.assertEqual({'Steve', 'Bob', 'Carl'}, manager.get_players())
+
+		# the index is kept consistent with the file on reload
+		manager.flush()
+		self.assertEqual(PermissionLevel.ADMIN, self.create_manager().get_player_permission_level('Bob', auto_add=False))
+		self.file_path.write_text('default_level: guest\nowner:\n- Dave\n', encoding='utf8')
+		manager.load_permission_file()
+		self.assertEqual({'Dave'}, manager.get_players())
+		self.assertEqual(PermissionLevel.GUEST, manager.get_player_permission_level('Steve'))
+		manager.stop()
+
+	def test_2_write_behind(self):
+		manager = self.create_manager()
+		content = self.file_path.read_text(encoding='utf8')
+		for i in range(100):
+			manager.touch_player('Player{}'.format(i))
+		self.assertEqual(content, self.file_path.read_text(encoding='utf8'))  # not saved yet
+
+		manager.stop()
+		self.assertIn('Player99', self.file_path.read_text(encoding='utf8'))
+		self.assertEqual(PermissionLevel.USER, self.create_manager().get_player_permission_level('Player42', auto_add=False))
+
+		# modifications after stopped are saved immediately
+		manager.remove_player('Player42')
+		self.assertNotIn('Player42', self.file_path.read_text(encoding='utf8'))
+
+	def test_3_sqlite_storage(self):
+		manager = self.create_manager('sqlite')
+		self.assertTrue(self.file_path.with_suffix('.db').is_file())
+
+		# migrated from the yaml file
+		self.assertEqual({'Steve', 'Alex', 'Bob'}, manager.get_players())
+		self.assertEqual(PermissionLevel.HELPER, manager.get_player_permission_level('Alex', auto_add=False))
+
+		manager.touch_player('Carl')
+		manager.set_permission_level('Bob', PermissionLevel.from_value('admin'))
+		manager.remove_player('Steve')
+		self.assertEqual(['Bob'], manager.get_permission_group_list('admin'))
+		self.assertEqual(['Carl'], manager.get_permission_group_list('user'))
+		manager.stop()
+
+		# the database is the source of truth, and the yaml file is not touched
+		self.assertIn('Steve', self.file_path.read_text(encoding='utf8'))
+		manager = self.create_manager('sqlite')
+		self.assertEqual({'Alex', 'Bob', 'Carl'}, manager.get_players())
+		self.assertEqual(PermissionLevel.ADMIN, manager.get_player_permission_level('Bob', auto_add=False))
+		manager.stop()
+
+		# migrated back into the yaml file on switching back to the file storage
+		manager = self.create_manager()
+		self.assertEqual({'Alex', 'Bob', 'Carl'}, manager.get_players())
+		self.assertEqual(['Bob'], manager.get_permission_group_list('admin'))
+		self.assertFalse(self.file_path.with_suffix('.db').exists())
+		self.assertTrue(self.file_path.with_name('permission.db.bak').is_file())
+		manager.touch_player('Dave')
+		manager.stop()
+		self.assertNotIn('Steve', self.file_path.read_text(encoding='utf8'))
+
+		# switching to sqlite again migrates from the yaml file, including modifications in the meantime
+		manager = self.create_manager('sqlite')
+		self.assertEqual({'Alex', 'Bob', 'Carl', 'Dave'}, manager.get_players())
+		manager.stop()
+
+	def test_4_reload_keeps_file_modifications(self):
+		manager = self.create_manager()
+		manager.touch_player('Carl')  # pending in memory
+
+		# the user edits the file by hand, then reloads it
+		content = 'default_level: user\nowner:\n- Dave\nadmin:\nhelper:\nuser:\nguest:\n'
+		self.file_path.write_text(content, encoding='utf8')
+		manager.load_permission_file()
+		self.assertEqual({'Dave'}, manager.get_players())
+
+		manager.stop()
+		self.assertEqual(content, self.file_path.read_text(encoding='utf8'))
+
+	def test_5_reload_keeps_pending_modifications(self):
+		manager = self.create_manager()
+		manager.set_permission_level('Bob', PermissionLevel.from_value('admin'))  # pending in memory
+		manager.touch_player('Carl')
+
+		# reloaded before the deferred save, the modifications are written first
+		manager.load_permission_file()
+		self.assertEqual(['Bob'], manager.get_permission_group_list('admin'))
+		self.assertIn('Carl', manager.get_players())
+		self.assertIn('Carl', self.file_path.read_text(encoding='utf8'))
+
+		# saved in the background, then reloaded
+		manager.touch_player('Dave')
+		manager.flush()
+		manager.load_permission_file()
+		self.assertIn('Dave', manager.get_players())
+		manager.stop()
+
+
+if __name__ == '__main__':
+	unittest.main()
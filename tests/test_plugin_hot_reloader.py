@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from mcdreforged.logging.logger import MCDReforgedLogger
+from mcdreforged.plugin.plugin_hot_reloader import PluginHotReloader, _PluginFileWatcherThread
+from mcdreforged.plugin.type.directory_plugin import LinkedDirectoryPlugin
+from mcdreforged.plugin.type.regular_plugin import RegularPlugin
+
+
+class PluginHotReloaderTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.plugin_directory = Path(self.temp_dir.name).absolute() / 'plugins'
+		self.linked_target = Path(self.temp_dir.name).absolute() / 'linked_target'
+
+		self.mcdr_server = mock.Mock()
+		self.mcdr_server.logger = MCDReforgedLogger()
+		self.mcdr_server.plugin_manager.plugin_directories = [self.plugin_directory]
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	def create_plugin(self, name: str, *, exists: bool = True, changed: bool = False) -> RegularPlugin:
+		plugin = mock.Mock(spec=RegularPlugin)
+		plugin.plugin_path = self.plugin_directory / name
+		plugin.file_exists.return_value = exists
+		plugin.file_changed.return_value = changed
+		return plugin
+
+	def create_linked_plugin(self) -> LinkedDirectoryPlugin:
+		plugin = mock.Mock(spec=LinkedDirectoryPlugin)
+		plugin.plugin_path = self.plugin_directory / 'linked'
+		plugin.target_plugin_path = self.linked_target
+		plugin.file_exists.return_value = True
+		plugin.file_changed.return_value = True
+		return plugin
+
+	def test_1_watch_roots_snapshot(self):
+		linked_plugin = self.create_linked_plugin()
+		self.mcdr_server.plugin_manager.get_regular_plugins.return_value = [self.create_plugin('foo.mcdr'), linked_plugin]
+		reloader = PluginHotReloader(self.mcdr_server)
+		# noinspection PyUnresolvedReferences
+		get_watch_roots = reloader._PluginHotReloader__get_watch_roots
+		self.assertEqual([self.plugin_directory], get_watch_roots())
+
+		# the plugin list is only accessed on plugin changes, instead of on the watcher thread
+		reloader.on_plugins_changed()
+		self.mcdr_server.plugin_manager.get_regular_plugins.reset_mock()
+		self.assertEqual([self.plugin_directory, self.linked_target], get_watch_roots())
+		self.mcdr_server.plugin_manager.get_regular_plugins.assert_not_called()
+
+		self.mcdr_server.plugin_manager.get_regular_plugins.return_value = []
+		reloader.on_plugins_changed()
+		self.assertEqual([self.plugin_directory], get_watch_roots())
+
+	def test_2_reload_changed_plugins(self):
+		changed = self.create_plugin('changed.mcdr', changed=True)
+		unchanged = self.create_plugin('unchanged.mcdr')
+		removed = self.create_plugin('removed.mcdr', exists=False)
+		linked_plugin = self.create_linked_plugin()
+		plugin_manager = self.mcdr_server.plugin_manager
+		plugin_manager.get_regular_plugins.return_value = [changed, unchanged, removed, linked_plugin]
+		# noinspection PyTypeChecker
+		thread = _PluginFileWatcherThread(self.mcdr_server, mock.Mock(), lambda: [self.plugin_directory])
+		# noinspection PyUnresolvedReferences
+		reload_changed_plugins = thread._PluginFileWatcherThread__reload_changed_plugins
+
+		reload_changed_plugins({self.plugin_directory / 'changed.mcdr', self.linked_target / 'lang' / 'en_us.yml'})
+		plugin_manager.manipulate_plugins.assert_called_once_with(reload=[changed, linked_plugin], unload=[])
+
+		# the watch roots are reported when the watcher lost events, then all plugins inside are checked
+		plugin_manager.manipulate_plugins.reset_mock()
+		reload_changed_plugins({self.plugin_directory})
+		plugin_manager.manipulate_plugins.assert_called_once_with(reload=[changed, linked_plugin], unload=[removed])
+		unchanged.file_changed.assert_called()
+
+		plugin_manager.manipulate_plugins.reset_mock()
+		reload_changed_plugins({self.plugin_directory / 'unchanged.mcdr'})
+		plugin_manager.manipulate_plugins.assert_not_called()
+
+
+if __name__ == '__main__':
+	unittest.main()
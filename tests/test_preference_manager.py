@@ -0,0 +1,182 @@
+import json
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from mcdreforged.mcdr_config import MCDReforgedConfig
+from mcdreforged.preference import preference_manager
+from mcdreforged.preference.preference_manager import PreferenceManager, PreferenceItem
+from mcdreforged.preference.preference_storage import JsonPreferenceStorageBackend
+
+
+class _TestMCDRServer:
+	def __init__(self, player_data_storage: str):
+		self.logger = logging.getLogger('test')
+		self.config = MCDReforgedConfig.get_default()
+		self.config.player_data_storage = player_data_storage
+
+	@classmethod
+	def get_language(cls) -> str:
+		return 'en_us'
+
+
+class PreferenceManagerTestCase(unittest.TestCase):
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.file_path = Path(self.temp_dir.name) / 'preferences.json'
+		self.journal_path = self.file_path.with_suffix('.journal')
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	def create_manager(self, player_data_storage: str = 'file') -> PreferenceManager:
+		with mock.patch.object(preference_manager, 'PREFERENCE_FILE_PATH', self.file_path):
+			# noinspection PyTypeChecker
+			manager = PreferenceManager(_TestMCDRServer(player_data_storage))
+		manager.load_preferences()
+		return manager
+
+	def test_1_write_behind(self):
+		manager = self.create_manager()
+		self.assertEqual({}, json.loads(self.file_path.read_text(encoding='utf8')))
+		for i in range(100):
+			manager.set_preference('Player{}'.format(i), PreferenceItem(language='zh_cn' if i % 2 == 0 else 'en_us'))
+		self.assertFalse(self.journal_path.exists())  # not saved yet
+
+		manager.flush()
+		self.assertEqual(100, len(self.journal_path.read_text(encoding='utf8').splitlines()))
+		manager.set_preference('Player0', PreferenceItem(language='zh_tw'))
+		manager.flush()
+		self.assertEqual(101, len(self.journal_path.read_text(encoding='utf8').splitlines()))
+
+		# reloading with the journal gives the identical result
+		expected = dict(manager.preferences)
+		reloaded = self.create_manager()
+		self.assertEqual(expected, reloaded.preferences)
+		reloaded.close()
+
+		# the journal is compacted on close
+		manager.close()
+		self.assertFalse(self.journal_path.exists())
+		self.assertEqual(expected, self.create_manager().preferences)
+
+	def test_2_journal_compaction(self):
+		backend = JsonPreferenceStorageBackend(self.file_path, journal=True)
+		preferences = {}
+		backend.save(preferences, [])
+		for i in range(300):
+			name = 'Player{}'.format(i % 10)
+			preferences[name] = PreferenceItem(language=str(i))
+			backend.save(preferences, [name])
+		# the journal never grows too large
+		self.assertLessEqual(len(self.journal_path.read_text(encoding='utf8').splitlines()), 256)
+
+		# an incomplete tailing entry is ignored
+		with open(self.journal_path, 'a', encoding='utf8') as file:
+			file.write('{"name":"Player0","pref')
+		self.assertEqual(preferences, JsonPreferenceStorageBackend(self.file_path, journal=True).load())
+
+		# the journal is compacted if journal is disabled
+		self.assertEqual(preferences, JsonPreferenceStorageBackend(self.file_path).load())
+		self.assertFalse(self.journal_path.exists())
+		self.assertEqual(preferences, JsonPreferenceStorageBackend(self.file_path).load())
+
+	def test_3_sqlite_storage(self):
+		manager = self.create_manager()
+		manager.set_preference('Steve', PreferenceItem(language='zh_cn'))
+		manager.close()
+
+		# migrated from the json file
+		manager = self.create_manager('sqlite')
+		self.assertEqual('zh_cn', manager.get_preferred_language('Steve'))
+		manager.set_preference('Alex', PreferenceItem(language='zh_tw'))
+		manager.close()
+		manager = self.create_manager('sqlite')
+		self.assertEqual({'Steve', 'Alex'}, set(manager.preferences.keys()))
+		manager.close()
+
+		# migrated back into the json file on switching back to the file storage
+		manager = self.create_manager()
+		self.assertEqual('zh_tw', manager.get_preferred_language('Alex'))
+		self.assertFalse(self.file_path.with_suffix('.db').exists())
+		self.assertTrue(self.file_path.with_name('preferences.db.bak').is_file())
+		manager.set_preference('Bob', PreferenceItem(language='en_us'))
+		manager.close()
+
+		# switching to sqlite again migrates from the json file, including modifications in the meantime
+		manager = self.create_manager('sqlite')
+		self.assertEqual({'Steve', 'Alex', 'Bob'}, set(manager.preferences.keys()))
+		manager.close()
+
+	def test_4_torn_journal(self):
+		backend = JsonPreferenceStorageBackend(self.file_path, journal=True)
+		preferences = {'Steve': PreferenceItem(language='zh_cn')}
+		backend.save(preferences, [])
+		backend.save(preferences, ['Steve'])
+
+		# MCDR crashed when writing an entry
+		with open(self.journal_path, 'a', encoding='utf8') as file:
+			file.write('{"name":"Alex","pref')
+
+		backend = JsonPreferenceStorageBackend(self.file_path, journal=True)
+		preferences = backend.load()
+		for name, language in [('Bob', 'zh_tw'), ('Carl', 'en_us')]:
+			preferences[name] = PreferenceItem(language=language)
+			backend.save(preferences, [name])
+		self.assertEqual({'Steve', 'Bob', 'Carl'}, set(JsonPreferenceStorageBackend(self.file_path, journal=True).load().keys()))
+
+	def test_5_retry_failed_save(self):
+		manager = self.create_manager()
+		backend: JsonPreferenceStorageBackend = getattr(manager, '_PreferenceManager__backend')
+		original_save = backend.save
+		fail_count = 1
+
+		def save(*args, **kwargs):
+			nonlocal fail_count
+			if fail_count > 0:
+				fail_count -= 1
+				raise OSError('disk full')
+			original_save(*args, **kwargs)
+
+		with mock.patch.object(backend, 'save', side_effect=save):
+			manager.set_preference('Steve', PreferenceItem(language='zh_cn'))
+			manager.flush()
+			self.assertFalse(self.journal_path.exists())
+			manager.flush()  # retried
+		self.assertIn('Steve', self.journal_path.read_text(encoding='utf8'))
+		manager.close()
+
+	def check_reset_on_corruption(self):
+		with self.assertLogs('test', level='ERROR'):
+			manager = self.create_manager()
+		self.assertEqual({}, manager.preferences)
+		self.assertEqual({}, json.loads(self.file_path.read_text(encoding='utf8')))
+		self.assertFalse(self.journal_path.exists())
+
+		# new modifications survive restarts
+		manager.set_preference('Alex', PreferenceItem(language='zh_tw'))
+		manager.flush()
+		self.assertTrue(self.journal_path.is_file())
+		reloaded = self.create_manager()
+		self.assertEqual({'Alex': PreferenceItem(language='zh_tw')}, reloaded.preferences)
+		reloaded.close()
+		manager.close()
+
+	def test_6_corrupted_json_file(self):
+		self.file_path.write_text('{corrupt', encoding='utf8')
+		self.check_reset_on_corruption()
+
+	def test_7_corrupted_journal(self):
+		self.file_path.write_text('{}', encoding='utf8')
+		self.journal_path.write_text('\n'.join([
+			json.dumps({'name': 'Steve', 'preference': {'language': 'zh_cn'}}),
+			'{corrupt',
+			json.dumps({'name': 'Bob', 'preference': {'language': 'en_us'}}),
+		]) + '\n', encoding='utf8')
+		self.check_reset_on_corruption()
+
+
+if __name__ == '__main__':
+	unittest.main()
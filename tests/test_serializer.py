@@ -1,12 +1,15 @@
+import gc
 import re
 import sys
 import unittest
 import uuid
+import weakref
 from enum import Enum, auto, IntFlag, IntEnum, Flag
 from typing import List, Dict, Union, Optional, Any, TypeVar, Generic, Type
 from typing import Literal as TLiteral
 
 from mcdreforged.api.utils import serialize, deserialize, Serializable
+from mcdreforged.utils.serializer import clear_serializer_cache
 
 _py39 = sys.version_info >= (3, 9)
 
@@ -28,6 +31,11 @@ class ConfigImpl(Serializable):
 	e: Dict[str, Point] = {}
 
 
+class TreeNode(Serializable):
+	name: str
+	children: List['TreeNode'] = []
+
+
 class MyTestCase(unittest.TestCase):
 	def test_0_simple(self):
 		for obj in (
@@ -542,6 +550,98 @@ class MyTestCase(unittest.TestCase):
 		self.assertIsInstance(cm.exception, ValueError)
 		self.assertIn('Invalid uuid'.lower(), str(cm.exception).lower())
 
+	def test_21_compiled_plan(self):
+		# typing considers these equal, but the candidate order matters
+		self.assertEqual(Union[int, float], Union[float, int])
+		self.assertIs(int, type(deserialize(1, Union[int, float])))
+		self.assertIs(float, type(deserialize(1, Union[float, int])))
+
+		# recursive class definition
+		data = {'name': 'a', 'children': [{'name': 'b', 'children': [{'name': 'c', 'children': []}]}]}
+		for _ in range(2):  # the 2nd round uses the cached plan
+			node = TreeNode.deserialize(data, error_at_missing=True)
+			self.assertEqual('c', node.children[0].children[0].name)
+			self.assertEqual(data, node.serialize())
+
+		# options are not part of the cached plan
+		class Data(Serializable):
+			a: int = 1
+			b: int = 2
+
+		missing, redundancy = [], []
+		self.assertEqual(Data(a=3), Data.deserialize({'a': 3, 'c': 4}))
+		self.assertRaises(ValueError, Data.deserialize, {'a': 3}, error_at_missing=True)
+		self.assertRaises(ValueError, Data.deserialize, {'a': 3, 'b': 4, 'c': 4}, error_at_redundancy=True)
+		Data.deserialize(
+			{'a': 3, 'c': 4},
+			missing_callback=lambda *args: missing.append(args[2]),
+			redundancy_callback=lambda *args: redundancy.append(args[2:]),
+		)
+		self.assertEqual(['b'], missing)
+		self.assertEqual([('c', 4)], redundancy)
+
+		# unhashable literal
+		self.assertEqual([2], deserialize([2], TLiteral[(1, [2])]))
+
+	def test_22_slots_mode(self):
+		class SlotsPoint(Serializable, slots=True):
+			x: float = 1.1
+			y: float = 1.2
+			tags: List[str] = []
+			name: str
+
+		class SlotsPoint3D(SlotsPoint, slots=True):
+			z: float = 0
+			y = 2.2  # overrides the default value
+
+		p = SlotsPoint(name='p')
+		self.assertFalse(hasattr(p, '__dict__'))
+		self.assertRaises(AttributeError, setattr, p, 'foo', 1)
+		self.assertRaises(KeyError, SlotsPoint, foo=1)
+		self.assertEqual({'x': 1.1, 'y': 1.2, 'tags': [], 'name': 'p'}, p.serialize())
+		self.assertEqual(p, SlotsPoint.deserialize(p.serialize()))
+		self.assertIsNot(p.tags, SlotsPoint().tags)
+		self.assertIsNot(p.tags, SlotsPoint.deserialize({}).tags)
+		self.assertFalse(hasattr(SlotsPoint(), 'name'))
+		self.assertRaises(ValueError, SlotsPoint.deserialize, {}, error_at_missing=True)
+
+		q = p.copy()
+		self.assertEqual(p, q)
+		self.assertIsNot(p.tags, q.tags)
+		q.name = 'q'
+		self.assertNotEqual(p, q)
+		p.merge_from(q)
+		self.assertEqual('q', p.name)
+
+		p3 = SlotsPoint3D.deserialize({'x': 1, 'z': 3})
+		self.assertFalse(hasattr(p3, '__dict__'))
+		self.assertEqual({'x': 1.0, 'y': 2.2, 'tags': [], 'z': 3}, p3.serialize())
+		self.assertEqual(1.2, SlotsPoint().y)
+
+		# subclass without slots mode still works
+		class DictPoint(SlotsPoint3D):
+			x = 3.3
+			w: int = 4
+
+		self.assertEqual({'x': 3.3, 'y': 2.2, 'tags': [], 'z': 0, 'w': 4}, DictPoint().serialize())
+		self.assertEqual(DictPoint(), DictPoint.deserialize(DictPoint().serialize()))
+
+	def test_23_clear_cache(self):
+		class Temp(Serializable):
+			a: int = 1
+			points: List[Point] = []
+
+		self.assertEqual({'a': 1, 'points': []}, serialize(Temp()))
+		self.assertEqual(Temp(a=2), deserialize({'a': 2, 'points': []}, Temp))
+		temp_ref = weakref.ref(Temp)
+		del Temp
+		gc.collect()
+		self.assertIsNotNone(temp_ref())  # kept alive by the caches
+
+		clear_serializer_cache()
+		gc.collect()
+		self.assertIsNone(temp_ref())
+
 
 if __name__ == '__main__':
 	unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from typing import List, Optional
+from unittest import mock
+
+from typing_extensions import override
+
+from mcdreforged.handler.impl.basic_handler import BasicHandler
+from mcdreforged.handler.impl.vanilla_handler import VanillaHandler
+from mcdreforged.handler.server_handler import ServerHandler
+from mcdreforged.info_reactor.server_information import ServerInformation
+from mcdreforged.logging.logger import MCDReforgedLogger
+from mcdreforged.minecraft.rtext.text import RTextBase
+from mcdreforged.plugin.si.server_interface import ServerInterface
+from mcdreforged.translation.translation_text import RTextMCDRTranslation
+from mcdreforged.utils.types.message import MessageText
+
+
+class _TestServerInterface(ServerInterface):
+	# a subclass, so the ServerInterface singleton is not touched
+	pass
+
+
+class _CustomMessageVanillaHandler(VanillaHandler):
+	@override
+	def get_send_message_command(self, target: str, message: MessageText, server_information: ServerInformation) -> Optional[str]:
+		return 'msg {} {}'.format(target, message) if target != 'Bob' else None
+
+
+class TellManyTestCase(unittest.TestCase):
+	LANGUAGES = {'Alice': 'en_us', 'Bob': 'zh_cn', 'Steve': 'en_us'}
+	TEXT = RTextMCDRTranslation.from_translation_dict({'en_us': 'hello', 'zh_cn': '你好'})
+
+	def create_server_interface(self, server_handler: ServerHandler) -> ServerInterface:
+		mcdr_server = mock.Mock()
+		mcdr_server.logger = MCDReforgedLogger()
+		mcdr_server.plugin_manager.get_plugin_in_current_context.return_value = None
+		mcdr_server.preference_manager.get_preferred_language.side_effect = self.LANGUAGES.__getitem__
+		mcdr_server.server_handler_manager.get_current_handler.return_value = server_handler
+		mcdr_server.server_information = ServerInformation()
+		self.mcdr_server = mcdr_server
+		return _TestServerInterface(mcdr_server)
+
+	def get_sent_texts(self) -> List[str]:
+		return [call.args[0] for call in self.mcdr_server.send.call_args_list]
+
+	@staticmethod
+	def get_expected_command(handler: ServerHandler, player: str, text: RTextBase) -> Optional[str]:
+		with RTextMCDRTranslation.language_context(TellManyTestCase.LANGUAGES[player]):
+			return handler.get_send_message_command(player, text, ServerInformation())
+
+	def test_1_batch(self):
+		handler = VanillaHandler()
+		server = self.create_server_interface(handler)
+		server.tell_many(['Alice', 'Bob', 'Steve'], self.TEXT)
+
+		# grouped by language, sent in a single batch
+		self.assertEqual(['\n'.join([
+			self.get_expected_command(handler, 'Alice', self.TEXT),
+			self.get_expected_command(handler, 'Steve', self.TEXT),
+			self.get_expected_command(handler, 'Bob', self.TEXT),
+		])], self.get_sent_texts())
+		self.assertIn('hello', self.get_sent_texts()[0].splitlines()[1])
+		self.assertIn('你好', self.get_sent_texts()[0].splitlines()[2])
+
+		# same as calling tell() for each player
+		self.mcdr_server.send.reset_mock()
+		for player in ['Alice', 'Steve', 'Bob']:
+			server.tell(player, self.TEXT)
+		self.assertEqual(self.get_sent_texts(), [self.get_expected_command(handler, player, self.TEXT) for player in ['Alice', 'Steve', 'Bob']])
+
+	def test_2_no_command(self):
+		# e.g. the basic handler, which has no message command, for console-only or rcon-only usages
+		server = self.create_server_interface(BasicHandler())
+		server.tell_many(['Alice', 'Bob'], self.TEXT)
+		server.tell_many([], self.TEXT)
+		self.mcdr_server.send.assert_not_called()
+
+		server = self.create_server_interface(VanillaHandler())
+		server.tell_many([], self.TEXT)
+		self.mcdr_server.send.assert_not_called()
+
+	def test_3_custom_single_target_command(self):
+		# the customized single-target command is respected, and None results are skipped
+		handler = _CustomMessageVanillaHandler()
+		server = self.create_server_interface(handler)
+		server.tell_many(['Alice', 'Bob', 'Steve'], 'hi')
+		self.assertEqual(['msg Alice hi\nmsg Steve hi'], self.get_sent_texts())
+
+
+if __name__ == '__main__':
+	unittest.main()
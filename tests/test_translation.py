@@ -6,9 +6,12 @@ import unittest
 from ruamel.yaml import YAML
 
 from mcdreforged.constants import core_constant
+from mcdreforged.minecraft.rtext.style import RColor
 from mcdreforged.minecraft.rtext.text import RText, RTextBase
 from mcdreforged.translation.language_fallback_handler import LanguageFallbackHandler
+from mcdreforged.translation.translation_template import TranslationTemplate
 from mcdreforged.translation.translation_manager import TranslationManager, MCDR_LANGUAGE_DIRECTORY
+from mcdreforged.translation.translation_text import RTextMCDRTranslation, clear_translation_cache, _translate_cached
 from mcdreforged.utils import file_utils
 
 
@@ -54,6 +57,92 @@ class MyTestCase(unittest.TestCase):
 		self.assertIsInstance(rtext, RTextBase)
 		self.assertEqual('A X bb Z Yzzz', rtext.to_plain_text())
 
+	def test_2_rtext_mcdr_translation_cache(self):
+		translations = {'key1': {'test_lang': 'A {0} {c}'}}
+		calls = []
+
+		def tr(key: str, *args, _mcdr_tr_language: str, **kwargs):
+			calls.append(key)
+			return translations[key][_mcdr_tr_language].format(*args, **kwargs)
+
+		def make(*args, **kwargs) -> RTextMCDRTranslation:
+			return RTextMCDRTranslation('key1', *args, **kwargs).set_translator(tr, cacheable=True)
+
+		clear_translation_cache()
+		with RTextMCDRTranslation.language_context('test_lang'):
+			self.assertEqual('A X Z', make('X', c='Z').to_plain_text())
+			self.assertEqual('A X Z', make('X', c='Z').to_plain_text())
+			self.assertEqual(1, len(calls))
+			self.assertEqual('A Y Z', make('Y', c='Z').to_plain_text())
+			self.assertEqual(2, len(calls))
+
+			# post processes do not affect the cached result
+			self.assertEqual('{"text":"A X Z","color":"red"}', make('X', c='Z').set_color(RColor.red).to_json_str())
+			self.assertEqual('{"text":"A X Z"}', make('X', c='Z').to_json_str())
+			self.assertEqual(2, len(calls))
+
+			# unhashable args
+			self.assertEqual('A X Z', make('X', c=RText('Z')).to_plain_text())
+			self.assertEqual('A X Z', make('X', c=RText('Z')).to_plain_text())
+			self.assertEqual(4, len(calls))
+
+			translations['key1']['test_lang'] = 'B {0} {c}'
+			clear_translation_cache()
+			self.assertEqual('B X Z', make('X', c='Z').to_plain_text())
+			self.assertEqual(5, len(calls))
+
+			# set_language invalidates the cache
+			self.translation_manager.set_language('test_lang')
+			self.assertEqual('B X Z', make('X', c='Z').to_plain_text())
+			self.assertEqual(6, len(calls))
+
+			# translators are not cached by default
+			self.assertEqual('B X Z', RTextMCDRTranslation('key1', 'X', c='Z').set_translator(tr).to_plain_text())
+			self.assertEqual('B X Z', RTextMCDRTranslation('key1', 'X', c='Z').set_translator(tr).to_plain_text())
+			self.assertEqual(8, len(calls))
+
+			# equal arguments with different types are cached separately
+			self.assertEqual('B 1 1', make(1, c=1).to_plain_text())
+			self.assertEqual('B True True', make(True, c=True).to_plain_text())
+			self.assertEqual('B 1.0 1.0', make(1.0, c=1.0).to_plain_text())
+			self.assertEqual('B 1 1', make(1, c=1).to_plain_text())
+			self.assertEqual(11, len(calls))
+
+			# translations from dicts are not cached, or every new closure would pin a cache entry
+			clear_translation_cache()
+			self.assertEqual('D', RTextMCDRTranslation.from_translation_dict({'test_lang': 'D'}).to_plain_text())
+			self.assertEqual(0, _translate_cached.cache_info().currsize)
+
+	def test_3_translation_template(self):
+		rtext_y, rtext_z = RText('Y', RColor.red), RText('Z', RColor.blue)
+		cases = [
+			('\nA {0} bb {c} {1}zzz\r', ('X', rtext_y), {'c': rtext_z}),
+			('{} and {}', (rtext_y, 'X'), {}),
+			('{0}{0}{{escaped}}{c!r:>5}', (rtext_y,), {'c': 'Z'}),
+			('{0:.2f} {1}', (1.2345, rtext_y), {}),
+			('{0!r} {1:>3}', (rtext_y, rtext_z), {}),  # fall back to RTextBase.format
+			('{0.__class__} {1}', ('X', rtext_y), {}),  # fall back to RTextBase.format
+			('{1[0]} {0}', (rtext_y, 'XZ'), {}),  # fall back to RTextBase.format
+			('{-1} {01}', (rtext_y, rtext_z), {'-1': 'X'}),
+			('{c}', (), {'c': rtext_z}),
+			('no args', (rtext_y,), {}),
+		]
+		for fmt, args, kwargs in cases:
+			with self.subTest(fmt=fmt):
+				template = TranslationTemplate.of(fmt)
+				self.assertEqual(RTextBase.format(fmt.strip('\n\r'), *args, **kwargs), template.format(args, kwargs))
+				plain_args = tuple(a.to_plain_text() if isinstance(a, RTextBase) else a for a in args)
+				plain_kwargs = {k: v.to_plain_text() if isinstance(v, RTextBase) else v for k, v in kwargs.items()}
+				self.assertEqual(fmt.strip('\n\r').format(*plain_args, **plain_kwargs), template.format(plain_args, plain_kwargs))
+
+		self.assertRaises(IndexError, TranslationTemplate.of('{0} {1}').format, (rtext_y,), {})
+		self.assertRaises(ValueError, TranslationTemplate.of('{0} {}').format, ('X', rtext_y), {})
+
+		# compiled templates are dropped together with cached translation results
+		self.assertGreater(TranslationTemplate.of.cache_info().currsize, 0)
+		clear_translation_cache()
+		self.assertEqual(0, TranslationTemplate.of.cache_info().currsize)
+
 
 if __name__ == '__main__':
 	unittest.main()
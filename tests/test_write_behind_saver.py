@@ -0,0 +1,67 @@
+import logging
+import threading
+import unittest
+
+from mcdreforged.executor.write_behind_saver import WriteBehindSaver
+
+
+class WriteBehindSaverTestCase(unittest.TestCase):
+	def setUp(self):
+		self.save_count = 0
+		self.fail_count = 0
+		self.saved = threading.Event()
+
+	def save(self):
+		if self.fail_count > 0:
+			self.fail_count -= 1
+			raise OSError('disk full')
+		self.save_count += 1
+		self.saved.set()
+
+	def create_saver(self, delay: float = 0.01) -> WriteBehindSaver:
+		logger = logging.getLogger('test')
+		logger.disabled = True
+		# noinspection PyTypeChecker
+		return WriteBehindSaver(logger, 'TestSaver', self.save, delay=delay, max_delay=delay)
+
+	def test_1_debounce(self):
+		saver = self.create_saver()
+		for _ in range(100):
+			saver.mark_dirty()
+		self.assertTrue(self.saved.wait(5))
+		saver.stop()
+		self.assertEqual(1, self.save_count)
+		self.assertFalse(saver.is_dirty())
+
+	def test_2_retry_failed_save(self):
+		saver = self.create_saver(delay=60)
+		self.fail_count = 1
+		saver.mark_dirty()
+		self.assertTrue(saver.flush())
+		self.assertEqual(0, self.save_count)
+		self.assertTrue(saver.is_dirty())  # still dirty, so it will be retried
+
+		saver.stop()
+		self.assertEqual(1, self.save_count)
+		self.assertFalse(saver.is_dirty())
+
+	def test_3_retry_in_background(self):
+		saver = self.create_saver()
+		self.fail_count = 2
+		saver.mark_dirty()
+		self.assertTrue(self.saved.wait(5))
+		self.assertEqual(1, self.save_count)
+		saver.stop()
+
+	def test_4_discard(self):
+		saver = self.create_saver(delay=60)
+		self.assertFalse(saver.discard())
+		saver.mark_dirty()
+		self.assertTrue(saver.discard())
+		self.assertFalse(saver.flush())
+		saver.stop()
+		self.assertEqual(0, self.save_count)
+
+
+if __name__ == '__main__':
+	unittest.main()